@@ -0,0 +1,100 @@
+from __future__ import annotations
+
+import argparse
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+MAIN = ROOT / "src" / "main.py"
+
+# Modules that --help must never load; each one means a mode dependency leaked back to module level.
+FORBIDDEN_AT_STARTUP = (
+    "pandas",
+    "numpy",
+    "yfinance",
+    "bs4",
+    "ta",
+    "requests",
+    "nautilus_trader",
+    "ai.analyzer",
+    "core.data_collector",
+    "pipelines.autostock_v2_pipeline",
+    "event_runtime.engine",
+    "nautilus_v2.bridge",
+)
+
+
+def parse_importtime(stderr: str) -> list[tuple[str, int, int]]:
+    """``(module, depth, cumulative_us)`` rows from ``python -X importtime`` output."""
+    rows: list[tuple[str, int, int]] = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "imported package" in line:
+            continue
+        try:
+            _, cumulative, name = line[len("import time:") :].split("|", 2)
+            cumulative_us = int(cumulative.strip())
+        except ValueError:
+            continue
+        name = name[1:] if name.startswith(" ") else name
+        depth = (len(name) - len(name.lstrip(" "))) // 2
+        rows.append((name.strip(), depth, cumulative_us))
+    return rows
+
+
+def measure(args: list[str]) -> dict[str, object]:
+    started = time.perf_counter()
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", str(MAIN), *args],
+        capture_output=True,
+        text=True,
+        encoding="utf-8",
+        errors="ignore",
+        check=False,
+        cwd=str(ROOT),
+    )
+    wall_ms = (time.perf_counter() - started) * 1000
+    rows = parse_importtime(proc.stderr)
+    imported = {name for name, _, _ in rows}
+    top_level = sorted(((name, us) for name, depth, us in rows if depth == 0), key=lambda item: item[1], reverse=True)
+    return {
+        "returncode": proc.returncode,
+        "wall_ms": wall_ms,
+        "import_ms": sum(us for _, us in top_level) / 1000,
+        "slowest": top_level[:10],
+        "forbidden": sorted(name for name in FORBIDDEN_AT_STARTUP if name in imported),
+    }
+
+
+def check_startup(budget_ms: float = 250.0, runs: int = 3) -> tuple[dict[str, object], list[str]]:
+    """Best of ``runs`` measurements of ``main.py --help`` and the reasons it fails the budget."""
+    results = [measure(["--help"]) for _ in range(max(1, runs))]
+    best = min(results, key=lambda item: float(item["import_ms"]))
+    failures: list[str] = []
+    if best["returncode"] != 0:
+        failures.append(f"main.py --help exited with {best['returncode']}")
+    if best["forbidden"]:
+        failures.append(f"heavy modules imported at startup: {', '.join(best['forbidden'])}")
+    if float(best["import_ms"]) > budget_ms:
+        failures.append(f"import time {best['import_ms']:.1f}ms exceeds budget {budget_ms:.0f}ms")
+    return best, failures
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Fail when `src/main.py --help` startup regresses")
+    parser.add_argument("--budget-ms", type=float, default=250.0, help="Max cumulative import time of main.py --help")
+    parser.add_argument("--runs", type=int, default=3, help="Best of N runs (first run warms the bytecode cache)")
+    args = parser.parse_args()
+
+    best, failures = check_startup(args.budget_ms, args.runs)
+    print(f"main.py --help: import {best['import_ms']:.1f}ms, wall {best['wall_ms']:.1f}ms (budget {args.budget_ms:.0f}ms)")
+    for name, us in best["slowest"]:
+        print(f"  {us / 1000:8.1f}ms  {name}")
+    for failure in failures:
+        print(f"FAIL: {failure}")
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
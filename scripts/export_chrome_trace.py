@@ -0,0 +1,34 @@
+from __future__ import annotations
+
+import argparse
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT / "src"))
+
+from core.tracing import export_chrome_trace, load_spans, trace_path
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Convert an AUTOSTOCK_TRACE_PATH span file to Chrome trace-event JSON")
+    parser.add_argument("source", nargs="?", default=None, help="Span JSONL file (default: AUTOSTOCK_TRACE_PATH)")
+    parser.add_argument("--output", default=None, help="Output path (default: <source>.chrome.json)")
+    parser.add_argument("--trace-id", default="", help="Keep a single trace (timingsSec.traceId)")
+    parser.add_argument("--last", action="store_true", help="Keep only the most recently started trace")
+    args = parser.parse_args()
+
+    source = args.source or trace_path()
+    if source is None:
+        parser.error("pass a span file or set AUTOSTOCK_TRACE_PATH")
+    trace_id = args.trace_id
+    if args.last and not trace_id:
+        roots = [row for row in load_spans(source) if not row.get("parent_id")]
+        if roots:
+            trace_id = str(max(roots, key=lambda row: int(row.get("start_ns") or 0)).get("trace_id") or "")
+    out_path = export_chrome_trace(source, args.output, trace_id=trace_id)
+    print(f"chrome_trace: {out_path} (open in chrome://tracing or https://ui.perfetto.dev)")
+
+
+if __name__ == "__main__":
+    main()
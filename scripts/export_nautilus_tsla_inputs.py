@@ -10,7 +10,7 @@ sys.path.insert(0, str(ROOT / "src"))
 
 from event_profile import load_event_profile
 from core.stock_data import get_stock_data
-from nautilus_v2.bridge import export_symbol_bundle
+from nautilus_v2.bridge import export_profile_bundle
 from pipelines.autostock_v2_pipeline import run_autostock_v2
 
 OUTPUT_ROOT = ROOT / "data" / "nautilus_v2"
@@ -20,29 +20,35 @@ def main() -> None:
     print(f"[{datetime.now()}] export nautilus tsla inputs started...")
     profile = load_event_profile()
     symbol = str(profile.get("primary_symbol", "TSLA")).upper()
+    symbols = [str(item).upper() for item in profile.get("symbols", [symbol]) if str(item).strip()] or [symbol]
+    nautilus = profile.get("nautilus", {}) if isinstance(profile.get("nautilus"), dict) else {}
     rss_raw = str(os.getenv("AI_V2_RSS_URLS", "") or "")
     rss_urls = [part.strip() for part in rss_raw.replace("|", ",").split(",") if part.strip()] or list(profile.get("rss_urls", []))
     result = run_autostock_v2(
         profile=profile,
-        watchlist_override=list(profile.get("symbols", [symbol])),
+        watchlist_override=list(symbols),
         event_feed_path=(str(os.getenv("AI_V2_EVENT_FILE", "") or "").strip() or profile.get("event_file") or None),
         rss_urls=rss_urls or None,
     )
     payload = result.get("payload", {}) if isinstance(result, dict) else {}
-    bars_df = get_stock_data(symbol, period=str(os.getenv("AI_V2_TSLA_BARS_PERIOD", "15mo") or "15mo"), auto_adjust=False)
+    period = str(os.getenv("AI_V2_TSLA_BARS_PERIOD", "15mo") or "15mo")
+    bars_by_symbol = {item: get_stock_data(item, period=period, auto_adjust=False) for item in symbols}
     date_tag = datetime.now().strftime("%Y-%m-%d")
     output_dir = OUTPUT_ROOT / str(profile.get("name", symbol.lower())) / date_tag
-    paths = export_symbol_bundle(
+    bundle = export_profile_bundle(
         payload=payload if isinstance(payload, dict) else {},
-        bars_df=bars_df,
+        bars_by_symbol=bars_by_symbol,
         output_dir=output_dir,
-        symbol=symbol,
+        venue=str(nautilus.get("venue") or "XNAS"),
+        primary_symbol=symbol,
     )
     print(f"profile: {profile.get('name')}")
     print(f"autostock_v2_json: {result.get('report_path')}")
     print(f"autostock_v2_md: {result.get('md_path')}")
-    for key, value in paths.items():
-        print(f"{key}: {value}")
+    print(f"manifest: {bundle['manifest']}")
+    for entry in bundle["instruments"]:
+        for key, name in entry["files"].items():
+            print(f"{entry['symbol']} {key}: {output_dir / name}")
 
 
 if __name__ == "__main__":
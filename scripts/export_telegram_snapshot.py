@@ -86,7 +86,7 @@ def _build_runtime_snapshot() -> dict[str, Any]:
         "state": {
             "lastRunAt": _s(state.get("last_run_at")),
             "lastAction": _s(((state.get("last_actions") or {}).get(_s(top.get("symbol")), ""))),
-            "seenEventCount": len(state.get("seen_event_keys") or []),
+            "seenEventCount": int(state.get("seen_event_count") or len(state.get("seen_event_keys") or [])),
         },
     }
 
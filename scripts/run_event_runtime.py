@@ -27,7 +27,8 @@ def main() -> None:
     print(f"[{datetime.now()}] event runtime started...")
     profile = str(os.getenv("AI_EVENT_PROFILE", "tsla") or "tsla").strip() or "tsla"
     once = str(os.getenv("AI_EVENT_RUNTIME_ONCE", "1")).strip().lower() in {"1", "true", "yes", "on"}
-    interval = int(float(str(os.getenv("AI_EVENT_RUNTIME_INTERVAL_SECONDS", "60")).strip() or "60"))
+    interval_raw = str(os.getenv("AI_EVENT_RUNTIME_INTERVAL_SECONDS", "")).strip()
+    interval = int(float(interval_raw)) if interval_raw else None
     max_cycles_raw = str(os.getenv("AI_EVENT_RUNTIME_MAX_CYCLES", "")).strip()
     max_cycles = int(max_cycles_raw) if max_cycles_raw else None
 
@@ -0,0 +1,117 @@
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import sys
+from pathlib import Path
+from typing import Any
+
+ROOT = Path(__file__).resolve().parents[1]
+
+
+def _load_recording(path: Path) -> list[dict[str, Any]]:
+    rows: list[dict[str, Any]] = []
+    for line in path.read_text(encoding="utf-8").splitlines():
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            row = json.loads(line)
+        except Exception:
+            continue
+        if isinstance(row, list):
+            row = {"recvAt": 0, "events": row}
+        if isinstance(row, dict) and isinstance(row.get("events"), list):
+            rows.append(row)
+    return rows
+
+
+def _subscribed_symbols(params: str) -> set[str]:
+    out: set[str] = set()
+    for part in str(params or "").split(","):
+        channel, _, symbol = part.strip().partition(".")
+        if channel in {"AM", "A"} and symbol:
+            out.add(symbol.upper())
+    return out
+
+
+async def _replay(ws: Any, rows: list[dict[str, Any]], subscribed: set[str], speed: float, loop_forever: bool) -> None:
+    while True:
+        previous_at: int | None = None
+        for row in rows:
+            recv_at = int(row.get("recvAt") or 0)
+            if previous_at is not None and recv_at > previous_at and speed > 0:
+                await asyncio.sleep((recv_at - previous_at) / 1000.0 / speed)
+            previous_at = recv_at
+            events = [
+                event
+                for event in row["events"]
+                if isinstance(event, dict) and ("*" in subscribed or str(event.get("sym") or "").upper() in subscribed)
+            ]
+            if events:
+                await ws.send(json.dumps(events))
+        if not loop_forever:
+            return
+
+
+def _handler_factory(rows: list[dict[str, Any]], speed: float, loop_forever: bool):
+    async def _handler(ws: Any, path: str | None = None) -> None:
+        _ = path
+        await ws.send(json.dumps([{"ev": "status", "status": "connected", "message": "replay server"}]))
+        subscribed: set[str] = set()
+        replay_task: asyncio.Task[None] | None = None
+        try:
+            async for message in ws:
+                try:
+                    request = json.loads(message)
+                except Exception:
+                    continue
+                action = str(request.get("action") or "")
+                if action == "auth":
+                    await ws.send(json.dumps([{"ev": "status", "status": "auth_success", "message": "authenticated"}]))
+                elif action == "subscribe":
+                    params = str(request.get("params") or "")
+                    subscribed |= {"*"} if params.strip() in {"AM.*", "A.*"} else _subscribed_symbols(params)
+                    await ws.send(json.dumps([{"ev": "status", "status": "success", "message": f"subscribed to: {params}"}]))
+                    if replay_task is None:
+                        replay_task = asyncio.create_task(_replay(ws, rows, subscribed, speed, loop_forever))
+        finally:
+            if replay_task is not None:
+                replay_task.cancel()
+
+    return _handler
+
+
+async def _serve(host: str, port: int, rows: list[dict[str, Any]], speed: float, loop_forever: bool) -> None:
+    import websockets
+
+    async with websockets.serve(_handler_factory(rows, speed, loop_forever), host, port):
+        print(f"massive replay server listening on ws://{host}:{port} ({len(rows)} recorded messages, speed x{speed:g})")
+        await asyncio.Future()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Replay recorded Massive minute aggregates over a local websocket")
+    parser.add_argument("recording", help="JSONL written via MASSIVE_STREAM_RECORD_PATH")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--speed", type=float, default=60.0, help="Replay speed multiplier (0 = no delay)")
+    parser.add_argument("--loop", action="store_true", help="Restart the recording when it ends")
+    args = parser.parse_args()
+
+    path = Path(args.recording)
+    if not path.is_absolute():
+        path = ROOT / path
+    rows = _load_recording(path)
+    if not rows:
+        print(f"no recorded aggregates in {path}")
+        sys.exit(1)
+    try:
+        asyncio.run(_serve(args.host, args.port, rows, args.speed, args.loop))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+from __future__ import annotations
+
+import argparse
+import sys
+from datetime import datetime
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT / "src"))
+
+from event_profile import load_event_profile
+from nautilus_v2.sweep import grid_configs, parse_param_space, run_parameter_sweep, sample_configs
+
+
+DATA_ROOT = ROOT / "data" / "nautilus_v2"
+DEFAULT_SPACE = "fast_ema_period=5:30:5;slow_ema_period=20:100:10"
+
+
+def _latest_bundle_dir(profile_name: str) -> Path:
+    base_dir = DATA_ROOT / profile_name
+    candidates = [p for p in base_dir.glob("*") if p.is_dir()]
+    if not candidates:
+        raise FileNotFoundError(f"No data/nautilus_v2/{profile_name}/<date> bundle directories found")
+    candidates.sort(key=lambda p: p.stat().st_mtime, reverse=True)
+    return candidates[0]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Sweep EMACross parameters over the latest Nautilus bundle")
+    parser.add_argument("--profile", default=None)
+    parser.add_argument("--space", default=DEFAULT_SPACE, help="name=v1,v2;name2=start:stop:step")
+    parser.add_argument("--samples", type=int, default=0, help="Random sample size (0 = full grid)")
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--workers", type=int, default=None, help="Process count (default AI_NAUTILUS_SWEEP_WORKERS / CPU count)")
+    parser.add_argument("--top", type=int, default=10)
+    args = parser.parse_args()
+
+    print(f"[{datetime.now()}] nautilus parameter sweep started...")
+    profile = load_event_profile(args.profile)
+    profile_name = str(profile.get("name", profile.get("primary_symbol", "profile").lower()))
+    space = parse_param_space(args.space)
+    configs = sample_configs(space, args.samples, args.seed) if args.samples > 0 else grid_configs(space)
+    result = run_parameter_sweep(
+        _latest_bundle_dir(profile_name),
+        configs,
+        profile_name=profile_name,
+        max_workers=args.workers,
+    )
+    print(f"bundle_dir: {result['bundle_dir']}")
+    print(
+        f"configs: {result['config_count']} (executed {result['executed']}, cached {result['cached']}, "
+        f"skipped {result['skipped']} fast >= slow, workers {result['workers']})"
+    )
+    if result["catalog_path"]:
+        print(f"catalog_path: {result['catalog_path']} ({'imported' if result['catalog_imported'] else 'reused'})")
+    for error in result["errors"]:
+        print(f"[warn] sweep config {error['config_hash']} failed: {error['error']}")
+    print(f"table_csv: {result['table_path']}")
+    print(result["table"].head(max(1, args.top)).to_string(index=False))
+
+
+if __name__ == "__main__":
+    main()
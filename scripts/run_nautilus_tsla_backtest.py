@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import json
+import os
 import sys
 from datetime import datetime
 from pathlib import Path
@@ -9,11 +10,13 @@ ROOT = Path(__file__).resolve().parents[1]
 sys.path.insert(0, str(ROOT / "src"))
 
 from event_profile import load_event_profile
-from nautilus_v2.backtest import import_tsla_bundle_to_catalog
-from nautilus_v2.backtest import run_tsla_backtest_in_memory
+from nautilus_v2.backtest import append_bundle_to_catalog
+from nautilus_v2.backtest import run_bundle_backtest_in_memory
+from nautilus_v2.loader import backtest_input_hash, load_cached_backtest
 
 
 DATA_ROOT = ROOT / "data" / "nautilus_v2"
+CATALOG_ROOT = ROOT / "data" / "nautilus_v2_catalog"
 
 
 def _latest_bundle_dir(profile_name: str) -> Path:
@@ -30,14 +33,21 @@ def main() -> None:
     profile = load_event_profile()
     profile_name = str(profile.get("name", profile.get("primary_symbol", "profile").lower()))
     bundle_dir = _latest_bundle_dir(profile_name)
-    catalog_dir = bundle_dir / "catalog"
-    import_info = import_tsla_bundle_to_catalog(bundle_dir, catalog_dir)
-    summary = run_tsla_backtest_in_memory(bundle_dir)
     symbol = str(profile.get("primary_symbol", "TSLA")).lower()
     out_path = bundle_dir / f"{symbol}_nautilus_backtest_summary.json"
+    input_hash = backtest_input_hash(bundle_dir, profile)
+    catalog_dir = CATALOG_ROOT / profile_name
+    import_info = append_bundle_to_catalog(bundle_dir, catalog_dir)
+    if str(os.getenv("AI_NAUTILUS_BACKTEST_CACHE_ENABLED", "1")).strip().lower() in {"1", "true", "yes", "on", "y"}:
+        if load_cached_backtest(out_path, input_hash) is not None:
+            print(f"catalog_import: news={import_info['news_count']} macro={import_info['macro_count']} bars={import_info['new_bar_count']}")
+            print(f"backtest cache hit ({input_hash[:12]}): {out_path}")
+            return
+    summary = run_bundle_backtest_in_memory(bundle_dir, profile_name)
     payload = {
         "profile": profile_name,
         "bundle_dir": str(bundle_dir),
+        "input_hash": input_hash,
         "catalog_import": import_info,
         "backtest_summary": summary,
     }
@@ -0,0 +1,84 @@
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import sys
+import time
+from datetime import date, datetime
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT / "src"))
+
+from core.earnings_pit import EarningsEventStore
+from core.sec_pit import SecPointInTimeStore
+from core.stock_data import get_stock_data
+from event_profile import load_event_profile
+from nautilus_v2.walk_forward import build_walk_forward_signals, load_event_stream, run_walk_forward_backtest
+
+
+OUTPUT_ROOT = ROOT / "data" / "nautilus_v2_walk_forward"
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Walk-forward replay of PIT signals into a Nautilus backtest")
+    parser.add_argument("--profile", default=None)
+    parser.add_argument("--start", type=date.fromisoformat, default=None, help="First replay day (YYYY-MM-DD)")
+    parser.add_argument("--end", type=date.fromisoformat, default=None, help="Last replay day (YYYY-MM-DD)")
+    parser.add_argument("--period", default=os.getenv("AI_WALK_FORWARD_BARS_PERIOD", "5y"), help="Daily bar history to fetch")
+    parser.add_argument("--events", default=None, help="Recorded event stream (.json feed or .jsonl); default: profile event_file")
+    parser.add_argument("--lookback-days", type=int, default=3)
+    parser.add_argument("--signals-only", action="store_true", help="Write signals without running Nautilus")
+    args = parser.parse_args()
+
+    print(f"[{datetime.now()}] nautilus walk-forward started...")
+    profile = load_event_profile(args.profile)
+    profile_name = str(profile.get("name", profile.get("primary_symbol", "profile").lower()))
+    symbols = [str(item).upper() for item in profile.get("symbols", []) if str(item).strip()]
+    nautilus = profile.get("nautilus", {}) if isinstance(profile.get("nautilus"), dict) else {}
+
+    started = time.perf_counter()
+    frames = {symbol: get_stock_data(symbol, period=args.period, auto_adjust=False) for symbol in symbols}
+    frames = {symbol: df for symbol, df in frames.items() if df is not None and not df.empty}
+    sec_store = SecPointInTimeStore(list(frames))
+    earnings_store = EarningsEventStore(list(frames))
+    event_path = args.events or profile.get("event_file")
+    if event_path and not Path(event_path).is_absolute():
+        event_path = str(ROOT / event_path)
+    signals = build_walk_forward_signals(
+        frames,
+        sec_store=sec_store,
+        earnings_store=earnings_store,
+        event_stream=load_event_stream(event_path),
+        start=args.start,
+        end=args.end,
+        lookback_days=args.lookback_days,
+    )
+    print(f"signals: {len(signals)} rows for {len(frames)} symbols in {time.perf_counter() - started:.1f}s")
+
+    tag = f"{args.start or 'begin'}_{args.end or 'latest'}"
+    out_dir = OUTPUT_ROOT / profile_name / tag
+    out_dir.mkdir(parents=True, exist_ok=True)
+    signals_path = out_dir / "signals.csv"
+    signals.to_csv(signals_path, index=False)
+    print(f"signals_csv: {signals_path}")
+    if args.signals_only:
+        return
+
+    summary = run_walk_forward_backtest(frames, signals, nautilus=nautilus)
+    payload = {
+        "profile": profile_name,
+        "start": str(args.start or ""),
+        "end": str(args.end or ""),
+        "event_stream": str(event_path or ""),
+        "signals_path": str(signals_path),
+        "backtest_summary": summary,
+    }
+    out_path = out_dir / "walk_forward_summary.json"
+    out_path.write_text(json.dumps(payload, ensure_ascii=False, indent=2, default=str) + "\n", encoding="utf-8")
+    print(f"summary_json: {out_path}")
+
+
+if __name__ == "__main__":
+    main()
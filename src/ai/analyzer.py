@@ -17,6 +17,8 @@ from collections import Counter
 from pathlib import Path
 from typing import Any
 
+from core.tracing import span
+
 
 class AIAnalyzer:
     def __init__(self, model: str | None = None):
@@ -207,6 +209,18 @@ class AIAnalyzer:
         if not self.has_api_access:
             return None
 
+        with span(
+            "ai.call",
+            model=self.model,
+            reasoning_effort=self.reasoning_effort,
+            max_tokens=int(max_tokens),
+            prompt_chars=len(prompt),
+        ) as current:
+            text = self._call_codex(prompt, max_tokens)
+            current.set(ok=text is not None, response_chars=len(text or ""))
+            return text
+
+    def _call_codex(self, prompt: str, max_tokens: int) -> str | None:
         out_file: tempfile.NamedTemporaryFile | None = None
         try:
             token_budget = max(64, int(max_tokens))
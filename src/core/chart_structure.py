@@ -4,6 +4,8 @@ from typing import Any
 
 import pandas as pd
 
+from core.tracing import span
+
 
 def _s(value: Any) -> str:
     return str(value or "").strip()
@@ -37,6 +39,17 @@ class ChartStructureCollector:
         symbol: str,
         bars: pd.DataFrame,
         indicators: dict[str, Any],
+    ) -> dict[str, Any]:
+        with span("chart.analyze_daily", symbol=symbol, bars=0 if bars is None else len(bars)) as current:
+            result = self._analyze_daily(symbol, bars, indicators)
+            current.set(chart_state=_s(result.get("chartState")))
+            return result
+
+    def _analyze_daily(
+        self,
+        symbol: str,
+        bars: pd.DataFrame,
+        indicators: dict[str, Any],
     ) -> dict[str, Any]:
         if bars is None or bars.empty or not indicators:
             return {"chartState": "structure_unavailable", "chartStructure": {"status": "unavailable"}}
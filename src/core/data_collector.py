@@ -18,14 +18,17 @@ from core.indicators import calculate_indicators
 from core.market_regime import MarketRegimeCollector
 from core.news_collectors import build_next_known_events, fetch_rss_events, fetch_sec_submission_events
 from core.stock_data import (
-    _build_session,
+    benchmark_symbol as default_benchmark_symbol,
+    get_benchmark_bars,
     get_fear_greed_index,
     get_intraday_stock_data,
     get_market_condition,
     get_realtime_stock_snapshots,
     get_stock_data,
     get_stock_info,
+    shared_session,
 )
+from core.tracing import bind, span
 
 
 ROOT = Path(__file__).resolve().parents[2]
@@ -114,7 +117,7 @@ class DataCollector:
 
     def __init__(self, *, root: Path | None = None, session: requests.Session | None = None) -> None:
         self.root = root or ROOT
-        self.session = session or _build_session()
+        self.session = session or shared_session()
         self.session.headers.update({"User-Agent": os.getenv("AUTOSTOCK_USER_AGENT", "autostock/2.0")})
         self.chart_structure = ChartStructureCollector()
         self.market_regime = MarketRegimeCollector(
@@ -123,7 +126,8 @@ class DataCollector:
         )
 
     def get_stock_data(self, symbol: str, period: str = "15mo", auto_adjust: bool | None = None) -> pd.DataFrame | None:
-        return get_stock_data(symbol, period=period, auto_adjust=auto_adjust)
+        with span("data.get_stock_data", symbol=symbol, period=period):
+            return get_stock_data(symbol, period=period, auto_adjust=auto_adjust)
 
     def get_intraday_stock_data(
         self,
@@ -133,10 +137,16 @@ class DataCollector:
         auto_adjust: bool | None = None,
         prepost: bool | None = None,
     ) -> pd.DataFrame | None:
-        return get_intraday_stock_data(symbol, period=period, interval=interval, auto_adjust=auto_adjust, prepost=prepost)
+        with span("data.get_intraday_stock_data", symbol=symbol, period=period, interval=interval):
+            return get_intraday_stock_data(symbol, period=period, interval=interval, auto_adjust=auto_adjust, prepost=prepost)
+
+    def get_benchmark_bars(self, symbol: str | None = None) -> pd.DataFrame | None:
+        with span("data.get_benchmark_bars", symbol=symbol or default_benchmark_symbol()):
+            return get_benchmark_bars(symbol)
 
     def get_stock_info(self, symbol: str) -> dict[str, Any]:
-        return get_stock_info(symbol)
+        with span("data.get_stock_info", symbol=symbol):
+            return get_stock_info(symbol)
 
     def get_market_condition(self) -> dict[str, Any]:
         return get_market_condition()
@@ -236,8 +246,8 @@ class DataCollector:
             "optionsMarket": self.collect_options_market_context,
         }
         results: dict[str, Any] = {}
-        with ThreadPoolExecutor(max_workers=len(tasks), thread_name_prefix="market-ctx") as executor:
-            futures = {executor.submit(fn): key for key, fn in tasks.items()}
+        with span("data.collect_market_context"), ThreadPoolExecutor(max_workers=len(tasks), thread_name_prefix="market-ctx") as executor:
+            futures = {executor.submit(bind(fn)): key for key, fn in tasks.items()}
             for future in as_completed(futures):
                 key = futures[future]
                 try:
@@ -264,19 +274,20 @@ class DataCollector:
 
     def _fetch_fred_series(self, series_id: str, api_key: str) -> dict[str, Any]:
         try:
-            response = self.session.get(
-                FRED_API_URL,
-                params={
-                    "series_id": series_id,
-                    "api_key": api_key,
-                    "file_type": "json",
-                    "sort_order": "desc",
-                    "limit": 8,
-                },
-                timeout=10,
-            )
-            response.raise_for_status()
-            payload = response.json()
+            with span("data.fred_series", series_id=series_id):
+                response = self.session.get(
+                    FRED_API_URL,
+                    params={
+                        "series_id": series_id,
+                        "api_key": api_key,
+                        "file_type": "json",
+                        "sort_order": "desc",
+                        "limit": 8,
+                    },
+                    timeout=10,
+                )
+                response.raise_for_status()
+                payload = response.json()
         except Exception as exc:
             return {"status": "error", "error": f"{type(exc).__name__}: {exc}"}
 
@@ -311,7 +322,7 @@ class DataCollector:
             workers = _env_int("FRED_MACRO_WORKERS", min(len(series_ids), 6), minimum=1, maximum=12)
             with ThreadPoolExecutor(max_workers=workers) as executor:
                 futures = {
-                    executor.submit(self._fetch_fred_series, series_id, api_key): series_id
+                    executor.submit(bind(self._fetch_fred_series), series_id, api_key): series_id
                     for series_id in series_ids
                 }
                 for future in as_completed(futures):
@@ -329,8 +340,9 @@ class DataCollector:
         if not _env_bool("CBOE_OPTIONS_STATS_ENABLED", True):
             return {"status": "disabled", "source": "cboe"}
         try:
-            response = self.session.get(CBOE_DAILY_STATS_URL, timeout=12)
-            response.raise_for_status()
+            with span("data.options_market"):
+                response = self.session.get(CBOE_DAILY_STATS_URL, timeout=12)
+                response.raise_for_status()
             tables = pd.read_html(StringIO(response.text))
         except Exception as exc:
             return {"status": "unavailable", "source": "cboe", "reason": f"{type(exc).__name__}: {exc}"}
@@ -385,23 +397,25 @@ class DataCollector:
         if not _env_bool("FINRA_SHORT_VOLUME_ENABLED", True):
             return {"status": "disabled", "source": "finra_reg_sho_daily"}
         try:
-            response = self.session.post(
-                FINRA_REG_SHO_URL,
-                headers={"Content-Type": "application/json", "Accept": "application/json"},
-                json={
-                    "compareFilters": [
-                        {
-                            "fieldName": "securitiesInformationProcessorSymbolIdentifier",
-                            "fieldValue": symbol,
-                            "compareType": "EQUAL",
-                        }
-                    ],
-                    "limit": max(3, int(limit)),
-                },
-                timeout=12,
-            )
-            response.raise_for_status()
-            rows = response.json()
+            with span("data.collect_short_volume", symbol=symbol) as current:
+                response = self.session.post(
+                    FINRA_REG_SHO_URL,
+                    headers={"Content-Type": "application/json", "Accept": "application/json"},
+                    json={
+                        "compareFilters": [
+                            {
+                                "fieldName": "securitiesInformationProcessorSymbolIdentifier",
+                                "fieldValue": symbol,
+                                "compareType": "EQUAL",
+                            }
+                        ],
+                        "limit": max(3, int(limit)),
+                    },
+                    timeout=12,
+                )
+                current.set(status=response.status_code)
+                response.raise_for_status()
+                rows = response.json()
         except Exception as exc:
             return {"status": "unavailable", "source": "finra_reg_sho_daily", "reason": f"{type(exc).__name__}: {exc}"}
 
@@ -440,8 +454,8 @@ class DataCollector:
         clean_symbols = sorted({_s(symbol).upper() for symbol in symbols if _s(symbol)})
         workers = _env_int("FINRA_SHORT_VOLUME_WORKERS", 4, minimum=1, maximum=12)
         out: dict[str, dict[str, Any]] = {}
-        with ThreadPoolExecutor(max_workers=workers) as executor:
-            futures = {executor.submit(self.collect_short_volume, symbol): symbol for symbol in clean_symbols}
+        with span("data.collect_short_volume_batch", symbols=len(clean_symbols)), ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = {executor.submit(bind(self.collect_short_volume), symbol): symbol for symbol in clean_symbols}
             for future in as_completed(futures):
                 symbol = futures[future]
                 row = future.result()
@@ -480,6 +494,12 @@ class DataCollector:
         return out
 
     def collect_news_bundle(self, symbol: str, chart_row: dict[str, Any] | None = None) -> dict[str, Any]:
+        with span("data.collect_news_bundle", symbol=symbol) as current:
+            bundle = self._collect_news_bundle(symbol, chart_row)
+            current.set(events=len(bundle.get("events") or []))
+            return bundle
+
+    def _collect_news_bundle(self, symbol: str, chart_row: dict[str, Any] | None = None) -> dict[str, Any]:
         info = self.get_stock_info(symbol)
         next_events = build_next_known_events(symbol, info, datetime.now(timezone.utc))
         raw_events: list[dict[str, Any]] = []
@@ -516,9 +536,9 @@ class DataCollector:
         bundles: dict[str, dict[str, Any]] = {}
         workers = _env_int("TELEGRAM_NEWS_WORKERS", 8, minimum=2)
         chart_rows_by_symbol = chart_rows_by_symbol or {}
-        with ThreadPoolExecutor(max_workers=workers) as executor:
+        with span("data.collect_news_bundles", symbols=len(symbols)), ThreadPoolExecutor(max_workers=workers) as executor:
             futures = {
-                executor.submit(self.collect_news_bundle, symbol, chart_rows_by_symbol.get(symbol)): symbol
+                executor.submit(bind(self.collect_news_bundle), symbol, chart_rows_by_symbol.get(symbol)): symbol
                 for symbol in symbols
             }
             for future in as_completed(futures):
@@ -666,8 +686,8 @@ class DataCollector:
     def scan_fundamentals(self, symbols: list[str]) -> list[dict[str, Any]]:
         rows: list[dict[str, Any]] = []
         workers = _env_int("TELEGRAM_FUNDAMENTAL_WORKERS", 12, minimum=4)
-        with ThreadPoolExecutor(max_workers=workers) as executor:
-            futures = {executor.submit(self.collect_fundamental_snapshot, symbol): symbol for symbol in symbols}
+        with span("data.scan_fundamentals", symbols=len(symbols)), ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = {executor.submit(bind(self.collect_fundamental_snapshot), symbol): symbol for symbol in symbols}
             for future in as_completed(futures):
                 row = future.result()
                 if row:
@@ -776,6 +796,8 @@ class DataCollector:
             symbol = _s(row.get("symbol")).upper()
             snapshot = snapshots.get(symbol)
             if not snapshot:
+                if _s(row.get("volumeSource")) == "massive_snapshot_missing" and row.get("priceDataQuality"):
+                    continue
                 row["volumeRatio"] = None
                 row["realtimeVolume"] = None
                 row["lastMinuteVolume"] = None
@@ -784,6 +806,13 @@ class DataCollector:
                 row["priceDataQuality"] = self._single_source_price_quality(row)
                 continue
 
+            if (
+                row.get("priceDataQuality")
+                and _s(row.get("volumeAsOf"))
+                and _s(row.get("volumeAsOf")) == _s(snapshot.get("updatedAt"))
+                and _s(row.get("volumeSource")) == (_s(snapshot.get("source")) or "massive_snapshot")
+            ):
+                continue
             realtime_volume = _f(snapshot.get("sessionVolume"), 0.0)
             avg_volume = _f(row.get("dailyVolumeAvg20"), 0.0)
             latest_price = _f(snapshot.get("closePrice"), _f(row.get("latestClosePrice"), 0.0))
@@ -803,8 +832,8 @@ class DataCollector:
         return rows
 
     def apply_relative_strength(self, rows: list[dict[str, Any]], benchmark_symbol: str | None = None) -> list[dict[str, Any]]:
-        benchmark = _s(benchmark_symbol or os.getenv("AI_MARKET_INDICATOR", "QQQ")).upper() or "QQQ"
-        bars = self.get_stock_data(benchmark, period="15mo", auto_adjust=False)
+        benchmark = _s(benchmark_symbol).upper() or default_benchmark_symbol()
+        bars = self.get_benchmark_bars(benchmark)
         indicators = calculate_indicators(bars) if bars is not None else None
         if indicators is None:
             for row in rows:
@@ -823,9 +852,9 @@ class DataCollector:
     def scan_price_rows(self, symbols: list[str], rebalance_hints: dict[str, dict[str, Any]]) -> list[dict[str, Any]]:
         workers = _env_int("TELEGRAM_SCAN_WORKERS", 12, minimum=4)
         scanned: list[dict[str, Any]] = []
-        with ThreadPoolExecutor(max_workers=workers) as executor:
+        with span("data.scan_price_rows", symbols=len(symbols)), ThreadPoolExecutor(max_workers=workers) as executor:
             futures = {
-                executor.submit(self.scan_symbol_price, symbol, rebalance_hints.get(symbol)): symbol
+                executor.submit(bind(self.scan_symbol_price), symbol, rebalance_hints.get(symbol)): symbol
                 for symbol in symbols
             }
             for future in as_completed(futures):
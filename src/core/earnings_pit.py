@@ -91,13 +91,19 @@ def fetch_earnings_dates(symbol: str, limit: int = 120, refresh: bool = False) -
 class EarningsEventStore:
     def __init__(self, symbols: list[str], limit: int = 120, max_workers: int = 8):
         self._rows: dict[str, list[dict[str, Any]]] = {}
+        self._limit = int(limit)
+        self._max_workers = int(max_workers)
+        self.load_symbols(symbols)
+
+    def load_symbols(self, symbols: list[str], refresh: bool = False) -> None:
+        """(Re)load earnings rows for ``symbols``; ``refresh`` bypasses the on-disk cache."""
         syms = sorted({str(s).upper() for s in symbols if isinstance(s, str) and s.strip()})
         if not syms:
             return
 
-        workers = min(max(2, int(max_workers)), 12)
+        workers = min(max(2, self._max_workers), 12)
         with ThreadPoolExecutor(max_workers=workers) as executor:
-            futures = {executor.submit(fetch_earnings_dates, sym, limit, False): sym for sym in syms}
+            futures = {executor.submit(fetch_earnings_dates, sym, self._limit, refresh): sym for sym in syms}
             for future in as_completed(futures):
                 sym = futures[future]
                 try:
@@ -105,6 +111,19 @@ class EarningsEventStore:
                 except Exception:
                     self._rows[sym] = []
 
+    def event_times(self, symbol: str) -> list[pd.Timestamp]:
+        """Sorted UTC times of reported earnings events; ``latest_event_asof`` only changes at these."""
+        out: list[pd.Timestamp] = []
+        for row in self._rows.get(str(symbol).upper(), []):
+            try:
+                event_ts = pd.Timestamp(row.get("earnings_date"))
+            except Exception:
+                continue
+            if not math.isfinite(_to_float(row.get("reported_eps"))):
+                continue
+            out.append(event_ts.tz_localize("UTC") if event_ts.tzinfo is None else event_ts.tz_convert("UTC"))
+        return sorted(out)
+
     def latest_event_asof(self, symbol: str, asof: pd.Timestamp) -> dict[str, Any]:
         rows = self._rows.get(str(symbol).upper(), [])
         if not rows:
@@ -0,0 +1,179 @@
+"""
+Exchange calendar and session-phase polling schedule.
+
+The calendar (holidays, early closes, session clocks) is read from
+``configs/market_calendar/us_equities.json`` or ``AI_MARKET_CALENDAR_PATH``.
+Dates outside the file fall back to plain weekday sessions.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import random
+from datetime import date, datetime, time as dt_time, timedelta
+from functools import lru_cache
+from pathlib import Path
+from typing import Any
+from zoneinfo import ZoneInfo
+
+
+ROOT = Path(__file__).resolve().parents[2]
+DEFAULT_CALENDAR_PATH = ROOT / "configs" / "market_calendar" / "us_equities.json"
+PHASES = ("premarket", "open", "midday", "close", "afterhours", "closed")
+DEFAULT_PHASE_INTERVALS = {
+    "premarket": 300,
+    "open": 30,
+    "midday": 120,
+    "close": 30,
+    "afterhours": 600,
+    "closed": 3600,
+}
+OPEN_PHASE_MINUTES = 60
+CLOSE_PHASE_MINUTES = 60
+
+
+def _s(value: Any) -> str:
+    return str(value or "").strip()
+
+
+def _env_int(key: str, default: int, minimum: int = 1, maximum: int | None = None) -> int:
+    try:
+        value = int(os.getenv(key, str(default)))
+    except Exception:
+        value = int(default)
+    value = max(minimum, value)
+    if maximum is not None:
+        value = min(maximum, value)
+    return value
+
+
+def _clock(value: Any, default: str) -> dt_time:
+    hour, minute = (_s(value) or default).split(":", 1)
+    return dt_time(int(hour), int(minute))
+
+
+class MarketCalendar:
+    def __init__(self, payload: dict[str, Any]) -> None:
+        self.name = _s(payload.get("name")) or "XNYS"
+        self.tz = ZoneInfo(_s(payload.get("timezone")) or "America/New_York")
+        self.premarket_open = _clock(payload.get("premarket_open"), "04:00")
+        self.regular_open = _clock(payload.get("regular_open"), "09:30")
+        self.regular_close = _clock(payload.get("regular_close"), "16:00")
+        self.afterhours_close = _clock(payload.get("afterhours_close"), "20:00")
+        self.early_close_afterhours_close = _clock(payload.get("early_close_afterhours_close"), "17:00")
+        holidays = payload.get("holidays") or {}
+        self.holidays = {date.fromisoformat(day) for day in (holidays if isinstance(holidays, (dict, list)) else [])}
+        early = payload.get("early_closes") or {}
+        self.early_closes = {date.fromisoformat(day): _clock(close, "13:00") for day, close in early.items()} if isinstance(early, dict) else {}
+
+    def is_trading_day(self, day: date) -> bool:
+        return day.weekday() < 5 and day not in self.holidays
+
+    def session_bounds(self, day: date) -> dict[str, datetime]:
+        """Phase boundaries for ``day`` in exchange time (only meaningful on trading days)."""
+        close = self.early_closes.get(day, self.regular_close)
+        after_close = self.early_close_afterhours_close if day in self.early_closes else self.afterhours_close
+
+        def at(clock: dt_time) -> datetime:
+            return datetime.combine(day, clock, tzinfo=self.tz)
+
+        regular_open = at(self.regular_open)
+        regular_close = at(close)
+        return {
+            "premarket": at(self.premarket_open),
+            "open": regular_open,
+            "midday": min(regular_open + timedelta(minutes=OPEN_PHASE_MINUTES), regular_close),
+            "close": max(regular_close - timedelta(minutes=CLOSE_PHASE_MINUTES), regular_open),
+            "afterhours": regular_close,
+            "closed": at(after_close),
+        }
+
+    def phase(self, now: datetime | None = None) -> str:
+        local_now = (now or datetime.now(self.tz)).astimezone(self.tz)
+        if not self.is_trading_day(local_now.date()):
+            return "closed"
+        bounds = self.session_bounds(local_now.date())
+        current = "closed"
+        for name in PHASES:
+            if local_now >= bounds[name]:
+                current = name
+        return current
+
+    def next_phase_change(self, now: datetime | None = None) -> datetime:
+        local_now = (now or datetime.now(self.tz)).astimezone(self.tz)
+        day = local_now.date()
+        for _ in range(15):
+            if self.is_trading_day(day):
+                for boundary in sorted(self.session_bounds(day).values()):
+                    if boundary > local_now:
+                        return boundary
+            day += timedelta(days=1)
+        return local_now + timedelta(days=1)
+
+
+@lru_cache(maxsize=4)
+def _load_calendar(path_text: str) -> MarketCalendar:
+    path = Path(path_text)
+    try:
+        payload = json.loads(path.read_text(encoding="utf-8"))
+    except Exception as exc:
+        print(f"market calendar unavailable ({path}): {type(exc).__name__}: {exc}; using weekday sessions")
+        payload = {}
+    return MarketCalendar(payload if isinstance(payload, dict) else {})
+
+
+def load_market_calendar(path: str | Path | None = None) -> MarketCalendar:
+    raw = path or _s(os.getenv("AI_MARKET_CALENDAR_PATH")) or DEFAULT_CALENDAR_PATH
+    resolved = Path(raw)
+    if not resolved.is_absolute():
+        resolved = ROOT / resolved
+    return _load_calendar(str(resolved))
+
+
+def parse_phase_intervals(raw: str) -> dict[str, int]:
+    """``open=30,midday=120,...`` over the defaults; unknown phases are ignored."""
+    intervals = dict(DEFAULT_PHASE_INTERVALS)
+    for part in _s(raw).split(","):
+        name, sep, value = part.partition("=")
+        name = name.strip().lower()
+        if not sep or name not in intervals:
+            continue
+        try:
+            intervals[name] = max(5, int(value))
+        except ValueError:
+            print(f"runtime phase interval ignored: {part!r}")
+    return intervals
+
+
+class RuntimeSchedule:
+    """Per-phase polling interval with jitter, never sleeping past the next phase boundary."""
+
+    def __init__(
+        self,
+        calendar: MarketCalendar | None = None,
+        intervals: dict[str, int] | None = None,
+        jitter_pct: int | None = None,
+    ) -> None:
+        self.calendar = calendar or load_market_calendar()
+        self.intervals = intervals or parse_phase_intervals(os.getenv("AI_RUNTIME_PHASE_INTERVALS", ""))
+        self.jitter_pct = _env_int("AI_RUNTIME_JITTER_PCT", 10, minimum=0, maximum=50) if jitter_pct is None else jitter_pct
+
+    def next_sleep_seconds(self, now: datetime | None = None) -> tuple[str, float]:
+        local_now = (now or datetime.now(self.calendar.tz)).astimezone(self.calendar.tz)
+        phase = self.calendar.phase(local_now)
+        base = float(self.intervals.get(phase, DEFAULT_PHASE_INTERVALS[phase]))
+        jitter = base * self.jitter_pct / 100.0
+        sleep_sec = base + random.uniform(-jitter, jitter)
+        until_change = (self.calendar.next_phase_change(local_now) - local_now).total_seconds()
+        return phase, max(5.0, min(sleep_sec, until_change + 1.0))
+
+
+__all__ = [
+    "DEFAULT_PHASE_INTERVALS",
+    "MarketCalendar",
+    "PHASES",
+    "RuntimeSchedule",
+    "load_market_calendar",
+    "parse_phase_intervals",
+]
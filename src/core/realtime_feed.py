@@ -0,0 +1,278 @@
+"""
+Optional Massive.com (Polygon-compatible) websocket minute-aggregate feed.
+
+Subscribes to ``AM.<SYMBOL>`` channels and keeps a per-symbol rolling state of
+session volume / last-minute volume. ``get_stream_snapshots`` returns the same
+shape as ``core.stock_data.get_realtime_stock_snapshots`` with
+``source="massive_stream"``. Disabled unless MASSIVE_STREAM_ENABLED is set;
+the ``websockets`` package is only imported when the feed actually starts.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import os
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from threading import Lock, Thread
+from typing import Any
+
+
+DEFAULT_STREAM_URL = "wss://socket.massive.com/stocks"
+
+
+def _s(value: Any) -> str:
+    return str(value or "").strip()
+
+
+def _f(value: Any, default: float = 0.0) -> float:
+    try:
+        return float(value)
+    except Exception:
+        return default
+
+
+def _env_bool(key: str, default: bool = False) -> bool:
+    raw = str(os.getenv(key, "1" if default else "0")).strip().lower()
+    return raw in {"1", "true", "yes", "on", "y"}
+
+
+def _env_int(key: str, default: int, minimum: int = 1, maximum: int | None = None) -> int:
+    try:
+        value = int(os.getenv(key, str(default)))
+    except Exception:
+        value = int(default)
+    value = max(minimum, value)
+    if maximum is not None:
+        value = min(maximum, value)
+    return value
+
+
+def _clean_symbol(symbol: Any) -> str:
+    return _s(symbol).upper().replace(".", "-")
+
+
+def _ms_to_iso(value: Any) -> str:
+    ms = _f(value, 0.0)
+    if ms <= 0:
+        return ""
+    return datetime.fromtimestamp(ms / 1000.0, tz=timezone.utc).isoformat()
+
+
+def realtime_feed_enabled() -> bool:
+    return _env_bool("MASSIVE_STREAM_ENABLED", False)
+
+
+def stream_max_age_seconds() -> int:
+    return _env_int("MASSIVE_STREAM_MAX_AGE_SECONDS", 120, minimum=5)
+
+
+class MassiveAggregateStream:
+    def __init__(self, url: str, api_key: str, *, record_path: Path | None = None) -> None:
+        self.url = url
+        self.api_key = api_key
+        self.record_path = record_path
+        self.symbols: set[str] = set()
+        self.states: dict[str, dict[str, Any]] = {}
+        self.received_at: dict[str, float] = {}
+        self.connected = False
+        self.last_status = ""
+        self._lock = Lock()
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._ws: Any = None
+        self._thread: Thread | None = None
+
+    def subscribe(self, symbols: list[str]) -> list[str]:
+        added: list[str] = []
+        with self._lock:
+            for symbol in symbols:
+                clean = _clean_symbol(symbol)
+                if clean and clean not in self.symbols:
+                    self.symbols.add(clean)
+                    added.append(clean)
+        loop = self._loop
+        if added and loop is not None and loop.is_running():
+            asyncio.run_coroutine_threadsafe(self._send_subscribe(added), loop)
+        return added
+
+    def start(self) -> None:
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._thread = Thread(target=lambda: asyncio.run(self._run_forever()), name="massive-stream", daemon=True)
+        self._thread.start()
+
+    async def _send_subscribe(self, symbols: list[str]) -> None:
+        ws = self._ws
+        if ws is None or not symbols:
+            return
+        await ws.send(json.dumps({"action": "subscribe", "params": ",".join(f"AM.{symbol}" for symbol in sorted(symbols))}))
+
+    async def _run_forever(self) -> None:
+        try:
+            import websockets
+        except ImportError as exc:
+            print(f"massive stream disabled: websockets package is not installed ({exc})")
+            return
+        self._loop = asyncio.get_running_loop()
+        backoff = 1.0
+        while True:
+            try:
+                async with websockets.connect(self.url, ping_interval=20, max_size=None) as ws:
+                    self._ws = ws
+                    await ws.send(json.dumps({"action": "auth", "params": self.api_key}))
+                    with self._lock:
+                        symbols = sorted(self.symbols)
+                    await self._send_subscribe(symbols)
+                    self.connected = True
+                    backoff = 1.0
+                    async for message in ws:
+                        self.handle_message(message)
+            except Exception as exc:
+                print(f"massive stream error: {type(exc).__name__}: {exc} (reconnect in {backoff:.0f}s)")
+            finally:
+                self._ws = None
+                self.connected = False
+            await asyncio.sleep(backoff)
+            backoff = min(60.0, backoff * 2)
+
+    def _record(self, events: list[Any]) -> None:
+        if self.record_path is None:
+            return
+        try:
+            self.record_path.parent.mkdir(parents=True, exist_ok=True)
+            with self.record_path.open("a", encoding="utf-8") as handle:
+                handle.write(json.dumps({"recvAt": int(time.time() * 1000), "events": events}, ensure_ascii=False) + "\n")
+        except Exception as exc:
+            print(f"massive stream record error: {type(exc).__name__}: {exc}")
+
+    def handle_message(self, message: str | bytes) -> int:
+        try:
+            events = json.loads(message)
+        except Exception:
+            return 0
+        if isinstance(events, dict):
+            events = [events]
+        if not isinstance(events, list):
+            return 0
+        applied = 0
+        aggregates: list[dict[str, Any]] = []
+        for event in events:
+            if not isinstance(event, dict):
+                continue
+            ev = _s(event.get("ev"))
+            if ev == "status":
+                self.last_status = _s(event.get("status"))
+                if self.last_status in {"auth_failed", "error"}:
+                    print(f"massive stream status: {self.last_status} {_s(event.get('message'))}")
+                continue
+            if ev in {"AM", "A"}:
+                aggregates.append(event)
+                if self.apply_aggregate(event):
+                    applied += 1
+        if aggregates:
+            self._record(aggregates)
+        return applied
+
+    def apply_aggregate(self, event: dict[str, Any]) -> bool:
+        symbol = _clean_symbol(event.get("sym"))
+        if not symbol:
+            return False
+        minute_volume = _f(event.get("v"), 0.0)
+        accumulated = _f(event.get("av"), 0.0)
+        close = _f(event.get("c"), 0.0)
+        high = _f(event.get("h"), 0.0)
+        low = _f(event.get("l"), 0.0)
+        with self._lock:
+            state = self.states.get(symbol)
+            if state is None or (accumulated > 0 and accumulated < _f(state.get("sessionVolume"), 0.0)):
+                state = {"symbol": symbol, "highPrice": 0.0, "lowPrice": 0.0, "sessionVolume": 0.0}
+                self.states[symbol] = state
+            session_volume = accumulated if accumulated > 0 else _f(state.get("sessionVolume"), 0.0) + minute_volume
+            state["sessionVolume"] = session_volume
+            state["lastMinuteVolume"] = minute_volume
+            if close > 0:
+                state["closePrice"] = close
+            open_price = _f(event.get("op"), 0.0) or _f(state.get("openPrice"), 0.0) or _f(event.get("o"), 0.0)
+            state["openPrice"] = open_price
+            if high > 0:
+                state["highPrice"] = max(_f(state.get("highPrice"), 0.0), high)
+            if low > 0:
+                current_low = _f(state.get("lowPrice"), 0.0)
+                state["lowPrice"] = low if current_low <= 0 else min(current_low, low)
+            state["vwap"] = _f(event.get("a"), 0.0) or _f(event.get("vw"), 0.0)
+            state["updatedAt"] = _ms_to_iso(event.get("e") or event.get("s"))
+            self.received_at[symbol] = time.monotonic()
+        return True
+
+    def snapshots(self, symbols: list[str], max_age_seconds: int | None = None) -> dict[str, dict[str, Any]]:
+        max_age = stream_max_age_seconds() if max_age_seconds is None else max_age_seconds
+        now = time.monotonic()
+        out: dict[str, dict[str, Any]] = {}
+        with self._lock:
+            for symbol in symbols:
+                clean = _clean_symbol(symbol)
+                state = self.states.get(clean)
+                received = self.received_at.get(clean)
+                if state is None or received is None or now - received > max_age:
+                    continue
+                out[clean] = {
+                    "symbol": clean,
+                    "closePrice": _f(state.get("closePrice"), 0.0),
+                    "openPrice": _f(state.get("openPrice"), 0.0),
+                    "highPrice": _f(state.get("highPrice"), 0.0),
+                    "lowPrice": _f(state.get("lowPrice"), 0.0),
+                    "previousClosePrice": 0.0,
+                    "sessionVolume": _f(state.get("sessionVolume"), 0.0),
+                    "lastMinuteVolume": _f(state.get("lastMinuteVolume"), 0.0),
+                    "lastTradePrice": _f(state.get("closePrice"), 0.0),
+                    "lastTradeSize": 0.0,
+                    "marketStatus": "",
+                    "updatedAt": _s(state.get("updatedAt")),
+                    "source": "massive_stream",
+                }
+        return out
+
+
+_STREAM: MassiveAggregateStream | None = None
+_STREAM_LOCK = Lock()
+
+
+def _stream_api_key() -> str:
+    return _s(os.getenv("MASSIVE_API_KEY") or os.getenv("POLYGON_API_KEY"))
+
+
+def ensure_realtime_feed(symbols: list[str]) -> MassiveAggregateStream | None:
+    """Start (once) the shared stream and subscribe ``symbols``; no-op unless MASSIVE_STREAM_ENABLED."""
+    global _STREAM
+    if not realtime_feed_enabled():
+        return None
+    with _STREAM_LOCK:
+        if _STREAM is None:
+            url = _s(os.getenv("MASSIVE_STREAM_URL")) or DEFAULT_STREAM_URL
+            api_key = _stream_api_key()
+            if not api_key and not url.startswith("ws://"):
+                return None
+            record_raw = _s(os.getenv("MASSIVE_STREAM_RECORD_PATH"))
+            _STREAM = MassiveAggregateStream(url, api_key, record_path=Path(record_raw) if record_raw else None)
+        stream = _STREAM
+    stream.subscribe(symbols)
+    stream.start()
+    return stream
+
+
+def get_stream_snapshots(symbols: list[str]) -> dict[str, dict[str, Any]]:
+    stream = _STREAM
+    if stream is None or not symbols:
+        return {}
+    return stream.snapshots(symbols)
+
+
+__all__ = [
+    "MassiveAggregateStream",
+    "ensure_realtime_feed",
+    "get_stream_snapshots",
+    "realtime_feed_enabled",
+    "stream_max_age_seconds",
+]
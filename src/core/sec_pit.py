@@ -10,6 +10,8 @@ from typing import Any
 
 import requests
 
+from core.tracing import span
+
 
 ROOT = Path(__file__).resolve().parents[2]
 DATA_DIR = ROOT / "data" / "sec"
@@ -81,8 +83,9 @@ def _fetch_company_tickers() -> dict[str, Any]:
             return cached
     headers = dict(SEC_HEADERS)
     headers["Host"] = "www.sec.gov"
-    resp = requests.get("https://www.sec.gov/files/company_tickers.json", headers=headers, timeout=30)
-    resp.raise_for_status()
+    with span("http.sec_company_tickers"):
+        resp = requests.get("https://www.sec.gov/files/company_tickers.json", headers=headers, timeout=30)
+        resp.raise_for_status()
     obj = resp.json()
     if not isinstance(obj, dict):
         raise RuntimeError("SEC tickers response malformed")
@@ -115,8 +118,9 @@ def load_companyfacts(cik: str, refresh: bool = False) -> dict[str, Any]:
             return cached
     headers = dict(SEC_HEADERS)
     headers["Host"] = "data.sec.gov"
-    resp = requests.get(f"https://data.sec.gov/api/xbrl/companyfacts/CIK{cik}.json", headers=headers, timeout=30)
-    resp.raise_for_status()
+    with span("http.sec_companyfacts", cik=cik):
+        resp = requests.get(f"https://data.sec.gov/api/xbrl/companyfacts/CIK{cik}.json", headers=headers, timeout=30)
+        resp.raise_for_status()
     obj = resp.json()
     if not isinstance(obj, dict):
         raise RuntimeError(f"SEC companyfacts malformed for {cik}")
@@ -327,14 +331,45 @@ class SecPointInTimeStore:
     def __init__(self, symbols: list[str]):
         self._ticker_to_cik = load_ticker_to_cik()
         self._companyfacts: dict[str, PreparedCompanyFacts] = {}
+        self.load_symbols(symbols)
+
+    def load_symbols(self, symbols: list[str], refresh: bool = False) -> list[str]:
+        """(Re)load companyfacts for ``symbols``; ``refresh`` bypasses the on-disk cache."""
+        loaded: list[str] = []
         for symbol in sorted({str(s).upper() for s in symbols if isinstance(s, str) and s.strip()}):
             cik = self._ticker_to_cik.get(symbol)
             if not cik:
                 continue
             try:
-                self._companyfacts[symbol] = _prepare_companyfacts(load_companyfacts(cik))
+                self._companyfacts[symbol] = _prepare_companyfacts(load_companyfacts(cik, refresh=refresh))
             except Exception:
                 continue
+            loaded.append(symbol)
+        return loaded
+
+    def latest_filed(self, symbol: str) -> date | None:
+        prepared = self._companyfacts.get(str(symbol).upper())
+        if not prepared:
+            return None
+        # Rows are ordered by period, so a late amendment of an older period can be the newest filing.
+        return max(
+            (row.filed for name in PreparedCompanyFacts.__dataclass_fields__ for row in getattr(prepared, name)),
+            default=None,
+        )
+
+    def filing_dates(self, symbol: str) -> list[date]:
+        """Sorted distinct filing dates of the symbol's usable facts; features only change on these days."""
+        prepared = self._companyfacts.get(str(symbol).upper())
+        if not prepared:
+            return []
+        return sorted(
+            {
+                row.filed
+                for rows in (getattr(prepared, name) for name in PreparedCompanyFacts.__dataclass_fields__)
+                for row in rows
+                if math.isfinite(row.value)
+            }
+        )
 
     def features_asof(self, symbol: str, asof: date) -> dict[str, Any]:
         prepared = self._companyfacts.get(str(symbol).upper())
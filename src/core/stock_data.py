@@ -15,9 +15,11 @@ from __future__ import annotations
 import os
 import math
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from functools import lru_cache
 from pathlib import Path
+from threading import Lock
 from typing import Any
 
 import pandas as pd
@@ -27,12 +29,30 @@ from bs4 import BeautifulSoup
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
 
+from core.realtime_feed import get_stream_snapshots
+from core.tracing import span
+
 
 REQUEST_TIMEOUT = 10
 _RETRYABLE = [429, 500, 502, 503, 504]
 MASSIVE_API_BASE_URL = "https://api.massive.com"
 
 
+def http_pool_size() -> int:
+    try:
+        return max(4, int(os.getenv("AUTOSTOCK_HTTP_POOL_SIZE", "32") or 32))
+    except Exception:
+        return 32
+
+
+def _session_get(name: str, url: str, **kwargs: Any) -> requests.Response:
+    """``GET`` on the shared session under an ``http.<name>`` span carrying the status code."""
+    with span(f"http.{name}") as current:
+        resp = _SESSION.get(url, **kwargs)
+        current.set(status=resp.status_code)
+        return resp
+
+
 def _build_session() -> requests.Session:
     session = requests.Session()
     retry = Retry(
@@ -44,7 +64,8 @@ def _build_session() -> requests.Session:
         allowed_methods=["GET"],
         raise_on_status=False,
     )
-    adapter = HTTPAdapter(max_retries=retry)
+    pool_size = http_pool_size()
+    adapter = HTTPAdapter(max_retries=retry, pool_connections=pool_size, pool_maxsize=pool_size)
     session.mount("http://", adapter)
     session.mount("https://", adapter)
     session.headers.update({"User-Agent": "autostock/2.0"})
@@ -54,6 +75,15 @@ def _build_session() -> requests.Session:
 _SESSION = _build_session()
 
 
+def shared_session() -> requests.Session:
+    """Process-wide pooled session (``AUTOSTOCK_HTTP_POOL_SIZE``) used by this module and ``DataCollector``."""
+    return _SESSION
+
+
+_SNAPSHOT_CACHE: dict[str, tuple[float, dict[str, Any] | None]] = {}
+_SNAPSHOT_CACHE_LOCK = Lock()
+
+
 def _init_yfinance_cache() -> None:
     """Force yfinance sqlite cache into a writable project path."""
     try:
@@ -252,58 +282,102 @@ def _normalize_massive_snapshot(row: dict[str, Any]) -> dict[str, Any] | None:
     }
 
 
-@lru_cache(maxsize=128)
-def _get_massive_stock_snapshots_cached(symbols_key: str, bucket: int) -> dict[str, dict[str, Any]]:
-    _ = bucket
+def _fetch_massive_snapshot_batch(batch: list[str], api_key: str) -> dict[str, dict[str, Any]] | None:
+    """Return normalized snapshots for one batch, or None when the request itself failed."""
+    url = f"{_massive_base_url()}/v2/snapshot/locale/us/markets/stocks/tickers"
+    try:
+        resp = _session_get(
+            "massive_snapshot",
+            url,
+            params={"tickers": ",".join(batch), "apiKey": api_key},
+            headers={"User-Agent": "autostock/2.0"},
+            timeout=REQUEST_TIMEOUT,
+        )
+        if resp.status_code != 200:
+            return None
+        payload = resp.json()
+    except Exception:
+        return None
+    rows = payload.get("tickers") if isinstance(payload, dict) else []
+    if not isinstance(rows, list):
+        return None
+    out: dict[str, dict[str, Any]] = {}
+    for raw in rows:
+        if not isinstance(raw, dict):
+            continue
+        normalized = _normalize_massive_snapshot(raw)
+        if normalized:
+            out[normalized["symbol"]] = normalized
+    return out
+
+
+def _fetch_massive_stock_snapshots(symbols: list[str]) -> tuple[dict[str, dict[str, Any]], set[str]]:
+    """Fetch snapshots for ``symbols`` with batches in parallel; also return the symbols actually answered."""
     api_key = _massive_api_key()
-    if not api_key or not symbols_key:
-        return {}
+    if not api_key or not symbols:
+        return {}, set()
 
-    symbols = [symbol for symbol in symbols_key.split(",") if symbol]
-    if not symbols:
-        return {}
+    batch_size = _env_int("MASSIVE_SNAPSHOT_BATCH_SIZE", 200, minimum=1, maximum=250)
+    batches = _chunks(symbols, batch_size)
+    workers = min(len(batches), _env_int("MASSIVE_SNAPSHOT_WORKERS", 4, minimum=1, maximum=8))
+    if workers <= 1:
+        results = [_fetch_massive_snapshot_batch(batch, api_key) for batch in batches]
+    else:
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            results = list(executor.map(lambda batch: _fetch_massive_snapshot_batch(batch, api_key), batches))
 
     out: dict[str, dict[str, Any]] = {}
-    batch_size = _env_int("MASSIVE_SNAPSHOT_BATCH_SIZE", 200, minimum=1, maximum=250)
-    url = f"{_massive_base_url()}/v2/snapshot/locale/us/markets/stocks/tickers"
-    headers = {"User-Agent": "autostock/2.0"}
-    for batch in _chunks(symbols, batch_size):
-        try:
-            resp = _SESSION.get(
-                url,
-                params={"tickers": ",".join(batch), "apiKey": api_key},
-                headers=headers,
-                timeout=REQUEST_TIMEOUT,
-            )
-            if resp.status_code != 200:
-                continue
-            payload = resp.json()
-        except Exception:
+    answered: set[str] = set()
+    for batch, rows in zip(batches, results):
+        if rows is None:
             continue
-        rows = payload.get("tickers") if isinstance(payload, dict) else []
-        if not isinstance(rows, list):
-            continue
-        for raw in rows:
-            if not isinstance(raw, dict):
-                continue
-            normalized = _normalize_massive_snapshot(raw)
-            if normalized:
-                out[normalized["symbol"]] = normalized
-    return out
+        answered.update(batch)
+        out.update(rows)
+    return out, answered
 
 
 def get_realtime_stock_snapshots(symbols: list[str]) -> dict[str, dict[str, Any]]:
     """
     Fetch current stock snapshots from Massive.com.
 
-    Returns an empty mapping when MASSIVE_API_KEY/POLYGON_API_KEY is unavailable
-    or the snapshot request fails. Callers should treat volume as unavailable.
+    Fresh entries from the optional websocket feed (MASSIVE_STREAM_ENABLED) are
+    used first. Snapshots are cached per symbol for MASSIVE_SNAPSHOT_CACHE_TTL_SECONDS,
+    so a request only fetches symbols that are missing or stale. Returns an empty
+    mapping when MASSIVE_API_KEY/POLYGON_API_KEY is unavailable or the snapshot
+    request fails. Callers should treat volume as unavailable.
     """
     clean_symbols = sorted({_clean_symbol(symbol).replace(".", "-") for symbol in symbols if _clean_symbol(symbol)})
     if not clean_symbols:
         return {}
-    bucket = _cache_bucket_seconds("MASSIVE_SNAPSHOT_CACHE_TTL_SECONDS", 45)
-    return _get_massive_stock_snapshots_cached(",".join(clean_symbols), bucket)
+    out: dict[str, dict[str, Any]] = get_stream_snapshots(clean_symbols)
+    if not _massive_api_key():
+        return out
+    ttl = _env_int("MASSIVE_SNAPSHOT_CACHE_TTL_SECONDS", 45, minimum=15)
+    now = time.monotonic()
+    stale: list[str] = []
+    with _SNAPSHOT_CACHE_LOCK:
+        for symbol in clean_symbols:
+            if symbol in out:
+                continue
+            entry = _SNAPSHOT_CACHE.get(symbol)
+            if entry is None or now - entry[0] >= ttl:
+                stale.append(symbol)
+            elif entry[1] is not None:
+                out[symbol] = entry[1]
+    if not stale:
+        return out
+
+    fetched, answered = _fetch_massive_stock_snapshots(stale)
+    fetched_at = time.monotonic()
+    with _SNAPSHOT_CACHE_LOCK:
+        for symbol in answered:
+            _SNAPSHOT_CACHE[symbol] = (fetched_at, fetched.get(symbol))
+        if len(_SNAPSHOT_CACHE) > 20000:
+            expired = [symbol for symbol, entry in _SNAPSHOT_CACHE.items() if fetched_at - entry[0] >= ttl]
+            for symbol in expired:
+                _SNAPSHOT_CACHE.pop(symbol, None)
+    out.update(fetched)
+    return out
 
 
 @lru_cache(maxsize=512)
@@ -514,7 +588,8 @@ def get_finviz_data(symbol: str) -> dict[str, Any] | None:
         return None
 
     try:
-        resp = _SESSION.get(
+        resp = _session_get(
+            "finviz",
             f"https://finviz.com/quote.ashx?t={symbol}",
             timeout=REQUEST_TIMEOUT,
         )
@@ -561,12 +636,21 @@ def get_finviz_data(symbol: str) -> dict[str, Any] | None:
         return None
 
 
+def benchmark_symbol() -> str:
+    return str(os.getenv("AI_MARKET_INDICATOR", "QQQ")).strip().upper() or "QQQ"
+
+
+def get_benchmark_bars(symbol: str | None = None) -> pd.DataFrame | None:
+    """Daily benchmark bars in the one shape every caller uses, so the cached frame is shared."""
+    return get_stock_data(symbol or benchmark_symbol(), period="15mo", auto_adjust=False)
+
+
 def get_market_condition() -> dict[str, Any]:
     """Evaluate broad market regime from the configured benchmark trend structure."""
     from core.indicators import calculate_indicators
 
-    benchmark = (str(os.getenv("AI_MARKET_INDICATOR", "QQQ")).strip().upper() or "QQQ")
-    df = get_stock_data(benchmark)
+    benchmark = benchmark_symbol()
+    df = get_benchmark_bars(benchmark)
     if df is None:
         return {
             "status": "unknown",
@@ -619,7 +703,7 @@ def get_fear_greed_index() -> dict[str, Any]:
     We keep a strict fallback shape to avoid runtime branching in callers.
     """
     try:
-        resp = _SESSION.get("https://api.alternative.me/fng/?limit=1", timeout=REQUEST_TIMEOUT)
+        resp = _session_get("fear_greed", "https://api.alternative.me/fng/?limit=1", timeout=REQUEST_TIMEOUT)
         if resp.status_code == 200:
             payload = resp.json()
             data = (payload.get("data") or [{}])[0]
@@ -664,10 +748,14 @@ def get_fear_greed_index() -> dict[str, Any]:
 
 
 __all__ = [
+    "benchmark_symbol",
+    "get_benchmark_bars",
     "get_stock_data",
     "get_realtime_stock_snapshots",
     "get_stock_info",
     "get_finviz_data",
     "get_market_condition",
     "get_fear_greed_index",
+    "http_pool_size",
+    "shared_session",
 ]
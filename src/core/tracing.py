@@ -0,0 +1,202 @@
+"""
+Lightweight span tracing for the analysis pipeline.
+
+``span(name, **attrs)`` times a block and links it to the enclosing span via a
+context variable, so nested calls form a tree per trace. Spans always measure
+their duration (callers read ``duration_sec``); they are only recorded when
+``AUTOSTOCK_TRACE_PATH`` points at a JSONL file. Worker threads do not inherit
+the current span, so callables handed to an executor go through ``bind``.
+``export_chrome_trace`` converts the JSONL file into the Chrome trace-event
+format (chrome://tracing, Perfetto).
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import wraps
+from pathlib import Path
+from typing import Any, Callable, Iterator
+
+
+_CURRENT: ContextVar["Span | None"] = ContextVar("autostock_trace_span", default=None)
+_WRITE_LOCK = threading.Lock()
+
+
+def _s(value: Any) -> str:
+    return str(value or "").strip()
+
+
+def trace_path() -> Path | None:
+    raw = _s(os.getenv("AUTOSTOCK_TRACE_PATH"))
+    return Path(raw) if raw else None
+
+
+def tracing_enabled() -> bool:
+    return trace_path() is not None
+
+
+def _new_id() -> str:
+    return uuid.uuid4().hex[:16]
+
+
+class Span:
+    __slots__ = ("name", "trace_id", "span_id", "parent_id", "attrs", "start_ns", "duration_sec", "_started")
+
+    def __init__(self, name: str, parent: "Span | None", attrs: dict[str, Any]) -> None:
+        self.name = name
+        self.trace_id = parent.trace_id if parent is not None else uuid.uuid4().hex
+        self.span_id = _new_id()
+        self.parent_id = parent.span_id if parent is not None else ""
+        self.attrs = dict(attrs)
+        self.start_ns = time.time_ns()
+        self.duration_sec = 0.0
+        self._started = time.perf_counter()
+
+    def set(self, **attrs: Any) -> None:
+        self.attrs.update(attrs)
+
+    def elapsed(self) -> float:
+        return time.perf_counter() - self._started
+
+    def to_dict(self, status: str, error: str = "") -> dict[str, Any]:
+        row = {
+            "trace_id": self.trace_id,
+            "span_id": self.span_id,
+            "parent_id": self.parent_id,
+            "name": self.name,
+            "start_ns": self.start_ns,
+            "duration_ms": round(self.duration_sec * 1000, 3),
+            "pid": os.getpid(),
+            "tid": threading.get_native_id(),
+            "thread": threading.current_thread().name,
+            "status": status,
+            "attrs": self.attrs,
+        }
+        if error:
+            row["error"] = error
+        return row
+
+
+def _record(row: dict[str, Any]) -> None:
+    path = trace_path()
+    if path is None:
+        return
+    line = json.dumps(row, ensure_ascii=False, default=str)
+    try:
+        with _WRITE_LOCK:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            with path.open("a", encoding="utf-8") as fh:
+                fh.write(line + "\n")
+    except Exception as exc:
+        print(f"[warn] trace write failed ({path}): {exc}")
+
+
+@contextmanager
+def span(name: str, **attrs: Any) -> Iterator[Span]:
+    current = Span(name, _CURRENT.get(), attrs)
+    token = _CURRENT.set(current)
+    status, error = "ok", ""
+    try:
+        yield current
+    except BaseException as exc:
+        status, error = "error", f"{type(exc).__name__}: {exc}"
+        raise
+    finally:
+        current.duration_sec = current.elapsed()
+        _CURRENT.reset(token)
+        if tracing_enabled():
+            _record(current.to_dict(status, error))
+
+
+def current_span() -> Span | None:
+    return _CURRENT.get()
+
+
+def bind(fn: Callable[..., Any]) -> Callable[..., Any]:
+    """Run ``fn`` under the span that is current now, e.g. inside an executor thread."""
+    parent = _CURRENT.get()
+    if parent is None:
+        return fn
+
+    @wraps(fn)
+    def _bound(*args: Any, **kwargs: Any) -> Any:
+        token = _CURRENT.set(parent)
+        try:
+            return fn(*args, **kwargs)
+        finally:
+            _CURRENT.reset(token)
+
+    return _bound
+
+
+def load_spans(path: str | Path) -> list[dict[str, Any]]:
+    rows: list[dict[str, Any]] = []
+    source = Path(path)
+    if not source.exists():
+        return rows
+    for line in source.read_text(encoding="utf-8").splitlines():
+        try:
+            row = json.loads(line)
+        except Exception:
+            continue
+        if isinstance(row, dict) and row.get("span_id"):
+            rows.append(row)
+    return rows
+
+
+def chrome_trace_events(rows: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    """Complete ("X") trace events in microseconds, one per recorded span."""
+    events: list[dict[str, Any]] = []
+    for row in rows:
+        args = dict(row.get("attrs") or {})
+        args.update({"trace_id": row.get("trace_id"), "span_id": row.get("span_id"), "parent_id": row.get("parent_id")})
+        if row.get("error"):
+            args["error"] = row.get("error")
+        events.append(
+            {
+                "name": _s(row.get("name")),
+                "cat": _s(row.get("name")).split(".", 1)[0] or "autostock",
+                "ph": "X",
+                "ts": int(row.get("start_ns") or 0) // 1000,
+                "dur": max(1, int(float(row.get("duration_ms") or 0.0) * 1000)),
+                "pid": int(row.get("pid") or 0),
+                "tid": int(row.get("tid") or 0),
+                "args": args,
+            }
+        )
+    events.sort(key=lambda item: (item["ts"], -item["dur"]))
+    return events
+
+
+def export_chrome_trace(source: str | Path | None = None, output: str | Path | None = None, trace_id: str = "") -> Path:
+    """Write ``source`` (default ``AUTOSTOCK_TRACE_PATH``) as ``<name>.chrome.json``; ``trace_id`` keeps one trace."""
+    source_path = Path(source) if source else trace_path()
+    if source_path is None:
+        raise ValueError("No trace file: pass a path or set AUTOSTOCK_TRACE_PATH")
+    rows = load_spans(source_path)
+    if trace_id:
+        rows = [row for row in rows if row.get("trace_id") == trace_id]
+    output_path = Path(output) if output else source_path.with_suffix(".chrome.json")
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    payload = {"traceEvents": chrome_trace_events(rows), "displayTimeUnit": "ms"}
+    output_path.write_text(json.dumps(payload, ensure_ascii=False, default=str) + "\n", encoding="utf-8")
+    return output_path
+
+
+__all__ = [
+    "Span",
+    "bind",
+    "chrome_trace_events",
+    "current_span",
+    "export_chrome_trace",
+    "load_spans",
+    "span",
+    "trace_path",
+    "tracing_enabled",
+]
@@ -10,6 +10,11 @@ from core.news_collectors import load_calendar_events, load_manual_events
 _DATA_COLLECTOR = DataCollector()
 
 
+def shared_data_collector() -> DataCollector:
+    """Collector (and its HTTP session pool) shared by event collection and the v2 pipeline."""
+    return _DATA_COLLECTOR
+
+
 def _s(value: Any) -> str:
     return str(value or "").strip()
 
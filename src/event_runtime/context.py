@@ -0,0 +1,124 @@
+from __future__ import annotations
+
+import os
+import time
+from datetime import date
+from threading import Lock
+from typing import Any
+
+from core.earnings_pit import EarningsEventStore
+from core.sec_pit import SecPointInTimeStore
+from pipelines.model_decisions import ModelDecisionMemo
+
+
+_PERIODIC_FORMS = {"10-Q", "10-K", "10-Q/A", "10-K/A"}
+
+
+def _s(value: Any) -> str:
+    return str(value or "").strip()
+
+
+def _env_int(key: str, default: int, minimum: int = 1, maximum: int | None = None) -> int:
+    try:
+        value = int(os.getenv(key, str(default)))
+    except Exception:
+        value = int(default)
+    value = max(minimum, value)
+    if maximum is not None:
+        value = min(maximum, value)
+    return value
+
+
+def _parse_day(value: Any) -> date | None:
+    try:
+        return date.fromisoformat(_s(value)[:10])
+    except Exception:
+        return None
+
+
+def _periodic_filings(event_feed: list[dict[str, Any]]) -> dict[str, date]:
+    """Latest 10-Q/10-K filing date per symbol seen in the SEC events of ``event_feed``."""
+    out: dict[str, date] = {}
+    for event in event_feed:
+        if not isinstance(event, dict) or _s(event.get("source")).lower() != "sec":
+            continue
+        tags = event.get("tags") if isinstance(event.get("tags"), list) else []
+        if not any(_s(tag).upper() in _PERIODIC_FORMS for tag in tags):
+            continue
+        symbol = _s(event.get("symbol")).upper()
+        filed = _parse_day(event.get("published_at"))
+        if symbol and filed is not None and (symbol not in out or filed > out[symbol]):
+            out[symbol] = filed
+    return out
+
+
+class RuntimeContext:
+    """Point-in-time stores kept alive across runtime loop cycles.
+
+    Stores are rebuilt when ``AI_PIT_STORE_TTL_MINUTES`` expires. Between rebuilds a cycle only
+    loads newly added symbols and re-fetches companyfacts / earnings for symbols whose SEC feed
+    shows a 10-Q/10-K filed after the data the store already holds. ``model_decisions`` lets a
+    cycle reuse the previous event-model decision for symbols whose inputs did not change.
+    """
+
+    def __init__(self, ttl_minutes: int | None = None) -> None:
+        self.ttl_seconds = 60 * (ttl_minutes or _env_int("AI_PIT_STORE_TTL_MINUTES", 360))
+        self._lock = Lock()
+        self._sec_store: SecPointInTimeStore | None = None
+        self._earnings_store: EarningsEventStore | None = None
+        self._symbols: set[str] = set()
+        self._loaded_at = 0.0
+        self._known_filings: dict[str, date] = {}
+        self.model_decisions = ModelDecisionMemo()
+
+    def _expired(self) -> bool:
+        return self._sec_store is None or self._earnings_store is None or time.monotonic() - self._loaded_at >= self.ttl_seconds
+
+    def pit_stores(
+        self,
+        watchlist: list[str],
+        event_feed: list[dict[str, Any]] | None = None,
+    ) -> tuple[SecPointInTimeStore, EarningsEventStore]:
+        symbols = {_s(symbol).upper() for symbol in watchlist if _s(symbol)}
+        filings = _periodic_filings(event_feed or [])
+        with self._lock:
+            if self._expired():
+                self._symbols = set(symbols)
+                self._sec_store = SecPointInTimeStore(sorted(symbols))
+                self._earnings_store = EarningsEventStore(sorted(symbols))
+                self._loaded_at = time.monotonic()
+                self._known_filings = {
+                    symbol: filed
+                    for symbol in symbols
+                    if (filed := self._sec_store.latest_filed(symbol)) is not None
+                }
+            sec_store = self._sec_store
+            earnings_store = self._earnings_store
+            assert sec_store is not None and earnings_store is not None
+
+            added = sorted(symbols - self._symbols)
+            if added:
+                sec_store.load_symbols(added)
+                earnings_store.load_symbols(added)
+                self._symbols |= set(added)
+                for symbol in added:
+                    filed = sec_store.latest_filed(symbol)
+                    if filed is not None:
+                        self._known_filings[symbol] = filed
+
+            stale = sorted(
+                symbol
+                for symbol, filed in filings.items()
+                if symbol in symbols and (symbol not in self._known_filings or filed > self._known_filings[symbol])
+            )
+            if stale:
+                print(f"pit store refresh for new filings: {', '.join(stale)}")
+                sec_store.load_symbols(stale, refresh=True)
+                earnings_store.load_symbols(stale, refresh=True)
+                for symbol in stale:
+                    # Remember the filing even if companyfacts has not caught up yet; the TTL rebuild retries.
+                    self._known_filings[symbol] = max(filings[symbol], sec_store.latest_filed(symbol) or filings[symbol])
+            return sec_store, earnings_store
+
+
+__all__ = ["RuntimeContext"]
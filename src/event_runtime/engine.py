@@ -6,9 +6,13 @@ from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any
 
+from core.market_calendar import RuntimeSchedule
+from core.tracing import span
 from event_profile import load_event_profile
+from event_runtime.context import RuntimeContext
 from event_runtime.notify import append_notifications
 from event_runtime.models import RuntimeNotification, RuntimeState
+from event_runtime.seen_index import SeenEventIndex, load_seen_event_index
 from event_runtime.state import load_runtime_state, save_runtime_state
 from pipelines.autostock_v2_pipeline import run_autostock_v2
 
@@ -41,6 +45,10 @@ def _outbox_path(profile: dict[str, Any]) -> Path:
     return _runtime_dir(profile) / "outbox.jsonl"
 
 
+def _seen_index_path(profile: dict[str, Any]) -> Path:
+    return _runtime_dir(profile) / "seen_events.bin"
+
+
 def _event_key(symbol: str, event: dict[str, Any]) -> str:
     return "|".join(
         [
@@ -104,11 +112,10 @@ def summarize_cycle_changes(
     payload: dict[str, Any],
     previous_state: RuntimeState,
     created_at: str,
+    seen_index: SeenEventIndex,
 ) -> tuple[list[RuntimeNotification], RuntimeState]:
     notifications: list[RuntimeNotification] = []
     next_actions = dict(previous_state.last_actions)
-    seen_event_keys = list(previous_state.seen_event_keys)
-    seen_set = set(seen_event_keys)
 
     recommendations = payload.get("recommendations", []) if isinstance(payload, dict) else []
     for row in recommendations if isinstance(recommendations, list) else []:
@@ -135,19 +142,15 @@ def summarize_cycle_changes(
         for event in raw_events if isinstance(raw_events, list) else []:
             if not isinstance(event, dict):
                 continue
-            key = _event_key(symbol, event)
-            if key in seen_set:
+            if not seen_index.add(_event_key(symbol, event)):
                 continue
-            seen_set.add(key)
-            seen_event_keys.append(key)
             notifications.append(_notification_for_new_event(profile_name, symbol, created_at, event))
 
-    trimmed_seen = seen_event_keys[-500:]
     next_state = RuntimeState(
         profile=profile_name,
         last_run_at=created_at,
         last_actions=next_actions,
-        seen_event_keys=trimmed_seen,
+        seen_event_count=len(seen_index),
     )
     return notifications, next_state
 
@@ -157,6 +160,7 @@ def persist_runtime_cycle(
     payload: dict[str, Any],
     notifications: list[RuntimeNotification],
     state: RuntimeState,
+    seen_index: SeenEventIndex | None = None,
 ) -> dict[str, str]:
     runtime_dir = _runtime_dir(profile)
     runtime_dir.mkdir(parents=True, exist_ok=True)
@@ -167,6 +171,10 @@ def persist_runtime_cycle(
     outbox_path = _outbox_path(profile)
     append_notifications(outbox_path, notifications)
 
+    seen_index_path = _seen_index_path(profile)
+    if seen_index is not None:
+        seen_index.save(seen_index_path)
+
     state_path = _state_path(profile)
     save_runtime_state(state_path, state)
     return {
@@ -174,6 +182,7 @@ def persist_runtime_cycle(
         "payload_path": str(payload_path),
         "outbox_path": str(outbox_path),
         "state_path": str(state_path),
+        "seen_index_path": str(seen_index_path),
     }
 
 
@@ -183,53 +192,81 @@ def run_runtime_cycle(
     watchlist_override: list[str] | None = None,
     event_feed_path: str | None = None,
     rss_urls: list[str] | None = None,
+    context: RuntimeContext | None = None,
+    market_inputs: dict[str, Any] | None = None,
 ) -> dict[str, Any]:
-    profile = load_event_profile(profile_name)
-    profile_name_resolved = _profile_name(profile)
-    resolved_watchlist = watchlist_override or list(profile.get("symbols", []))
-    resolved_event_file = event_feed_path or (_s(profile.get("event_file")) or None)
-    resolved_rss = rss_urls or list(profile.get("rss_urls", []))
-
-    payload_result = run_autostock_v2(
-        profile=profile,
-        watchlist_override=resolved_watchlist,
-        event_feed_path=resolved_event_file,
-        rss_urls=resolved_rss,
-    )
-    payload = payload_result.get("payload", {}) if isinstance(payload_result, dict) else {}
-    now_iso = datetime.now(timezone.utc).isoformat()
-    state = load_runtime_state(_state_path(profile), profile_name_resolved)
-    notifications, next_state = summarize_cycle_changes(
-        profile_name=profile_name_resolved,
-        payload=payload if isinstance(payload, dict) else {},
-        previous_state=state,
-        created_at=now_iso,
-    )
-    paths = persist_runtime_cycle(profile, payload if isinstance(payload, dict) else {}, notifications, next_state)
-    return {
-        "profile": profile_name_resolved,
-        "payload_result": payload_result,
-        "payload": payload,
-        "notifications": [item.to_dict() for item in notifications],
-        "notification_count": len(notifications),
-        "state": next_state.to_dict(),
-        **paths,
-    }
+    with span("runtime.cycle", profile=profile_name or "") as cycle:
+        profile = load_event_profile(profile_name)
+        profile_name_resolved = _profile_name(profile)
+        cycle.set(profile=profile_name_resolved)
+        resolved_watchlist = watchlist_override or list(profile.get("symbols", []))
+        resolved_event_file = event_feed_path or (_s(profile.get("event_file")) or None)
+        resolved_rss = rss_urls or list(profile.get("rss_urls", []))
+
+        payload_result = run_autostock_v2(
+            profile=profile,
+            watchlist_override=resolved_watchlist,
+            event_feed_path=resolved_event_file,
+            rss_urls=resolved_rss,
+            context=context,
+            market_inputs=market_inputs,
+        )
+        payload = payload_result.get("payload", {}) if isinstance(payload_result, dict) else {}
+        now_iso = datetime.now(timezone.utc).isoformat()
+        state = load_runtime_state(_state_path(profile), profile_name_resolved)
+        seen_index = load_seen_event_index(_seen_index_path(profile), legacy_state_path=_state_path(profile))
+        notifications, next_state = summarize_cycle_changes(
+            profile_name=profile_name_resolved,
+            payload=payload if isinstance(payload, dict) else {},
+            previous_state=state,
+            created_at=now_iso,
+            seen_index=seen_index,
+        )
+        paths = persist_runtime_cycle(
+            profile,
+            payload if isinstance(payload, dict) else {},
+            notifications,
+            next_state,
+            seen_index=seen_index,
+        )
+        cycle.set(notifications=len(notifications))
+        return {
+            "profile": profile_name_resolved,
+            "payload_result": payload_result,
+            "payload": payload,
+            "notifications": [item.to_dict() for item in notifications],
+            "notification_count": len(notifications),
+            "state": next_state.to_dict(),
+            **paths,
+        }
+
+
+def sleep_until_next_cycle(schedule: RuntimeSchedule | None, interval_seconds: int | None) -> None:
+    if schedule is None:
+        time.sleep(max(5, int(interval_seconds or 0)))
+        return
+    phase, sleep_sec = schedule.next_sleep_seconds()
+    print(f"[{datetime.now()}] runtime phase={phase}, next cycle in {sleep_sec:.0f}s")
+    time.sleep(sleep_sec)
 
 
 def run_runtime_loop(
     *,
     profile_name: str | None = None,
-    interval_seconds: int = 60,
+    interval_seconds: int | None = None,
     max_cycles: int | None = None,
 ) -> dict[str, Any]:
+    """Run cycles forever (or ``max_cycles``); a fixed ``interval_seconds`` overrides the market-phase schedule."""
     cycles = 0
     last_result: dict[str, Any] = {}
+    context = RuntimeContext()
+    schedule = RuntimeSchedule() if interval_seconds is None else None
     while True:
-        last_result = run_runtime_cycle(profile_name=profile_name)
+        last_result = run_runtime_cycle(profile_name=profile_name, context=context)
         cycles += 1
         if max_cycles is not None and cycles >= int(max_cycles):
             break
-        time.sleep(max(5, int(interval_seconds)))
+        sleep_until_next_cycle(schedule, interval_seconds)
     last_result["cycles"] = cycles
+    last_result["model_decisions"] = context.model_decisions.stats()
     return last_result
@@ -0,0 +1,107 @@
+from __future__ import annotations
+
+import os
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import Any
+
+from core.market_calendar import RuntimeSchedule
+from event_runtime.context import RuntimeContext
+from event_runtime.engine import run_runtime_cycle, sleep_until_next_cycle
+from pipelines.autostock_v2_pipeline import load_market_inputs
+
+
+def _s(value: Any) -> str:
+    return str(value or "").strip()
+
+
+def _env_int(key: str, default: int, minimum: int = 1, maximum: int | None = None) -> int:
+    try:
+        value = int(os.getenv(key, str(default)))
+    except Exception:
+        value = int(default)
+    value = max(minimum, value)
+    if maximum is not None:
+        value = min(maximum, value)
+    return value
+
+
+def parse_profile_names(raw: str | list[str] | None) -> list[str]:
+    parts = raw if isinstance(raw, list) else _s(raw).replace(";", ",").split(",")
+    out: list[str] = []
+    for part in parts:
+        name = _s(part)
+        if name and name not in out:
+            out.append(name)
+    return out
+
+
+class RuntimeHost:
+    """Runs several event profiles per cycle in one process.
+
+    Profiles share the PIT stores / model decision memo (one ``RuntimeContext``), the process-wide
+    data collector and HTTP session pool, and one market condition + fear/greed computation per
+    cycle. Each profile still writes its own ``state.json`` / ``outbox.jsonl``, and a failing
+    profile does not stop the others.
+    """
+
+    def __init__(self, profile_names: list[str], *, max_workers: int | None = None) -> None:
+        if not profile_names:
+            raise ValueError("RuntimeHost needs at least one profile")
+        self.profile_names = list(profile_names)
+        self.max_workers = max_workers or _env_int("AI_RUNTIME_PROFILE_WORKERS", 4, maximum=16)
+        self.context = RuntimeContext()
+
+    def run_cycle(self) -> dict[str, dict[str, Any]]:
+        market_inputs = load_market_inputs()
+        workers = min(len(self.profile_names), self.max_workers)
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="runtime-profile") as executor:
+            futures = {
+                name: executor.submit(
+                    run_runtime_cycle,
+                    profile_name=name,
+                    context=self.context,
+                    market_inputs=market_inputs,
+                )
+                for name in self.profile_names
+            }
+        results: dict[str, dict[str, Any]] = {}
+        for name, future in futures.items():
+            try:
+                results[name] = future.result()
+            except Exception as exc:
+                print(f"[{datetime.now()}] runtime profile {name} failed: {type(exc).__name__}: {exc}")
+                results[name] = {"profile": name, "error": f"{type(exc).__name__}: {exc}"}
+        return results
+
+    def run_forever(self, *, interval_seconds: int | None = None, max_cycles: int | None = None) -> dict[str, Any]:
+        cycles = 0
+        last_results: dict[str, dict[str, Any]] = {}
+        schedule = RuntimeSchedule() if interval_seconds is None else None
+        while True:
+            last_results = self.run_cycle()
+            cycles += 1
+            if max_cycles is not None and cycles >= int(max_cycles):
+                break
+            sleep_until_next_cycle(schedule, interval_seconds)
+        return {
+            "profiles": last_results,
+            "cycles": cycles,
+            "model_decisions": self.context.model_decisions.stats(),
+        }
+
+
+def run_runtime_host(
+    profile_names: list[str],
+    *,
+    loop: bool = False,
+    interval_seconds: int | None = None,
+    max_cycles: int | None = None,
+) -> dict[str, Any]:
+    host = RuntimeHost(profile_names)
+    if not loop:
+        return {"profiles": host.run_cycle(), "cycles": 1}
+    return host.run_forever(interval_seconds=interval_seconds, max_cycles=max_cycles)
+
+
+__all__ = ["RuntimeHost", "parse_profile_names", "run_runtime_host"]
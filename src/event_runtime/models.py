@@ -9,7 +9,7 @@ class RuntimeState:
     profile: str
     last_run_at: str | None = None
     last_actions: dict[str, str] = field(default_factory=dict)
-    seen_event_keys: list[str] = field(default_factory=list)
+    seen_event_count: int = 0
 
     def to_dict(self) -> dict[str, Any]:
         return asdict(self)
@@ -0,0 +1,123 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import struct
+import time
+from collections import deque
+from pathlib import Path
+from typing import Any
+
+
+_MAGIC = b"SEEN1\x00\x00\x00"
+_HEADER = struct.Struct("<8sII")
+_ENTRY = struct.Struct("<QI")
+
+
+def _env_int(key: str, default: int, minimum: int = 1, maximum: int | None = None) -> int:
+    try:
+        value = int(os.getenv(key, str(default)))
+    except Exception:
+        value = int(default)
+    value = max(minimum, value)
+    if maximum is not None:
+        value = min(maximum, value)
+    return value
+
+
+def event_key_hash(key: str) -> int:
+    return int.from_bytes(hashlib.blake2b(key.encode("utf-8"), digest_size=8).digest(), "little")
+
+
+class SeenEventIndex:
+    """Time-windowed set of 64-bit event key hashes.
+
+    Entries live in insertion order in a ring buffer (for expiry) mirrored by a set (for O(1)
+    membership). A key stays "seen" for ``window_days`` after it was first recorded, up to
+    ``max_keys`` entries. The sidecar is a fixed-width binary file: a header plus one
+    ``(hash, first_seen_epoch)`` record per entry.
+    """
+
+    def __init__(self, *, window_days: int | None = None, max_keys: int | None = None) -> None:
+        self.window_seconds = 86400 * (window_days or _env_int("AI_RUNTIME_SEEN_WINDOW_DAYS", 45, maximum=3650))
+        self.max_keys = max_keys or _env_int("AI_RUNTIME_SEEN_MAX_KEYS", 50000, minimum=100)
+        self._ring: deque[tuple[int, int]] = deque()
+        self._hashes: set[int] = set()
+        self.dirty = False
+
+    def __len__(self) -> int:
+        return len(self._hashes)
+
+    def __contains__(self, key: str) -> bool:
+        return event_key_hash(key) in self._hashes
+
+    def _expire(self, now: int) -> None:
+        cutoff = now - self.window_seconds
+        while self._ring and (self._ring[0][1] < cutoff or len(self._ring) > self.max_keys):
+            key_hash, _ = self._ring.popleft()
+            self._hashes.discard(key_hash)
+            self.dirty = True
+
+    def add(self, key: str, now: float | None = None) -> bool:
+        """Record ``key``; True when it was not already seen inside the window."""
+        stamp = int(now if now is not None else time.time())
+        key_hash = event_key_hash(key)
+        if key_hash in self._hashes:
+            return False
+        self._ring.append((key_hash, stamp))
+        self._hashes.add(key_hash)
+        self.dirty = True
+        self._expire(stamp)
+        return True
+
+    def save(self, path: Path) -> None:
+        if not self.dirty and path.exists():
+            return
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(path.suffix + ".tmp")
+        with tmp_path.open("wb") as fh:
+            fh.write(_HEADER.pack(_MAGIC, len(self._ring), self.window_seconds))
+            fh.write(b"".join(_ENTRY.pack(key_hash, stamp) for key_hash, stamp in self._ring))
+        tmp_path.replace(path)
+        self.dirty = False
+
+    def load(self, path: Path) -> bool:
+        try:
+            raw = path.read_bytes()
+            magic, count, _window = _HEADER.unpack_from(raw, 0)
+        except Exception:
+            return False
+        if magic != _MAGIC or len(raw) < _HEADER.size + count * _ENTRY.size:
+            return False
+        self._ring.clear()
+        self._hashes.clear()
+        for key_hash, stamp in _ENTRY.iter_unpack(raw[_HEADER.size : _HEADER.size + count * _ENTRY.size]):
+            if key_hash not in self._hashes:
+                self._ring.append((key_hash, stamp))
+                self._hashes.add(key_hash)
+        self._expire(int(time.time()))
+        return True
+
+
+def _legacy_seen_keys(state_path: Path) -> list[str]:
+    try:
+        payload: Any = json.loads(state_path.read_text(encoding="utf-8"))
+    except Exception:
+        return []
+    keys = payload.get("seen_event_keys") if isinstance(payload, dict) else None
+    return [str(item) for item in keys if str(item).strip()] if isinstance(keys, list) else []
+
+
+def load_seen_event_index(path: Path, legacy_state_path: Path | None = None) -> SeenEventIndex:
+    """Load the sidecar; without one, seed it from the old ``seen_event_keys`` list in ``state.json``."""
+    index = SeenEventIndex()
+    if index.load(path) or legacy_state_path is None:
+        return index
+    now = time.time()
+    for key in _legacy_seen_keys(legacy_state_path):
+        index.add(key, now)
+    return index
+
+
+__all__ = ["SeenEventIndex", "event_key_hash", "load_seen_event_index"]
@@ -24,11 +24,7 @@ def load_runtime_state(path: str | Path, profile: str) -> RuntimeState:
             for key, value in (payload.get("last_actions") or {}).items()
             if str(key).strip()
         },
-        seen_event_keys=[
-            str(item)
-            for item in (payload.get("seen_event_keys") or [])
-            if str(item).strip()
-        ],
+        seen_event_count=int(payload.get("seen_event_count") or len(payload.get("seen_event_keys") or [])),
     )
 
 
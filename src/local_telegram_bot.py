@@ -3,14 +3,40 @@ from __future__ import annotations
 import json
 import os
 import time
-from concurrent.futures import Future, ThreadPoolExecutor
+from concurrent.futures import Future
+from html import escape
 from pathlib import Path
 from threading import RLock
-from typing import Any
-
-import requests
-
-from local_telegram_journal import evaluate_shadow_journal, record_recommendation_run, render_journal_html
+from typing import Any, Callable
+
+from local_telegram_jobs import (
+    PRIORITY_FULL,
+    PRIORITY_JOURNAL,
+    PRIORITY_QUICK,
+    PRIORITY_WARM,
+    SUBMIT_ATTACHED,
+    SUBMIT_COALESCED,
+    SUBMIT_QUEUED,
+    SUBMIT_REJECTED,
+    SUBMIT_SUPERSEDED,
+    AnalysisJobQueue,
+    JobEvictedError,
+    JobWaiter,
+)
+from local_telegram_journal import (
+    evaluate_shadow_journal,
+    journal_table_is_stale,
+    record_recommendation_run,
+    render_journal_html,
+)
+from local_telegram_journal_analytics import (
+    load_journal_table,
+    parse_journal_query,
+    query_condition_stats,
+    render_condition_query_html,
+)
+from local_telegram_transport import TelegramTransport
+from local_telegram_warmup import WarmCacheScheduler, run_warm_analysis
 from local_telegram_trade import (
     analyze_rebalance_universe,
     full_news_analysis_limit,
@@ -32,6 +58,17 @@ def _env_bool(key: str, default: bool) -> bool:
     return raw in {"1", "true", "yes", "on", "y"}
 
 
+def _env_int(key: str, default: int, minimum: int = 1, maximum: int | None = None) -> int:
+    try:
+        value = int(os.getenv(key, str(default)))
+    except Exception:
+        value = int(default)
+    value = max(minimum, value)
+    if maximum is not None:
+        value = min(maximum, value)
+    return value
+
+
 class LocalTelegramBot:
     def __init__(self) -> None:
         token = _s(os.getenv("TELEGRAM_BOT_TOKEN"))
@@ -39,12 +76,18 @@ class LocalTelegramBot:
             raise RuntimeError("TELEGRAM_BOT_TOKEN is required")
         self.token = token
         self.base_url = f"https://api.telegram.org/bot{token}"
-        self.session = requests.Session()
-        self.api_lock = RLock()
+        self.transport = TelegramTransport(
+            self.base_url,
+            poll_timeout=_env_int("TELEGRAM_POLL_TIMEOUT_SEC", 30, minimum=1, maximum=50),
+            pool_size=_env_int("TELEGRAM_HTTP_POOL_SIZE", 8, minimum=2, maximum=64),
+        )
         self.state_lock = RLock()
-        self.analysis_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="telegram-analysis")
-        self.analysis_future: Future[Any] | None = None
+        self.analysis_jobs = AnalysisJobQueue(
+            max_pending=_env_int("TELEGRAM_ANALYSIS_QUEUE_MAX", 6, minimum=1, maximum=50),
+            workers=_env_int("TELEGRAM_ANALYSIS_WORKERS", 2, minimum=1, maximum=4),
+        )
         self.state = self._load_state()
+        self.warm_cache = WarmCacheScheduler(self._submit_warmup)
 
     def _load_state(self) -> dict[str, Any]:
         if not STATE_PATH.exists():
@@ -65,24 +108,7 @@ class LocalTelegramBot:
             self._save_state()
 
     def _api(self, method: str, payload: dict[str, Any]) -> dict[str, Any]:
-        with self.api_lock:
-            response = self.session.post(
-                f"{self.base_url}/{method}",
-                json=payload,
-                timeout=60,
-            )
-        try:
-            response.raise_for_status()
-        except requests.HTTPError:
-            try:
-                payload_json = response.json()
-            except Exception:
-                raise
-            description = _s(payload_json.get("description")).lower()
-            if response.status_code == 400 and "message is not modified" in description:
-                return {"ok": True, "result": None}
-            raise
-        return response.json()
+        return self.transport.call(method, payload)
 
     def send_message(
         self,
@@ -91,7 +117,7 @@ class LocalTelegramBot:
         reply_to_message_id: int | None = None,
         reply_markup: dict[str, Any] | None = None,
         parse_mode: str = "HTML",
-    ) -> None:
+    ) -> Future:
         payload: dict[str, Any] = {
             "chat_id": chat_id,
             "text": text,
@@ -102,7 +128,7 @@ class LocalTelegramBot:
             payload["reply_to_message_id"] = reply_to_message_id
         if reply_markup is not None:
             payload["reply_markup"] = reply_markup
-        self._api("sendMessage", payload)
+        return self.transport.enqueue(chat_id, "sendMessage", payload)
 
     def edit_message(
         self,
@@ -111,7 +137,7 @@ class LocalTelegramBot:
         text: str,
         reply_markup: dict[str, Any] | None = None,
         parse_mode: str = "HTML",
-    ) -> None:
+    ) -> Future:
         payload: dict[str, Any] = {
             "chat_id": chat_id,
             "message_id": message_id,
@@ -121,7 +147,7 @@ class LocalTelegramBot:
         }
         if reply_markup is not None:
             payload["reply_markup"] = reply_markup
-        self._api("editMessageText", payload)
+        return self.transport.enqueue(chat_id, "editMessageText", payload)
 
     def answer_callback(self, callback_query_id: str, text: str = "") -> None:
         payload: dict[str, Any] = {"callback_query_id": callback_query_id}
@@ -129,16 +155,10 @@ class LocalTelegramBot:
             payload["text"] = text
         self._api("answerCallbackQuery", payload)
 
-    def get_updates(self) -> list[dict[str, Any]]:
-        payload: dict[str, Any] = {
-            "timeout": 30,
-            "allowed_updates": ["message", "callback_query"],
-        }
-        if self.state.get("offset") is not None:
-            payload["offset"] = int(self.state["offset"])
-        response = self._api("getUpdates", payload)
-        rows = response.get("result")
-        return rows if isinstance(rows, list) else []
+    def _offset(self) -> int | None:
+        with self.state_lock:
+            offset = self.state.get("offset")
+        return int(offset) if offset is not None else None
 
     def _main_reply_keyboard(self) -> dict[str, Any]:
         return {
@@ -163,6 +183,7 @@ class LocalTelegramBot:
                 "/trade  빠른 요약",
                 "/tradefull  all_us 전체 뉴스/Codex 풀분석",
                 "/journal  추천 체결/성과 기록 평가",
+                "/journal rr1_ge_1 by=regime since=2026-01-01  조건별 체결/TP1/손절률 조회",
                 "/refresh  캐시 무시하고 다시 계산",
                 "/menu  메인 메뉴",
                 "",
@@ -269,9 +290,6 @@ class LocalTelegramBot:
     def _render_payload(self, mode: str, payload: dict[str, Any], view: str = "summary") -> str:
         return render_trade_view_html(payload, view=view)
 
-    def _analysis_busy(self) -> bool:
-        return self.analysis_future is not None and not self.analysis_future.done()
-
     def _mark_last_mode(self, mode: str) -> None:
         with self.state_lock:
             self.state["last_mode"] = mode
@@ -280,75 +298,117 @@ class LocalTelegramBot:
     def _busy_text(self) -> str:
         return "\n".join(
             [
-                "<b>분석 작업이 이미 실행 중입니다.</b>",
+                "<b>분석 대기열이 가득 찼습니다.</b>",
                 "",
-                "전체 뉴스/차트 분석은 오래 걸릴 수 있어서 동시에 1개만 돌립니다.",
-                "완료되면 이 채팅방에 결과가 자동으로 올라옵니다.",
+                "전체 뉴스/차트 분석은 오래 걸려서 대기열 길이를 제한합니다.",
+                "앞선 분석이 끝난 뒤 다시 요청해주세요.",
             ]
         )
 
-    def _submit_analysis(
+    def _shared_job_text(self, status: str) -> str:
+        head = "같은 분석이 이미 실행 중입니다." if status == SUBMIT_ATTACHED else "같은 분석이 이미 대기 중입니다."
+        return "\n".join(
+            [
+                f"<b>{head}</b>",
+                "",
+                "중복 실행하지 않고 완료되면 이 채팅방에도 같은 결과를 보내드립니다.",
+            ]
+        )
+
+    def _job_waiter(
         self,
         chat_id: int,
-        message_id: int,
-        mode: str,
-        force_refresh: bool,
+        message_id: int | None,
         *,
-        trigger: str,
         edit_message_id: int | None = None,
-    ) -> None:
-        if self._analysis_busy():
+        label: str = "",
+    ) -> JobWaiter:
+        def _deliver(text: str) -> Future:
             if edit_message_id is not None:
-                self.edit_message(chat_id, edit_message_id, self._busy_text())
+                return self.edit_message(chat_id, edit_message_id, text)
+            return self.send_message(
+                chat_id,
+                text,
+                reply_to_message_id=message_id,
+                reply_markup=self._main_reply_keyboard(),
+            )
+
+        def _on_error_sent(future: Future) -> None:
+            send_exc = future.exception()
+            if send_exc is not None:
+                print(f"telegram analysis error send failed: {type(send_exc).__name__}: {send_exc}")
+
+        def _on_error(exc: BaseException) -> None:
+            if isinstance(exc, JobEvictedError):
+                text = f"요청이 취소됐습니다. {exc} 잠시 후 다시 요청해주세요."
             else:
-                self.send_message(
-                    chat_id,
-                    self._busy_text(),
-                    reply_to_message_id=message_id,
-                    reply_markup=self._main_reply_keyboard(),
-                )
-            return
+                text = f"분석 실패: {type(exc).__name__}: {exc}"
+            _deliver(text).add_done_callback(_on_error_sent)
+
+        return JobWaiter(on_result=_deliver, on_error=_on_error, label=label or str(chat_id))
+
+    def _analysis_job_key(self, mode: str) -> str:
+        return f"trade:{mode}"
+
+    def _analysis_job(self, mode: str, load_payload: Callable[[], dict[str, Any]], *, trigger: str) -> Callable[[], str]:
+        """Job body shared by user and warm-up runs: every payload that reaches a chat is journaled.
+
+        Only user-triggered runs update ``last_mode``, so a scheduled warm-up never changes what
+        "새로고침" re-runs.
+        """
 
-        def _job() -> None:
+        def _job() -> str:
             job_started = time.perf_counter()
-            print(f"telegram analysis job started: mode={mode} force_refresh={force_refresh} trigger={trigger}")
+            print(f"telegram analysis job started: mode={mode} trigger={trigger}")
             try:
-                payload = self._run_analysis_payload(mode, force_refresh)
-                self._record_payload(mode, payload, trigger=trigger)
-                self._mark_last_mode(mode)
-                rendered = self._render_payload(mode, payload, view="summary")
-                if edit_message_id is not None:
-                    self.edit_message(chat_id, edit_message_id, rendered)
-                else:
-                    self.send_message(
-                        chat_id,
-                        rendered,
-                        reply_to_message_id=message_id,
-                        reply_markup=self._main_reply_keyboard(),
-                    )
-                print(
-                    "telegram analysis job finished: "
-                    f"mode={mode} available={bool(payload.get('available'))} "
-                    f"elapsed={time.perf_counter() - job_started:.2f}s"
-                )
+                payload = load_payload()
             except Exception as exc:
-                error_text = f"분석 실패: {type(exc).__name__}: {exc}"
-                print(f"telegram analysis job error: {error_text}")
-                try:
-                    if edit_message_id is not None:
-                        self.edit_message(chat_id, edit_message_id, error_text)
-                    else:
-                        self.send_message(
-                            chat_id,
-                            error_text,
-                            reply_to_message_id=message_id,
-                            reply_markup=self._main_reply_keyboard(),
-                        )
-                except Exception as send_exc:
-                    print(f"telegram analysis error send failed: {type(send_exc).__name__}: {send_exc}")
-
-        print(f"telegram analysis queued: mode={mode} force_refresh={force_refresh} trigger={trigger}")
-        self.analysis_future = self.analysis_executor.submit(_job)
+                print(f"telegram analysis job error: {type(exc).__name__}: {exc}")
+                raise
+            self._record_payload(mode, payload, trigger=trigger)
+            if trigger != "warmup":
+                self._mark_last_mode(mode)
+            rendered = self._render_payload(mode, payload, view="summary")
+            print(
+                "telegram analysis job finished: "
+                f"mode={mode} trigger={trigger} available={bool(payload.get('available'))} "
+                f"elapsed={time.perf_counter() - job_started:.2f}s"
+            )
+            return rendered
+
+        return _job
+
+    def _submit_analysis(
+        self,
+        chat_id: int,
+        message_id: int,
+        mode: str,
+        force_refresh: bool,
+        *,
+        trigger: str,
+        edit_message_id: int | None = None,
+    ) -> str:
+        key = self._analysis_job_key(mode)
+        status = self.analysis_jobs.submit(
+            key,
+            PRIORITY_FULL if mode == "f" else PRIORITY_QUICK,
+            self._analysis_job(mode, lambda: self._run_analysis_payload(mode, force_refresh), trigger=trigger),
+            self._job_waiter(chat_id, message_id, edit_message_id=edit_message_id),
+            supersede=force_refresh,
+            group="analysis",
+            label=f"{mode}:{trigger}",
+        )
+        print(f"telegram analysis {status}: mode={mode} force_refresh={force_refresh} trigger={trigger}")
+        return status
+
+    def _submit_warmup(self, mode: str) -> str:
+        return self.analysis_jobs.submit(
+            self._analysis_job_key(mode),
+            PRIORITY_WARM,
+            self._analysis_job(mode, lambda: run_warm_analysis(mode), trigger="warmup"),
+            group="analysis",
+            label=f"{mode}:warmup",
+        )
 
     def _record_payload(self, mode: str, payload: dict[str, Any], trigger: str) -> None:
         try:
@@ -356,37 +416,84 @@ class LocalTelegramBot:
         except Exception as exc:
             print(f"shadow journal record error: {type(exc).__name__}: {exc}")
 
-    def _reply_with_journal(self, chat_id: int, message_id: int | None = None) -> None:
-        payload = evaluate_shadow_journal()
-        self.send_message(
-            chat_id,
-            render_journal_html(payload),
-            reply_to_message_id=message_id,
-            reply_markup=self._main_reply_keyboard(),
+    def _journal_args(self, text: str) -> list[str]:
+        parts = text.split()
+        if not parts or not parts[0].lower().startswith("/journal"):
+            return []
+        return parts[1:]
+
+    def _reply_with_journal(self, chat_id: int, message_id: int | None = None, text: str = "") -> None:
+        args = self._journal_args(text)
+
+        def _job() -> str:
+            if not args:
+                return render_journal_html(evaluate_shadow_journal())
+            if journal_table_is_stale():
+                evaluate_shadow_journal()
+            query = parse_journal_query(args)
+            try:
+                rows = query_condition_stats(
+                    load_journal_table(),
+                    flags=query["flags"],
+                    group_by=query["group_by"],
+                    since=query["since"],
+                    until=query["until"],
+                )
+            except ValueError as exc:
+                return f"조회 조건 오류: {escape(str(exc))}"
+            return render_condition_query_html(query, rows)
+
+        status = self.analysis_jobs.submit(
+            "journal:" + " ".join(args) if args else "journal",
+            PRIORITY_JOURNAL,
+            _job,
+            self._job_waiter(chat_id, message_id),
+            group="journal",
+            label="journal",
         )
+        if status == SUBMIT_REJECTED:
+            self.send_message(
+                chat_id,
+                self._busy_text(),
+                reply_to_message_id=message_id,
+                reply_markup=self._main_reply_keyboard(),
+            )
 
-    def _wait_text(self, mode: str, force_refresh: bool) -> str:
+    def _wait_text(self, mode: str, force_refresh: bool, status: str = SUBMIT_QUEUED) -> str:
         prefix = "다시 계산 중입니다." if force_refresh else "분석 중입니다."
         suffix = (
             "all_us 전체를 차트 스캔 후 뉴스/Codex까지 풀분석 중입니다. 시간이 조금 걸릴 수 있습니다."
             if mode == "f"
             else "전체 후보를 차트+뉴스 기준으로 다시 분석 중입니다. 잠시만 기다려주세요."
         )
+        own_key = self._analysis_job_key(mode)
+        running = self.analysis_jobs.snapshot().get("running") or []
+        if status == SUBMIT_SUPERSEDED:
+            suffix += "\n진행 중이던 이전 분석 결과는 버리고, 그 분석이 끝나면 바로 새로 계산합니다."
+        elif any(str(key).startswith("trade:") and key != own_key for key in running):
+            suffix += "\n앞선 분석이 끝나면 바로 이어서 실행합니다."
         return f"{prefix}\n\n{suffix}"
 
     def _reply_with_analysis(self, chat_id: int, message_id: int, text: str) -> None:
         mode = self._analysis_mode(text)
         force_refresh = self._is_force_refresh(text)
-        if self._analysis_busy():
-            self._submit_analysis(chat_id, message_id, mode, force_refresh, trigger="message")
-            return
-        self.send_message(
-            chat_id,
-            self._wait_text(mode, force_refresh),
-            reply_to_message_id=message_id,
-            reply_markup=self._main_reply_keyboard(),
-        )
-        self._submit_analysis(chat_id, message_id, mode, force_refresh, trigger="message")
+        status = self._submit_analysis(chat_id, message_id, mode, force_refresh, trigger="message")
+        if status == SUBMIT_REJECTED:
+            self.send_message(chat_id, self._busy_text(), reply_to_message_id=message_id, reply_markup=self._main_reply_keyboard())
+        elif status in {SUBMIT_QUEUED, SUBMIT_SUPERSEDED}:
+            self.send_message(
+                chat_id,
+                self._wait_text(mode, force_refresh, status),
+                reply_to_message_id=message_id,
+                reply_markup=self._main_reply_keyboard(),
+            )
+        elif status in {SUBMIT_ATTACHED, SUBMIT_COALESCED}:
+            self.send_message(
+                chat_id,
+                self._shared_job_text(status),
+                reply_to_message_id=message_id,
+                reply_markup=self._main_reply_keyboard(),
+            )
 
     def _configure_bot_ui(self) -> None:
         commands = [
@@ -410,13 +517,18 @@ class LocalTelegramBot:
         chat_id = self.state.get("last_chat_id")
         if not chat_id or self.state.get("last_menu_bootstrap_version") == MENU_BOOTSTRAP_VERSION:
             return
-        try:
-            self.send_message(int(chat_id), self._menu_text(), reply_markup=self._main_reply_keyboard())
-            self.state["last_menu_bootstrap_version"] = MENU_BOOTSTRAP_VERSION
-            self._save_state()
+
+        def _on_sent(future: Future) -> None:
+            exc = future.exception()
+            if exc is not None:
+                print(f"startup menu push error: {type(exc).__name__}: {exc}")
+                return
+            with self.state_lock:
+                self.state["last_menu_bootstrap_version"] = MENU_BOOTSTRAP_VERSION
+                self._save_state()
             print(f"startup menu pushed: chat_id={chat_id}")
-        except Exception as exc:
-            print(f"startup menu push error: {type(exc).__name__}: {exc}")
+
+        self.send_message(int(chat_id), self._menu_text(), reply_markup=self._main_reply_keyboard()).add_done_callback(_on_sent)
 
     def _handle_callback(self, callback_query: dict[str, Any]) -> None:
         callback_id = _s(callback_query.get("id"))
@@ -457,7 +569,7 @@ class LocalTelegramBot:
             return
 
         if self._is_journal_request(text):
-            self._reply_with_journal(int(chat_id), message_id)
+            self._reply_with_journal(int(chat_id), message_id, text)
             return
 
         if self._is_removed_chart_request(text):
@@ -480,24 +592,20 @@ class LocalTelegramBot:
             reply_markup=self._main_reply_keyboard(),
         )
 
+    def _handle_polled_update(self, update: dict[str, Any]) -> None:
+        update_id = int(update.get("update_id") or 0)
+        if update_id:
+            with self.state_lock:
+                self.state["offset"] = update_id + 1
+                self._save_state()
+        self.handle_update(update)
+
     def run(self) -> None:
         self._configure_bot_ui()
         self._send_startup_menu_if_possible()
+        self.warm_cache.start()
         print("Local Telegram bot polling started.")
-        while True:
-            try:
-                updates = self.get_updates()
-                for update in updates:
-                    update_id = int(update.get("update_id") or 0)
-                    if update_id:
-                        self.state["offset"] = update_id + 1
-                        self._save_state()
-                    self.handle_update(update)
-            except KeyboardInterrupt:
-                raise
-            except Exception as exc:
-                print(f"telegram bot error: {type(exc).__name__}: {exc}")
-                time.sleep(5)
+        self.transport.run_polling(self._offset, self._handle_polled_update)
 
 
 def run_local_telegram_bot() -> None:
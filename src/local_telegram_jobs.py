@@ -0,0 +1,272 @@
+from __future__ import annotations
+
+import heapq
+import itertools
+import time
+from dataclasses import dataclass, field
+from threading import Condition, Thread
+from typing import Any, Callable
+
+
+PRIORITY_JOURNAL = 0
+PRIORITY_QUICK = 10
+PRIORITY_FULL = 20
+PRIORITY_WARM = 30
+
+SUBMIT_QUEUED = "queued"
+SUBMIT_COALESCED = "coalesced"
+SUBMIT_ATTACHED = "attached"
+SUBMIT_SUPERSEDED = "superseded"
+SUBMIT_REJECTED = "rejected"
+
+
+class JobEvictedError(RuntimeError):
+    """Delivered to the waiters of a pending job dropped to make room for a higher-priority one."""
+
+
+@dataclass
+class JobWaiter:
+    on_result: Callable[[Any], None]
+    on_error: Callable[[BaseException], None]
+    label: str = ""
+
+
+@dataclass
+class AnalysisJob:
+    key: str
+    priority: int
+    run: Callable[[], Any]
+    seq: int
+    group: str = ""
+    label: str = ""
+    waiters: list[JobWaiter] = field(default_factory=list)
+    queued_at: float = field(default_factory=time.time)
+    started_at: float | None = None
+    cancelled: bool = False
+
+
+class AnalysisJobQueue:
+    """Bounded priority queue that coalesces identical jobs and fans results out to every waiter.
+
+    Jobs are identified by ``key``. A new request for a key that is already pending or running is
+    attached to that job instead of starting another run. ``supersede=True`` replaces a pending job
+    (e.g. a forced refresh replacing a cache-allowed request) and moves its waiters to the new job; a
+    running job of the same key is flagged cancelled so its stale result is dropped when it returns.
+    When the queue is full, a new job evicts the lowest-priority pending job if that one ranks
+    below it (its waiters get ``JobEvictedError``); otherwise the new job is rejected.
+    Jobs sharing a ``group`` never run concurrently, so heavy analyses stay serialized while light
+    jobs such as journal evaluation can use another worker.
+    """
+
+    def __init__(self, *, max_pending: int = 6, workers: int = 2, name: str = "telegram-analysis") -> None:
+        self.max_pending = max(1, int(max_pending))
+        self._cond = Condition()
+        self._heap: list[tuple[int, int, AnalysisJob]] = []
+        self._pending: dict[str, AnalysisJob] = {}
+        self._running: dict[str, AnalysisJob] = {}
+        self._busy_groups: set[str] = set()
+        self._seq = itertools.count()
+        self._threads = [
+            Thread(target=self._worker, name=f"{name}-{idx}", daemon=True)
+            for idx in range(max(1, int(workers)))
+        ]
+        for thread in self._threads:
+            thread.start()
+
+    def _push(self, job: AnalysisJob) -> None:
+        heapq.heappush(self._heap, (job.priority, job.seq, job))
+
+    def submit(
+        self,
+        key: str,
+        priority: int,
+        run: Callable[[], Any],
+        waiter: JobWaiter | None = None,
+        *,
+        supersede: bool = False,
+        group: str = "",
+        label: str = "",
+    ) -> str:
+        with self._cond:
+            status, evicted = self._submit_locked(key, priority, run, waiter, supersede=supersede, group=group, label=label)
+        if evicted is not None:
+            print(f"telegram job evicted: key={evicted.key} priority={evicted.priority} for key={key} priority={priority}")
+            self._notify_error(evicted, JobEvictedError(f"대기열이 가득 차 더 급한 요청({key})에 자리를 내줬습니다."))
+        return status
+
+    def _evict_below(self, priority: int) -> AnalysisJob | None:
+        """Drop the lowest-priority (then newest) pending job when it ranks below ``priority``."""
+        if not self._pending:
+            return None
+        victim = max(self._pending.values(), key=lambda job: (job.priority, job.seq))
+        if victim.priority <= int(priority):
+            return None
+        victim.cancelled = True
+        del self._pending[victim.key]
+        return victim
+
+    def _submit_locked(
+        self,
+        key: str,
+        priority: int,
+        run: Callable[[], Any],
+        waiter: JobWaiter | None,
+        *,
+        supersede: bool,
+        group: str,
+        label: str,
+    ) -> tuple[str, AnalysisJob | None]:
+        evicted: AnalysisJob | None = None
+        running = self._running.get(key)
+        if running is not None and running.cancelled:
+            running = None
+        if running is not None and not supersede:
+            if waiter is not None:
+                running.waiters.append(waiter)
+            return SUBMIT_ATTACHED, None
+
+        pending = self._pending.get(key)
+        if pending is None and len(self._pending) >= self.max_pending:
+            evicted = self._evict_below(priority)
+            if evicted is None:
+                return SUBMIT_REJECTED, None
+        moved: list[JobWaiter] = []
+        if running is not None:
+            running.cancelled = True
+            moved, running.waiters = running.waiters, []
+        if pending is not None:
+            if supersede:
+                pending.cancelled = True
+                job = AnalysisJob(
+                    key=key,
+                    priority=min(int(priority), pending.priority),
+                    run=run,
+                    seq=next(self._seq),
+                    group=group,
+                    label=label,
+                    waiters=[*moved, *pending.waiters, *([waiter] if waiter is not None else [])],
+                )
+                self._pending[key] = job
+                self._push(job)
+                self._cond.notify_all()
+                return SUBMIT_SUPERSEDED, None
+            if waiter is not None:
+                pending.waiters.append(waiter)
+            if int(priority) < pending.priority:
+                pending.priority = int(priority)
+                self._push(pending)
+                self._cond.notify_all()
+            return SUBMIT_COALESCED, None
+
+        job = AnalysisJob(
+            key=key,
+            priority=int(priority),
+            run=run,
+            seq=next(self._seq),
+            group=group,
+            label=label,
+            waiters=[*moved, *([waiter] if waiter is not None else [])],
+        )
+        self._pending[key] = job
+        self._push(job)
+        self._cond.notify_all()
+        return (SUBMIT_SUPERSEDED if running is not None else SUBMIT_QUEUED), evicted
+
+    def state(self, key: str) -> str:
+        with self._cond:
+            if key in self._running:
+                return "running"
+            if key in self._pending:
+                return "pending"
+            return ""
+
+    def is_full(self) -> bool:
+        with self._cond:
+            return len(self._pending) >= self.max_pending
+
+    def snapshot(self) -> dict[str, Any]:
+        with self._cond:
+            return {
+                "running": sorted(self._running),
+                "pending": [job.key for job in sorted(self._pending.values(), key=lambda job: (job.priority, job.seq))],
+                "maxPending": self.max_pending,
+            }
+
+    def _next_job(self) -> AnalysisJob | None:
+        deferred: list[tuple[int, int, AnalysisJob]] = []
+        chosen: AnalysisJob | None = None
+        while self._heap:
+            entry = heapq.heappop(self._heap)
+            priority, _, job = entry
+            if job.cancelled or self._pending.get(job.key) is not job or priority != job.priority:
+                continue
+            if job.group and job.group in self._busy_groups:
+                deferred.append(entry)
+                continue
+            chosen = job
+            break
+        for entry in deferred:
+            heapq.heappush(self._heap, entry)
+        return chosen
+
+    def _notify_error(self, job: AnalysisJob, error: BaseException) -> None:
+        for waiter in job.waiters:
+            try:
+                waiter.on_error(error)
+            except Exception as exc:
+                print(f"telegram job waiter error: key={job.key} {type(exc).__name__}: {exc}")
+
+    def _worker(self) -> None:
+        while True:
+            with self._cond:
+                job = self._next_job()
+                while job is None:
+                    self._cond.wait()
+                    job = self._next_job()
+                del self._pending[job.key]
+                self._running[job.key] = job
+                if job.group:
+                    self._busy_groups.add(job.group)
+                job.started_at = time.time()
+
+            result: Any = None
+            error: BaseException | None = None
+            try:
+                result = job.run()
+            except Exception as exc:
+                error = exc
+
+            with self._cond:
+                if self._running.get(job.key) is job:
+                    del self._running[job.key]
+                if job.group:
+                    self._busy_groups.discard(job.group)
+                waiters = [] if job.cancelled else list(job.waiters)
+                self._cond.notify_all()
+            if job.cancelled:
+                print(f"telegram job superseded while running: key={job.key}; result dropped")
+
+            for waiter in waiters:
+                try:
+                    if error is None:
+                        waiter.on_result(result)
+                    else:
+                        waiter.on_error(error)
+                except Exception as exc:
+                    print(f"telegram job waiter error: key={job.key} {type(exc).__name__}: {exc}")
+
+
+__all__ = [
+    "AnalysisJobQueue",
+    "JobEvictedError",
+    "JobWaiter",
+    "PRIORITY_FULL",
+    "PRIORITY_JOURNAL",
+    "PRIORITY_QUICK",
+    "PRIORITY_WARM",
+    "SUBMIT_ATTACHED",
+    "SUBMIT_COALESCED",
+    "SUBMIT_QUEUED",
+    "SUBMIT_REJECTED",
+    "SUBMIT_SUPERSEDED",
+]
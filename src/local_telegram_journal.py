@@ -3,14 +3,19 @@ from __future__ import annotations
 import hashlib
 import json
 import os
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date, datetime, timezone
 from html import escape
 from pathlib import Path
 from typing import Any
 
+import numpy as np
 import pandas as pd
 
 from core.data_collector import DataCollector
+from core.tracing import bind, span
+from local_telegram_journal_analytics import JOURNAL_TABLE_PATH, export_journal_table
+from local_telegram_journal_store import ShadowJournalStore
 
 
 ROOT = Path(__file__).resolve().parents[1]
@@ -18,7 +23,12 @@ _DATA_COLLECTOR = DataCollector(root=ROOT)
 OUTPUT_ROOT = ROOT / "outputs" / "telegram"
 JOURNAL_PATH = OUTPUT_ROOT / "shadow_journal.jsonl"
 EVAL_PATH = OUTPUT_ROOT / "shadow_journal_eval.json"
+EVAL_STATE_PATH = OUTPUT_ROOT / "shadow_journal_eval_state.json"
 SCHEMA_VERSION = "shadow-journal-v1"
+EVAL_STATE_VERSION = "shadow-journal-eval-state-v2"
+FINAL_STATUSES = {"tp1_hit", "stopped", "stopped_conservative_same_day", "invalid_plan", "invalid_date"}
+_JOURNAL_STORE = ShadowJournalStore(JOURNAL_PATH)
+_LAST_PAYLOAD: dict[str, Any] = {}
 
 
 def _s(value: Any) -> str:
@@ -63,23 +73,6 @@ def _journal_horizon_days() -> int:
         return 10
 
 
-def _load_jsonl(path: Path) -> list[dict[str, Any]]:
-    if not path.exists():
-        return []
-    rows: list[dict[str, Any]] = []
-    for line in path.read_text(encoding="utf-8").splitlines():
-        line = line.strip()
-        if not line:
-            continue
-        try:
-            row = json.loads(line)
-        except Exception:
-            continue
-        if isinstance(row, dict):
-            rows.append(row)
-    return rows
-
-
 def _stable_run_id(mode: str, payload: dict[str, Any]) -> str:
     summary = payload.get("summary") if isinstance(payload.get("summary"), dict) else {}
     symbols = [
@@ -130,6 +123,13 @@ def _condition_flags(row: dict[str, Any]) -> dict[str, bool]:
 
 
 def record_recommendation_run(mode: str, payload: dict[str, Any], *, trigger: str = "telegram") -> dict[str, Any]:
+    with span("journal.record_run", mode=mode, trigger=trigger) as current:
+        result = _record_recommendation_run(mode, payload, trigger=trigger)
+        current.set(recorded=int(result.get("recorded") or 0), skipped=_s(result.get("skipped")))
+        return result
+
+
+def _record_recommendation_run(mode: str, payload: dict[str, Any], *, trigger: str) -> dict[str, Any]:
     if not bool(payload.get("available")):
         return {"recorded": 0, "skipped": "payload_unavailable"}
 
@@ -139,12 +139,10 @@ def record_recommendation_run(mode: str, payload: dict[str, Any], *, trigger: st
 
     OUTPUT_ROOT.mkdir(parents=True, exist_ok=True)
     run_id = _stable_run_id(mode, payload)
-    existing_run_ids = {
-        _s(row.get("runId"))
-        for row in _load_jsonl(JOURNAL_PATH)
-        if _s(row.get("eventType")) == "recommendation"
-    }
-    if run_id in existing_run_ids:
+    market_status = payload.get("marketStatus") if isinstance(payload.get("marketStatus"), dict) else {}
+    market_regime = market_status.get("marketRegime") if isinstance(market_status.get("marketRegime"), dict) else {}
+    regime_label = _s(market_regime.get("regimeLabel") or market_regime.get("label"))
+    if _JOURNAL_STORE.has_run(run_id):
         return {"recorded": 0, "skipped": "already_recorded", "runId": run_id}
 
     recorded_at = _today_utc()
@@ -163,6 +161,7 @@ def record_recommendation_run(mode: str, payload: dict[str, Any], *, trigger: st
                 "recordedAt": recorded_at,
                 "trigger": trigger,
                 "mode": mode,
+                "marketRegimeLabel": regime_label,
                 "recommendationType": recommendation_type,
                 "symbol": symbol,
                 "generatedAt": _s(payload.get("generatedAt")),
@@ -199,9 +198,7 @@ def record_recommendation_run(mode: str, payload: dict[str, Any], *, trigger: st
             }
         )
 
-    with JOURNAL_PATH.open("a", encoding="utf-8") as fh:
-        for record in records:
-            fh.write(json.dumps(record, ensure_ascii=False, sort_keys=True) + "\n")
+    _JOURNAL_STORE.append(records)
     return {"recorded": len(records), "runId": run_id, "path": str(JOURNAL_PATH)}
 
 
@@ -216,7 +213,54 @@ def _bar_date(index_value: Any) -> date | None:
         return None
 
 
-def _evaluate_recommendation(record: dict[str, Any], horizon_days: int) -> dict[str, Any]:
+def _journal_fetch_workers() -> int:
+    try:
+        return max(1, min(16, int(os.getenv("TELEGRAM_JOURNAL_FETCH_WORKERS", "8"))))
+    except Exception:
+        return 8
+
+
+def _symbol_bars(symbol: str) -> dict[str, np.ndarray] | None:
+    bars = _DATA_COLLECTOR.get_stock_data(symbol, period="6mo", auto_adjust=False)
+    if bars is None or bars.empty:
+        return None
+    dates = [_bar_date(idx) for idx in bars.index]
+
+    def _column(name: str) -> np.ndarray:
+        if name not in bars.columns:
+            return np.zeros(len(bars), dtype=float)
+        return pd.to_numeric(bars[name], errors="coerce").to_numpy(dtype=float)
+
+    return {
+        "date": np.array([row.isoformat() if row is not None else "" for row in dates], dtype=object),
+        "ordinal": np.array([row.toordinal() if row is not None else -1 for row in dates], dtype=np.int64),
+        "high": _column("High"),
+        "low": _column("Low"),
+        "close": _column("Close"),
+    }
+
+
+def _load_symbol_bars(symbols: list[str]) -> dict[str, dict[str, np.ndarray] | None]:
+    """Fetch daily bars once per symbol, concurrently."""
+    unique = sorted({symbol for symbol in symbols if symbol})
+    if not unique:
+        return {}
+    workers = min(len(unique), _journal_fetch_workers())
+    with span("journal.load_bars", symbols=len(unique), workers=workers):
+        if workers <= 1:
+            return {symbol: _symbol_bars(symbol) for symbol in unique}
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return dict(zip(unique, executor.map(bind(_symbol_bars), unique)))
+
+
+def _first_true(mask: np.ndarray) -> int | None:
+    if not mask.size:
+        return None
+    idx = int(np.argmax(mask))
+    return idx if bool(mask[idx]) else None
+
+
+def _evaluate_recommendation(record: dict[str, Any], horizon_days: int, bars: dict[str, np.ndarray] | None) -> dict[str, Any]:
     symbol = _s(record.get("symbol")).upper()
     entry = _f(record.get("averageEntryPrice"), 0.0)
     stop = _f(record.get("closeStopPrice"), 0.0)
@@ -228,100 +272,69 @@ def _evaluate_recommendation(record: dict[str, Any], horizon_days: int) -> dict[
     if basis_date is None:
         return {**record, "evalStatus": "invalid_date"}
 
-    bars = _DATA_COLLECTOR.get_stock_data(symbol, period="6mo", auto_adjust=False)
-    if bars is None or bars.empty:
+    if bars is None:
         return {**record, "evalStatus": "no_price_data"}
 
-    future_rows: list[dict[str, Any]] = []
-    for idx, bar in bars.iterrows():
-        row_date = _bar_date(idx)
-        if row_date is None or row_date <= basis_date:
-            continue
-        future_rows.append(
-            {
-                "date": row_date.isoformat(),
-                "open": _f(bar.get("Open"), 0.0),
-                "high": _f(bar.get("High"), 0.0),
-                "low": _f(bar.get("Low"), 0.0),
-                "close": _f(bar.get("Close"), 0.0),
-            }
-        )
-        if len(future_rows) >= horizon_days:
-            break
-
-    if not future_rows:
+    future_idx = np.flatnonzero(bars["ordinal"] > basis_date.toordinal())[:horizon_days]
+    if not future_idx.size:
         return {**record, "evalStatus": "pending_no_future_bars", "barsEvaluated": 0}
 
-    positive_lows = [row["low"] for row in future_rows if row["low"] > 0]
-    positive_highs = [row["high"] for row in future_rows if row["high"] > 0]
-    if not positive_lows or not positive_highs:
+    lows = bars["low"][future_idx]
+    highs = bars["high"][future_idx]
+    dates = bars["date"][future_idx]
+    bars_evaluated = int(future_idx.size)
+    positive_lows = lows[lows > 0]
+    positive_highs = highs[highs > 0]
+    if not positive_lows.size or not positive_highs.size:
         return {**record, "evalStatus": "no_price_data"}
-    lowest = min(positive_lows)
-    highest = max(positive_highs)
-    last_close = future_rows[-1]["close"]
-    fill_row = next((row for row in future_rows if row["low"] <= entry), None)
-    if fill_row is None:
+    lowest = float(positive_lows.min())
+    highest = float(positive_highs.max())
+    last_close = float(bars["close"][future_idx[-1]])
+    fill_pos = _first_true(lows <= entry)
+    if fill_pos is None:
         return {
             **record,
             "evalStatus": "unfilled",
-            "barsEvaluated": len(future_rows),
+            "barsEvaluated": bars_evaluated,
             "minLow": round(lowest, 2),
             "maxHigh": round(highest, 2),
             "lastClose": round(last_close, 2),
             "distanceToEntryPct": _pct(lowest, entry),
         }
 
-    after_fill = future_rows[future_rows.index(fill_row) :]
-    max_favorable_pct = _pct(max(row["high"] for row in after_fill), entry)
-    max_adverse_pct = _pct(min(row["low"] for row in after_fill), entry)
-    for row in after_fill:
-        hit_stop = row["low"] <= stop
-        hit_tp1 = row["high"] >= tp1
-        if hit_stop and hit_tp1:
-            return {
-                **record,
-                "evalStatus": "stopped_conservative_same_day",
-                "barsEvaluated": len(future_rows),
-                "fillDate": fill_row["date"],
-                "exitDate": row["date"],
-                "fillPrice": entry,
-                "exitPrice": stop,
-                "realizedPct": _pct(stop, entry),
-                "maxFavorablePct": max_favorable_pct,
-                "maxAdversePct": max_adverse_pct,
-            }
-        if hit_stop:
-            return {
-                **record,
-                "evalStatus": "stopped",
-                "barsEvaluated": len(future_rows),
-                "fillDate": fill_row["date"],
-                "exitDate": row["date"],
-                "fillPrice": entry,
-                "exitPrice": stop,
-                "realizedPct": _pct(stop, entry),
-                "maxFavorablePct": max_favorable_pct,
-                "maxAdversePct": max_adverse_pct,
-            }
-        if hit_tp1:
-            return {
-                **record,
-                "evalStatus": "tp1_hit",
-                "barsEvaluated": len(future_rows),
-                "fillDate": fill_row["date"],
-                "exitDate": row["date"],
-                "fillPrice": entry,
-                "exitPrice": tp1,
-                "realizedPct": _pct(tp1, entry),
-                "maxFavorablePct": max_favorable_pct,
-                "maxAdversePct": max_adverse_pct,
-            }
+    after_lows = lows[fill_pos:]
+    after_highs = highs[fill_pos:]
+    max_favorable_pct = _pct(float(np.nanmax(after_highs)) if np.isfinite(after_highs).any() else 0.0, entry)
+    max_adverse_pct = _pct(float(np.nanmin(after_lows)), entry)
+    fill_date = str(dates[fill_pos])
+    stop_pos = _first_true(after_lows <= stop)
+    tp1_pos = _first_true(after_highs >= tp1)
+    if stop_pos is not None or tp1_pos is not None:
+        exit_pos = min(pos for pos in (stop_pos, tp1_pos) if pos is not None)
+        if stop_pos == exit_pos:
+            status = "stopped_conservative_same_day" if tp1_pos == exit_pos else "stopped"
+            exit_price = stop
+        else:
+            status = "tp1_hit"
+            exit_price = tp1
+        return {
+            **record,
+            "evalStatus": status,
+            "barsEvaluated": bars_evaluated,
+            "fillDate": fill_date,
+            "exitDate": str(dates[fill_pos + exit_pos]),
+            "fillPrice": entry,
+            "exitPrice": exit_price,
+            "realizedPct": _pct(exit_price, entry),
+            "maxFavorablePct": max_favorable_pct,
+            "maxAdversePct": max_adverse_pct,
+        }
 
     return {
         **record,
         "evalStatus": "filled_open",
-        "barsEvaluated": len(future_rows),
-        "fillDate": fill_row["date"],
+        "barsEvaluated": bars_evaluated,
+        "fillDate": fill_date,
         "fillPrice": entry,
         "lastClose": round(last_close, 2),
         "unrealizedPct": _pct(last_close, entry),
@@ -330,8 +343,12 @@ def _evaluate_recommendation(record: dict[str, Any], horizon_days: int) -> dict[
     }
 
 
-def _condition_stats(rows: list[dict[str, Any]]) -> dict[str, dict[str, Any]]:
-    stats: dict[str, dict[str, Any]] = {}
+def _condition_counts(
+    rows: list[dict[str, Any]],
+    stats: dict[str, dict[str, int]] | None = None,
+    sign: int = 1,
+) -> dict[str, dict[str, int]]:
+    stats = {} if stats is None else stats
     terminal_statuses = {"tp1_hit", "stopped", "stopped_conservative_same_day", "filled_open"}
     for row in rows:
         flags = row.get("conditionFlags") if isinstance(row.get("conditionFlags"), dict) else _condition_flags(row)
@@ -350,17 +367,28 @@ def _condition_stats(rows: list[dict[str, Any]]) -> dict[str, dict[str, Any]]:
                 },
             )
             status = _s(row.get("evalStatus"))
-            bucket["count"] += 1
+            bucket["count"] += sign
             if status in terminal_statuses:
-                bucket["filled"] += 1
+                bucket["filled"] += sign
             if status == "tp1_hit":
-                bucket["tp1"] += 1
+                bucket["tp1"] += sign
             if status in {"stopped", "stopped_conservative_same_day"}:
-                bucket["stopped"] += 1
+                bucket["stopped"] += sign
             if status == "pending_no_future_bars":
-                bucket["pending"] += 1
+                bucket["pending"] += sign
             if status == "unfilled":
-                bucket["unfilled"] += 1
+                bucket["unfilled"] += sign
+    return stats
+
+
+def _condition_rates(*counts: dict[str, dict[str, int]]) -> dict[str, dict[str, Any]]:
+    stats: dict[str, dict[str, Any]] = {}
+    for source in counts:
+        for key, values in source.items():
+            bucket = stats.setdefault(key, {"count": 0, "filled": 0, "tp1": 0, "stopped": 0, "pending": 0, "unfilled": 0})
+            for name in bucket:
+                bucket[name] += int(values.get(name) or 0)
+    stats = {key: bucket for key, bucket in stats.items() if bucket["count"] > 0}
     for bucket in stats.values():
         count = max(1, int(bucket["count"]))
         filled = max(1, int(bucket["filled"]))
@@ -370,19 +398,154 @@ def _condition_stats(rows: list[dict[str, Any]]) -> dict[str, dict[str, Any]]:
     return stats
 
 
+def _condition_stats(rows: list[dict[str, Any]]) -> dict[str, dict[str, Any]]:
+    return _condition_rates(_condition_counts(rows))
+
+
+def _is_final_evaluation(row: dict[str, Any], horizon_days: int) -> bool:
+    """True when the outcome can no longer change: exited/invalid, or the horizon window is complete."""
+    status = _s(row.get("evalStatus"))
+    if status in FINAL_STATUSES:
+        return True
+    return status in {"unfilled", "filled_open"} and int(_f(row.get("barsEvaluated"), 0.0)) >= horizon_days
+
+
+def _load_eval_state(horizon_days: int) -> dict[str, Any]:
+    fresh = {
+        "stateVersion": EVAL_STATE_VERSION,
+        "schemaVersion": SCHEMA_VERSION,
+        "horizonDays": horizon_days,
+        "final": {},
+        "conditionCounts": {},
+    }
+    if not EVAL_STATE_PATH.exists():
+        return fresh
+    try:
+        state = json.loads(EVAL_STATE_PATH.read_text(encoding="utf-8"))
+    except Exception:
+        return fresh
+    if (
+        not isinstance(state, dict)
+        or state.get("stateVersion") != EVAL_STATE_VERSION
+        or state.get("schemaVersion") != SCHEMA_VERSION
+        or int(_f(state.get("horizonDays"), 0.0)) != horizon_days
+        or not isinstance(state.get("final"), dict)
+        or not isinstance(state.get("conditionCounts"), dict)
+    ):
+        return fresh
+    return state
+
+
+def _save_eval_state(state: dict[str, Any]) -> None:
+    OUTPUT_ROOT.mkdir(parents=True, exist_ok=True)
+    tmp_path = EVAL_STATE_PATH.with_suffix(".tmp")
+    tmp_path.write_text(json.dumps(state, ensure_ascii=False, separators=(",", ":")), encoding="utf-8")
+    tmp_path.replace(EVAL_STATE_PATH)
+
+
+def _journal_digest(recommendation_ids: Any) -> str:
+    return hashlib.blake2b("\n".join(recommendation_ids).encode("utf-8"), digest_size=16).hexdigest()
+
+
+def journal_table_is_stale(horizon_days: int | None = None) -> bool:
+    """True when the Parquet table predates today's evaluation or new journal ids (no bar fetches)."""
+    horizon_days = _journal_horizon_days() if horizon_days is None else max(1, int(horizon_days))
+    if not JOURNAL_TABLE_PATH.exists():
+        return True
+    state = _load_eval_state(horizon_days)
+    return (
+        _s(state.get("evaluatedAt")) != _today_utc()
+        or state.get("journalDigest") != _journal_digest(_JOURNAL_STORE.recommendation_locations())
+    )
+
+
 def evaluate_shadow_journal(horizon_days: int | None = None) -> dict[str, Any]:
     horizon_days = _journal_horizon_days() if horizon_days is None else max(1, int(horizon_days))
-    records = [
-        row
-        for row in _load_jsonl(JOURNAL_PATH)
-        if _s(row.get("eventType")) == "recommendation" and _s(row.get("schemaVersion")) == SCHEMA_VERSION
-    ]
-    latest_by_id: dict[str, dict[str, Any]] = {}
-    for row in records:
+    with span("journal.evaluate", horizon_days=horizon_days) as current:
+        payload = _evaluate_shadow_journal(horizon_days)
+        current.set(
+            recommendations=int(payload["summary"]["recommendationCount"]),
+            reevaluated=int(payload["incremental"]["reevaluatedCount"]),
+        )
+        return payload
+
+
+def _load_last_payload() -> dict[str, Any] | None:
+    if _LAST_PAYLOAD:
+        return dict(_LAST_PAYLOAD)
+    try:
+        payload = json.loads(EVAL_PATH.read_text(encoding="utf-8"))
+    except Exception:
+        return None
+    return payload if isinstance(payload, dict) and isinstance(payload.get("summary"), dict) else None
+
+
+def _evaluate_shadow_journal(horizon_days: int) -> dict[str, Any]:
+    """Re-evaluate only open recommendations; skip all work when neither ids nor bars moved.
+
+    The state file keeps the final results, the journal id digest and the last bar date per open
+    symbol. When the journal has no new ids and no open symbol has a newer bar, the previous
+    payload is returned as is. The final-row Parquet table is rewritten only when the set of
+    final records changes; the open-row table is small and rewritten on every evaluation.
+    """
+    state = _load_eval_state(horizon_days)
+    final: dict[str, dict[str, Any]] = state["final"]
+    final_counts: dict[str, dict[str, int]] = state["conditionCounts"]
+    locations = _JOURNAL_STORE.recommendation_locations()
+    journal_digest = _journal_digest(locations)
+
+    # Recommendation ids embed the (deduped) run id, so a recorded id never changes content; final
+    # entries are keyed by id alone and survive segment seal/compaction moving the line.
+    dropped = [rid for rid in final if rid not in locations]
+    for rid in dropped:
+        _condition_counts([final.pop(rid)["record"]], final_counts, sign=-1)
+
+    open_records = []
+    for rid in locations:
+        if rid in final:
+            continue
+        row = _JOURNAL_STORE.get(rid)
+        if row is not None and _s(row.get("schemaVersion")) == SCHEMA_VERSION:
+            open_records.append(row)
+    bars_by_symbol = _load_symbol_bars([_s(row.get("symbol")).upper() for row in open_records])
+    bar_dates = {
+        symbol: str(bars["date"][-1])
+        for symbol, bars in bars_by_symbol.items()
+        if bars is not None and len(bars["date"])
+    }
+    previous_dates = state.get("lastBarDates") if isinstance(state.get("lastBarDates"), dict) else {}
+    if (
+        not dropped
+        and state.get("journalDigest") == journal_digest
+        and all(date_text <= _s(previous_dates.get(symbol)) for symbol, date_text in bar_dates.items())
+    ):
+        cached = _load_last_payload()
+        if cached is not None:
+            cached["incremental"] = {**(cached.get("incremental") or {}), "unchanged": True, "reevaluatedCount": 0}
+            return cached
+
+    open_evaluated: dict[str, dict[str, Any]] = {}
+    newly_final = 0
+    for row in open_records:
+        result = _evaluate_recommendation(row, horizon_days, bars_by_symbol.get(_s(row.get("symbol")).upper()))
         rid = _s(row.get("recommendationId"))
-        if rid:
-            latest_by_id[rid] = row
-    evaluated = [_evaluate_recommendation(row, horizon_days) for row in latest_by_id.values()]
+        if _is_final_evaluation(result, horizon_days):
+            final[rid] = {"record": result}
+            _condition_counts([result], final_counts)
+            newly_final += 1
+        else:
+            open_evaluated[rid] = result
+    state["evaluatedAt"] = _today_utc()
+    state["journalDigest"] = journal_digest
+    state["lastBarDate"] = max([*bar_dates.values(), _s(state.get("lastBarDate"))])
+    state["lastBarDates"] = bar_dates
+    _save_eval_state(state)
+
+    evaluated = [
+        final[rid]["record"] if rid in final else open_evaluated[rid]
+        for rid in locations
+        if rid in final or rid in open_evaluated
+    ]
     status_counts: dict[str, int] = {}
     for row in evaluated:
         status = _s(row.get("evalStatus") or "unknown")
@@ -397,6 +560,13 @@ def evaluate_shadow_journal(horizon_days: int | None = None) -> dict[str, Any]:
         "schemaVersion": SCHEMA_VERSION,
         "journalPath": str(JOURNAL_PATH),
         "horizonDays": horizon_days,
+        "lastBarDate": state["lastBarDate"],
+        "incremental": {
+            "finalCount": len(final),
+            "reevaluatedCount": len(open_records),
+            "newlyFinalCount": newly_final,
+            "unchanged": False,
+        },
         "summary": {
             "recommendationCount": len(evaluated),
             "filledCount": filled_count,
@@ -410,12 +580,20 @@ def evaluate_shadow_journal(horizon_days: int | None = None) -> dict[str, Any]:
             "stopRateFilledPct": round(stopped_count / filled_count * 100.0, 2) if filled_count else 0.0,
             "statusCounts": status_counts,
         },
-        "conditionStats": _condition_stats(evaluated),
+        "conditionStats": _condition_rates(final_counts, _condition_counts(list(open_evaluated.values()))),
         "recent": sorted(evaluated, key=lambda row: _s(row.get("recordedAt")), reverse=True)[:30],
-        "all": evaluated,
     }
+    table_path = export_journal_table(
+        [entry["record"] for entry in final.values()],
+        list(open_evaluated.values()),
+        final_changed=bool(dropped or newly_final),
+    )
+    if table_path is not None:
+        payload["tablePath"] = str(table_path)
     OUTPUT_ROOT.mkdir(parents=True, exist_ok=True)
-    EVAL_PATH.write_text(json.dumps(payload, ensure_ascii=False, indent=2) + "\n", encoding="utf-8")
+    EVAL_PATH.write_text(json.dumps(payload, ensure_ascii=False, separators=(",", ":")) + "\n", encoding="utf-8")
+    _LAST_PAYLOAD.clear()
+    _LAST_PAYLOAD.update(payload)
     return payload
 
 
@@ -513,8 +691,10 @@ def render_journal_html(payload: dict[str, Any]) -> str:
 
 __all__ = [
     "EVAL_PATH",
+    "EVAL_STATE_PATH",
     "JOURNAL_PATH",
     "evaluate_shadow_journal",
+    "journal_table_is_stale",
     "record_recommendation_run",
     "render_journal_html",
 ]
@@ -0,0 +1,256 @@
+from __future__ import annotations
+
+from html import escape
+from pathlib import Path
+from typing import Any
+
+import pandas as pd
+
+from core.tracing import span
+
+
+ROOT = Path(__file__).resolve().parents[1]
+OUTPUT_ROOT = ROOT / "outputs" / "telegram"
+JOURNAL_TABLE_PATH = OUTPUT_ROOT / "shadow_journal_eval.parquet"
+JOURNAL_OPEN_TABLE_PATH = OUTPUT_ROOT / "shadow_journal_eval_open.parquet"
+FLAG_PREFIX = "flag_"
+FILLED_STATUSES = ["tp1_hit", "stopped", "stopped_conservative_same_day", "filled_open"]
+STOPPED_STATUSES = ["stopped", "stopped_conservative_same_day"]
+GROUP_ALIASES = {
+    "regime": "marketRegimeLabel",
+    "type": "recommendationType",
+    "mode": "mode",
+    "symbol": "symbol",
+    "chart": "chartState",
+    "news": "newsSignal",
+    "month": "month",
+    "week": "week",
+    "status": "evalStatus",
+}
+
+
+def _s(value: Any) -> str:
+    return str(value or "").strip()
+
+
+def build_journal_frame(evaluated: list[dict[str, Any]]) -> pd.DataFrame:
+    """One row per evaluated recommendation, one boolean column per condition flag and outcome."""
+    flag_keys = sorted(
+        {
+            str(key)
+            for record in evaluated
+            if isinstance(record.get("conditionFlags"), dict)
+            for key in record["conditionFlags"]
+        }
+    )
+    rows: list[dict[str, Any]] = []
+    for record in evaluated:
+        flags = record.get("conditionFlags") if isinstance(record.get("conditionFlags"), dict) else {}
+        row = {
+            "recommendationId": _s(record.get("recommendationId")),
+            "runId": _s(record.get("runId")),
+            "symbol": _s(record.get("symbol")).upper(),
+            "mode": _s(record.get("mode")),
+            "recommendationType": _s(record.get("recommendationType")),
+            "recordedAt": _s(record.get("recordedAt")),
+            "basisDate": _s(record.get("latestCloseAsOf") or record.get("generatedAt"))[:10],
+            "marketRegimeLabel": _s(record.get("marketRegimeLabel")) or "unknown",
+            "chartState": _s(record.get("chartState")),
+            "newsSignal": _s(record.get("newsSignal")),
+            "evalStatus": _s(record.get("evalStatus")),
+            "barsEvaluated": record.get("barsEvaluated"),
+            "averageEntryPrice": record.get("averageEntryPrice"),
+            "realizedPct": record.get("realizedPct"),
+            "unrealizedPct": record.get("unrealizedPct"),
+            "maxFavorablePct": record.get("maxFavorablePct"),
+            "maxAdversePct": record.get("maxAdversePct"),
+        }
+        for key in flag_keys:
+            row[f"{FLAG_PREFIX}{key}"] = bool(flags.get(key, False))
+        rows.append(row)
+
+    frame = pd.DataFrame(rows)
+    if frame.empty:
+        return frame
+    frame["recordedAt"] = pd.to_datetime(frame["recordedAt"], errors="coerce", utc=True)
+    frame["basisDate"] = pd.to_datetime(frame["basisDate"], errors="coerce")
+    for column in ("barsEvaluated", "averageEntryPrice", "realizedPct", "unrealizedPct", "maxFavorablePct", "maxAdversePct"):
+        frame[column] = pd.to_numeric(frame[column], errors="coerce")
+    status = frame["evalStatus"]
+    frame["filled"] = status.isin(FILLED_STATUSES)
+    frame["tp1"] = status.eq("tp1_hit")
+    frame["stopped"] = status.isin(STOPPED_STATUSES)
+    frame["pending"] = status.eq("pending_no_future_bars")
+    frame["unfilled"] = status.eq("unfilled")
+    for column in ("mode", "recommendationType", "marketRegimeLabel", "chartState", "newsSignal", "evalStatus"):
+        frame[column] = frame[column].astype("category")
+    return frame
+
+
+def _write_table(rows: list[dict[str, Any]], target: Path) -> None:
+    with span("journal.export_table", rows=len(rows), table=target.name):
+        target.parent.mkdir(parents=True, exist_ok=True)
+        build_journal_frame(rows).to_parquet(target, engine="pyarrow", index=False)
+
+
+def export_journal_table(
+    final_rows: list[dict[str, Any]],
+    open_rows: list[dict[str, Any]],
+    *,
+    final_changed: bool = True,
+    path: Path | None = None,
+    open_path: Path | None = None,
+) -> Path | None:
+    """Write the open-row table, and the final-row table only when the final set changed (or is missing)."""
+    target = path or JOURNAL_TABLE_PATH
+    open_target = open_path or JOURNAL_OPEN_TABLE_PATH
+    try:
+        if final_changed or not target.exists():
+            _write_table(final_rows, target)
+        _write_table(open_rows, open_target)
+    except Exception as exc:
+        print(f"shadow journal parquet export error: {type(exc).__name__}: {exc}")
+        return None
+    return target
+
+
+def load_journal_table(path: Path | None = None, open_path: Path | None = None) -> pd.DataFrame:
+    """Final and open rows as one frame; flag columns missing from either part read as False."""
+    frames = [
+        pd.read_parquet(target, engine="pyarrow")
+        for target in (path or JOURNAL_TABLE_PATH, open_path or JOURNAL_OPEN_TABLE_PATH)
+        if target.exists()
+    ]
+    frames = [frame for frame in frames if not frame.empty]
+    if not frames:
+        return pd.DataFrame()
+    frame = pd.concat(frames, ignore_index=True) if len(frames) > 1 else frames[0]
+    for column in frame.columns:
+        if column.startswith(FLAG_PREFIX):
+            frame[column] = frame[column].fillna(False).astype(bool)
+    return frame
+
+
+def query_condition_stats(
+    frame: pd.DataFrame,
+    *,
+    flags: list[str] | None = None,
+    group_by: list[str] | None = None,
+    since: str | None = None,
+    until: str | None = None,
+) -> list[dict[str, Any]]:
+    """Fill / TP1 / stop rates for rows matching every flag, grouped by flags, regime or date bucket."""
+    if frame.empty:
+        return []
+    mask = pd.Series(True, index=frame.index)
+    for flag in flags or []:
+        column = f"{FLAG_PREFIX}{flag}"
+        if column not in frame.columns:
+            raise ValueError(f"unknown condition flag: {flag}")
+        mask &= frame[column]
+    if since:
+        mask &= frame["basisDate"] >= pd.Timestamp(since)
+    if until:
+        mask &= frame["basisDate"] <= pd.Timestamp(until)
+    selected = frame.loc[mask]
+    if selected.empty:
+        return []
+
+    keys: list[str] = []
+    for raw in group_by or []:
+        key = GROUP_ALIASES.get(raw, raw)
+        if key == "month":
+            selected = selected.assign(month=selected["basisDate"].dt.strftime("%Y-%m"))
+        elif key == "week":
+            selected = selected.assign(week=selected["basisDate"].dt.strftime("%G-W%V"))
+        elif key not in selected.columns and f"{FLAG_PREFIX}{key}" in selected.columns:
+            key = f"{FLAG_PREFIX}{key}"
+        if key not in selected.columns:
+            raise ValueError(f"unknown group key: {raw}")
+        keys.append(key)
+
+    outcome_columns = ["filled", "tp1", "stopped", "pending", "unfilled"]
+    if keys:
+        grouped = selected.groupby(keys, observed=True, dropna=False)[outcome_columns].sum()
+        grouped["count"] = selected.groupby(keys, observed=True, dropna=False).size()
+        grouped["avgRealizedPct"] = selected.groupby(keys, observed=True, dropna=False)["realizedPct"].mean()
+        grouped = grouped.reset_index()
+    else:
+        grouped = selected[outcome_columns].sum().to_frame().T
+        grouped["count"] = len(selected)
+        grouped["avgRealizedPct"] = selected["realizedPct"].mean()
+
+    count = grouped["count"].clip(lower=1)
+    filled = grouped["filled"].clip(lower=1)
+    grouped["fillRatePct"] = (grouped["filled"] / count * 100.0).round(2)
+    grouped["tp1RateFilledPct"] = (grouped["tp1"] / filled * 100.0).where(grouped["filled"] > 0, 0.0).round(2)
+    grouped["stopRateFilledPct"] = (grouped["stopped"] / filled * 100.0).where(grouped["filled"] > 0, 0.0).round(2)
+    grouped["avgRealizedPct"] = grouped["avgRealizedPct"].round(2)
+    grouped = grouped.sort_values("count", ascending=False)
+
+    out: list[dict[str, Any]] = []
+    for record in grouped.to_dict(orient="records"):
+        row: dict[str, Any] = {"group": {key.removeprefix(FLAG_PREFIX): record.get(key) for key in keys}}
+        for name in ("count", *outcome_columns):
+            row[name] = int(record.get(name) or 0)
+        for name in ("fillRatePct", "tp1RateFilledPct", "stopRateFilledPct"):
+            row[name] = float(record.get(name) or 0.0)
+        avg = record.get("avgRealizedPct")
+        row["avgRealizedPct"] = None if pd.isna(avg) else float(avg)
+        out.append(row)
+    return out
+
+
+def parse_journal_query(args: list[str]) -> dict[str, Any]:
+    """Parse ``/journal`` arguments: bare condition flags plus ``by=``/``since=``/``until=``."""
+    query: dict[str, Any] = {"flags": [], "group_by": [], "since": None, "until": None}
+    for token in args:
+        key, sep, value = token.partition("=")
+        key = key.strip().lower()
+        if not sep:
+            query["flags"].append(token.strip())
+        elif key == "by":
+            query["group_by"].extend(part for part in value.split(",") if part)
+        elif key in {"since", "from"}:
+            query["since"] = value or None
+        elif key in {"until", "to"}:
+            query["until"] = value or None
+    return query
+
+
+def render_condition_query_html(query: dict[str, Any], rows: list[dict[str, Any]]) -> str:
+    title_parts = [*query.get("flags", [])]
+    if query.get("group_by"):
+        title_parts.append("by=" + ",".join(query["group_by"]))
+    if query.get("since") or query.get("until"):
+        title_parts.append(f"{query.get('since') or '…'}~{query.get('until') or '…'}")
+    lines = [
+        "<b>Shadow Journal 조건 조회</b>",
+        f"<code>{escape(' '.join(title_parts) or '전체')}</code>",
+        "",
+    ]
+    if not rows:
+        lines.append("조건에 맞는 기록이 없습니다.")
+        return "\n".join(lines)
+    for row in rows[:15]:
+        group = row.get("group") or {}
+        label = " | ".join(f"{key}={value}" for key, value in group.items()) or "전체"
+        avg = row.get("avgRealizedPct")
+        lines.append(
+            f"<b>{escape(str(label))}</b>: n={row['count']} | 체결 {row['fillRatePct']:.2f}% | "
+            f"TP1/체결 {row['tp1RateFilledPct']:.2f}% | 손절/체결 {row['stopRateFilledPct']:.2f}%"
+            + (f" | 평균실현 {avg:.2f}%" if avg is not None else "")
+        )
+    return "\n".join(lines)
+
+
+__all__ = [
+    "JOURNAL_OPEN_TABLE_PATH",
+    "JOURNAL_TABLE_PATH",
+    "build_journal_frame",
+    "export_journal_table",
+    "load_journal_table",
+    "parse_journal_query",
+    "query_condition_stats",
+    "render_condition_query_html",
+]
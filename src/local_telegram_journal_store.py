@@ -0,0 +1,339 @@
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+from threading import RLock
+from typing import Any, Iterator
+
+from core.tracing import span
+
+
+INDEX_SCHEMA_VERSION = "shadow-journal-index-v1"
+ACTIVE_SEGMENT = "active"
+
+
+def _s(value: Any) -> str:
+    return str(value or "").strip()
+
+
+def _env_int(key: str, default: int, minimum: int = 1, maximum: int | None = None) -> int:
+    try:
+        value = int(os.getenv(key, str(default)))
+    except Exception:
+        value = int(default)
+    value = max(minimum, value)
+    if maximum is not None:
+        value = min(maximum, value)
+    return value
+
+
+def _parse_line(raw: bytes) -> dict[str, Any] | None:
+    line = raw.strip()
+    if not line:
+        return None
+    try:
+        row = json.loads(line.decode("utf-8"))
+    except Exception:
+        return None
+    return row if isinstance(row, dict) else None
+
+
+class ShadowJournalStore:
+    """Append-only JSONL journal with a persistent sidecar index.
+
+    The active file keeps its historical path (``shadow_journal.jsonl``). When it reaches
+    ``segment_records`` lines it is sealed into ``segments/``. The index maps run ids and
+    recommendation ids to ``(segment, offset, length)`` so dedupe and point reads never rescan
+    history. Sealed segments are compacted once enough of their lines are superseded or unreadable.
+
+    The index file is a snapshot written only when segments change (seal, compaction, rebuild).
+    Appends update the in-memory index; lines of the active file past the snapshot's ``active.bytes``
+    are re-indexed on load, so an append costs the same regardless of journal size and the catch-up
+    scan is bounded by ``segment_records`` lines.
+    """
+
+    def __init__(
+        self,
+        active_path: Path,
+        *,
+        index_path: Path | None = None,
+        segment_dir: Path | None = None,
+        segment_records: int | None = None,
+        compact_dead_ratio: float = 0.2,
+    ) -> None:
+        self.active_path = active_path
+        self.index_path = index_path or active_path.with_name(f"{active_path.stem}_index.json")
+        self.segment_dir = segment_dir or active_path.with_name(f"{active_path.stem}_segments")
+        self.segment_records = segment_records or _env_int("TELEGRAM_JOURNAL_SEGMENT_RECORDS", 5000, minimum=100)
+        self.compact_dead_ratio = compact_dead_ratio
+        self._lock = RLock()
+        self._index: dict[str, Any] | None = None
+        self._run_ids: set[str] = set()
+
+    def _empty_index(self) -> dict[str, Any]:
+        return {
+            "schemaVersion": INDEX_SCHEMA_VERSION,
+            "segments": [],
+            "active": {"bytes": 0, "lines": 0},
+            "runIds": [],
+            "recommendations": {},
+        }
+
+    def _segment_path(self, name: str) -> Path:
+        return self.active_path if name == ACTIVE_SEGMENT else self.segment_dir / name
+
+    def _load_index(self) -> dict[str, Any]:
+        if self._index is not None:
+            return self._index
+        index: dict[str, Any] | None = None
+        if self.index_path.exists():
+            try:
+                loaded = json.loads(self.index_path.read_text(encoding="utf-8"))
+                if isinstance(loaded, dict) and loaded.get("schemaVersion") == INDEX_SCHEMA_VERSION:
+                    index = loaded
+            except Exception:
+                index = None
+        if index is None or not self._index_matches_files(index):
+            index = self._rebuild_index()
+        self._index = index
+        self._run_ids = set(index.get("runIds") or [])
+        self._catch_up_active()
+        return index
+
+    def _index_matches_files(self, index: dict[str, Any]) -> bool:
+        for segment in index.get("segments") or []:
+            path = self._segment_path(_s(segment.get("name")))
+            if not path.exists() or path.stat().st_size != int(segment.get("bytes") or 0):
+                return False
+        active_bytes = int((index.get("active") or {}).get("bytes") or 0)
+        actual = self.active_path.stat().st_size if self.active_path.exists() else 0
+        return actual >= active_bytes
+
+    def _index_line(self, index: dict[str, Any], segment: str, offset: int, raw: bytes) -> None:
+        row = _parse_line(raw)
+        if row is None or _s(row.get("eventType")) != "recommendation":
+            return
+        run_id = _s(row.get("runId"))
+        if run_id and run_id not in self._run_ids:
+            self._run_ids.add(run_id)
+            index["runIds"].append(run_id)
+        recommendation_id = _s(row.get("recommendationId"))
+        if recommendation_id:
+            index["recommendations"][recommendation_id] = [segment, offset, len(raw)]
+
+    def _scan_file(self, index: dict[str, Any], segment: str, start: int = 0) -> tuple[int, int]:
+        path = self._segment_path(segment)
+        if not path.exists():
+            return 0, 0
+        lines = 0
+        with path.open("rb") as fh:
+            fh.seek(start)
+            offset = start
+            for raw in fh:
+                if not raw.endswith(b"\n"):
+                    break
+                self._index_line(index, segment, offset, raw)
+                offset += len(raw)
+                lines += 1
+        return offset, lines
+
+    def _rebuild_index(self) -> dict[str, Any]:
+        with span("journal.rebuild_index"):
+            index = self._empty_index()
+            self._run_ids = set()
+            if self.segment_dir.exists():
+                for path in sorted(self.segment_dir.glob("*.jsonl")):
+                    size, lines = self._scan_file(index, path.name)
+                    index["segments"].append({"name": path.name, "bytes": size, "lines": lines})
+            size, lines = self._scan_file(index, ACTIVE_SEGMENT)
+            index["active"] = {"bytes": size, "lines": lines}
+            self._write_index(index)
+            return index
+
+    def _catch_up_active(self) -> None:
+        index = self._index
+        if index is None:
+            return
+        active = index["active"]
+        actual = self.active_path.stat().st_size if self.active_path.exists() else 0
+        if actual == int(active.get("bytes") or 0):
+            return
+        size, lines = self._scan_file(index, ACTIVE_SEGMENT, int(active.get("bytes") or 0))
+        if size:
+            active["bytes"] = size
+            active["lines"] = int(active.get("lines") or 0) + lines
+
+    def _write_index(self, index: dict[str, Any]) -> None:
+        self.index_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.index_path.with_suffix(".tmp")
+        tmp_path.write_text(json.dumps(index, ensure_ascii=False, separators=(",", ":")), encoding="utf-8")
+        tmp_path.replace(self.index_path)
+
+    def has_run(self, run_id: str) -> bool:
+        with self._lock:
+            self._load_index()
+            return _s(run_id) in self._run_ids
+
+    def append(self, records: list[dict[str, Any]]) -> int:
+        if not records:
+            return 0
+        with self._lock:
+            index = self._load_index()
+            self._catch_up_active()
+            self.active_path.parent.mkdir(parents=True, exist_ok=True)
+            active = index["active"]
+            with self.active_path.open("ab") as fh:
+                offset = fh.tell()
+                for record in records:
+                    raw = (json.dumps(record, ensure_ascii=False, sort_keys=True) + "\n").encode("utf-8")
+                    fh.write(raw)
+                    self._index_line(index, ACTIVE_SEGMENT, offset, raw)
+                    offset += len(raw)
+            active["bytes"] = offset
+            active["lines"] = int(active.get("lines") or 0) + len(records)
+            if int(active["lines"]) >= self.segment_records:
+                self._seal_active(index)
+                self._maybe_compact(index)
+                self._write_index(index)
+            return len(records)
+
+    def get(self, recommendation_id: str) -> dict[str, Any] | None:
+        with self._lock:
+            location = self._load_index()["recommendations"].get(_s(recommendation_id))
+            if not location:
+                return None
+            segment, offset, length = location
+            with self._segment_path(segment).open("rb") as fh:
+                fh.seek(int(offset))
+                return _parse_line(fh.read(int(length)))
+
+    def recommendation_locations(self) -> dict[str, tuple[str, int, int]]:
+        """Recommendation id -> (segment, offset, length) in first-recorded order."""
+        with self._lock:
+            return {
+                recommendation_id: (str(location[0]), int(location[1]), int(location[2]))
+                for recommendation_id, location in self._load_index()["recommendations"].items()
+            }
+
+    def iter_records(self) -> Iterator[dict[str, Any]]:
+        with self._lock:
+            index = self._load_index()
+            names = [_s(segment.get("name")) for segment in index["segments"]] + [ACTIVE_SEGMENT]
+        for name in names:
+            path = self._segment_path(name)
+            if not path.exists():
+                continue
+            with path.open("rb") as fh:
+                for raw in fh:
+                    row = _parse_line(raw)
+                    if row is not None:
+                        yield row
+
+    def latest_recommendations(self) -> dict[str, dict[str, Any]]:
+        """Latest record per recommendation id, in journal order."""
+        latest: dict[str, dict[str, Any]] = {}
+        for row in self.iter_records():
+            if _s(row.get("eventType")) != "recommendation":
+                continue
+            recommendation_id = _s(row.get("recommendationId"))
+            if recommendation_id:
+                latest[recommendation_id] = row
+        return latest
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            index = self._load_index()
+            return {
+                "segmentCount": len(index["segments"]),
+                "activeLines": int(index["active"].get("lines") or 0),
+                "runCount": len(index["runIds"]),
+                "recommendationCount": len(index["recommendations"]),
+            }
+
+    def _next_segment_name(self, index: dict[str, Any]) -> str:
+        numbers = [0]
+        for segment in index["segments"]:
+            try:
+                numbers.append(int(_s(segment.get("name")).split(".")[1]))
+            except Exception:
+                continue
+        return f"{self.active_path.stem}.{max(numbers) + 1:06d}.jsonl"
+
+    def _seal_active(self, index: dict[str, Any]) -> None:
+        if not self.active_path.exists():
+            return
+        self.segment_dir.mkdir(parents=True, exist_ok=True)
+        name = self._next_segment_name(index)
+        self.active_path.replace(self.segment_dir / name)
+        for location in index["recommendations"].values():
+            if location[0] == ACTIVE_SEGMENT:
+                location[0] = name
+        index["segments"].append({"name": name, **index["active"]})
+        index["active"] = {"bytes": 0, "lines": 0}
+
+    def _maybe_compact(self, index: dict[str, Any]) -> None:
+        sealed = {_s(segment.get("name")) for segment in index["segments"]}
+        total_lines = sum(int(segment.get("lines") or 0) for segment in index["segments"])
+        live = sum(1 for location in index["recommendations"].values() if location[0] in sealed)
+        if total_lines and (total_lines - live) / total_lines >= self.compact_dead_ratio:
+            with span("journal.compact", segments=len(index["segments"]), trigger="auto"):
+                self._compact_sealed(index)
+
+    def compact(self) -> dict[str, Any]:
+        with self._lock:
+            index = self._load_index()
+            before = len(index["segments"])
+            with span("journal.compact", segments=before, trigger="manual"):
+                self._compact_sealed(index)
+            self._write_index(index)
+            return {"segmentsBefore": before, "segmentsAfter": len(index["segments"])}
+
+    def _compact_sealed(self, index: dict[str, Any]) -> None:
+        """Rewrite sealed segments keeping only the indexed (latest) recommendation lines."""
+        old_segments = [_s(segment.get("name")) for segment in index["segments"]]
+        if not old_segments:
+            return
+        live_by_segment: dict[str, list[tuple[str, int, int]]] = {}
+        for recommendation_id, (segment, offset, length) in index["recommendations"].items():
+            if segment in old_segments:
+                live_by_segment.setdefault(segment, []).append((recommendation_id, int(offset), int(length)))
+
+        new_segments: list[dict[str, Any]] = []
+        writer = None
+        current: dict[str, Any] | None = None
+        base = self._next_segment_name(index).split(".")[1]
+        serial = int(base)
+        try:
+            for segment in old_segments:
+                rows = sorted(live_by_segment.get(segment, []), key=lambda item: item[1])
+                if not rows:
+                    continue
+                with self._segment_path(segment).open("rb") as reader:
+                    for recommendation_id, offset, length in rows:
+                        reader.seek(offset)
+                        raw = reader.read(length)
+                        if writer is None or current is None or int(current["lines"]) >= self.segment_records:
+                            if writer is not None:
+                                writer.close()
+                            name = f"{self.active_path.stem}.{serial:06d}.jsonl"
+                            serial += 1
+                            current = {"name": name, "bytes": 0, "lines": 0}
+                            new_segments.append(current)
+                            writer = (self.segment_dir / name).open("wb")
+                        index["recommendations"][recommendation_id] = [current["name"], int(current["bytes"]), len(raw)]
+                        writer.write(raw)
+                        current["bytes"] = int(current["bytes"]) + len(raw)
+                        current["lines"] = int(current["lines"]) + 1
+        finally:
+            if writer is not None:
+                writer.close()
+        index["segments"] = new_segments
+        for name in old_segments:
+            try:
+                (self.segment_dir / name).unlink()
+            except FileNotFoundError:
+                pass
+
+
+__all__ = ["ShadowJournalStore"]
@@ -2,7 +2,6 @@ from __future__ import annotations
 
 import json
 import os
-import time
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timedelta, timezone
 from html import escape
@@ -11,6 +10,7 @@ from typing import Any
 
 from ai.analyzer import ai
 from core.data_collector import DataCollector
+from core.tracing import Span, bind, span, tracing_enabled
 
 
 ROOT = Path(__file__).resolve().parents[1]
@@ -1215,7 +1215,7 @@ def _batched_ai_news_analysis(bundles: dict[str, dict[str, Any]]) -> dict[str, d
         return analyzed
 
     with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="codex-news") as executor:
-        futures = [executor.submit(_run_news_batch, group, bundles) for group in groups]
+        futures = [executor.submit(bind(_run_news_batch), group, bundles) for group in groups]
         for future in as_completed(futures):
             _group, error, rows = future.result()
             if error is not None:
@@ -1515,6 +1515,12 @@ def _load_trade_cache(analysis_limit: int, ttl_minutes: int) -> dict[str, Any] |
     return None
 
 
+def trade_cache_is_fresh(news_limit: int | None = None) -> bool:
+    """True when ``analyze_rebalance_universe(news_limit=...)`` would be answered from cache."""
+    analysis_limit = max(10, int(news_limit)) if news_limit is not None else _analysis_limit()
+    return _load_trade_cache(analysis_limit, _event_cache_minutes()) is not None
+
+
 def _chart_cache_matches_schema(path: Path) -> bool:
     if not path.exists():
         return False
@@ -1603,12 +1609,32 @@ def _build_raw_evidence_row(
     return row
 
 
-def analyze_rebalance_universe(force_refresh: bool = False, news_limit: int | None = None) -> dict[str, Any]:
-    started = time.perf_counter()
+def analyze_rebalance_universe(
+    force_refresh: bool = False,
+    news_limit: int | None = None,
+    *,
+    reuse_chart_cache: bool = False,
+) -> dict[str, Any]:
+    with span("trade.analyze_rebalance_universe", force_refresh=force_refresh, news_limit=news_limit) as trace:
+        payload = _analyze_rebalance_universe(force_refresh, news_limit, reuse_chart_cache=reuse_chart_cache, trace=trace)
+        trace.set(available=bool(payload.get("available")), reason=_s(payload.get("reason")))
+        return payload
+
+
+def _analyze_rebalance_universe(
+    force_refresh: bool,
+    news_limit: int | None,
+    *,
+    reuse_chart_cache: bool,
+    trace: Span,
+) -> dict[str, Any]:
+    """Phases run as child spans of ``trace``; ``timingsSec`` is read back from their durations."""
     OUTPUT_ROOT.mkdir(parents=True, exist_ok=True)
     ttl_minutes = _event_cache_minutes()
     analysis_limit = max(10, int(news_limit)) if news_limit is not None else _analysis_limit()
     timings: dict[str, Any] = {}
+    if tracing_enabled():
+        timings["traceId"] = trace.trace_id
     if not force_refresh:
         cached = _load_trade_cache(analysis_limit, ttl_minutes)
         if cached is not None:
@@ -1618,9 +1644,9 @@ def analyze_rebalance_universe(force_refresh: bool = False, news_limit: int | No
     rebalance = _load_json(rebalance_path) if rebalance_path is not None else {}
     selected_symbols = {_s(symbol).upper() for symbol in (rebalance.get("final_selected_symbols") or []) if _s(symbol)}
     executed_weights_pct = rebalance.get("executed_weights_pct") if isinstance(rebalance.get("executed_weights_pct"), dict) else {}
-    context_started = time.perf_counter()
-    market_bundle = _DATA_COLLECTOR.collect_market_context()
-    timings["marketContextSec"] = round(time.perf_counter() - context_started, 3)
+    with span("trade.market_context") as phase:
+        market_bundle = _DATA_COLLECTOR.collect_market_context()
+    timings["marketContextSec"] = round(phase.duration_sec, 3)
     market_ctx = market_bundle.get("marketCondition") if isinstance(market_bundle.get("marketCondition"), dict) else {}
     fear_greed = market_bundle.get("fearGreed") if isinstance(market_bundle.get("fearGreed"), dict) else {}
     macro_ctx = market_bundle.get("macro") if isinstance(market_bundle.get("macro"), dict) else {}
@@ -1628,18 +1654,22 @@ def analyze_rebalance_universe(force_refresh: bool = False, news_limit: int | No
     market_regime = market_bundle.get("marketRegime") if isinstance(market_bundle.get("marketRegime"), dict) else {}
 
     universe_symbols = sorted(set(_load_all_us_symbols()) | selected_symbols)
-    fundamental_started = time.perf_counter()
-    fundamental_rows = _scan_fundamentals(universe_symbols)
-    fundamental_by_symbol = {_s(row.get("symbol")).upper(): row for row in fundamental_rows if _s(row.get("symbol"))}
-    selection_limit = min(analysis_limit, len(fundamental_rows)) if news_limit is not None else min(analysis_limit, _final_synthesis_max_symbols())
-    selection_started = time.perf_counter()
-    selected_research = _select_research_symbols(
-        fundamental_rows,
-        selected_symbols=selected_symbols,
-        limit=selection_limit,
-        market_bundle=market_bundle,
-    )
-    timings["researchSelectionSec"] = round(time.perf_counter() - selection_started, 3)
+    with span("trade.fundamental_research", symbols=len(universe_symbols)) as stage:
+        with span("trade.fundamental_scan", symbols=len(universe_symbols)) as phase:
+            fundamental_rows = _scan_fundamentals(universe_symbols)
+        timings["fundamentalScanOnlySec"] = round(phase.duration_sec, 3)
+        fundamental_by_symbol = {_s(row.get("symbol")).upper(): row for row in fundamental_rows if _s(row.get("symbol"))}
+        selection_limit = min(analysis_limit, len(fundamental_rows)) if news_limit is not None else min(analysis_limit, _final_synthesis_max_symbols())
+        with span("trade.research_selection", limit=selection_limit) as phase:
+            selected_research = _select_research_symbols(
+                fundamental_rows,
+                selected_symbols=selected_symbols,
+                limit=selection_limit,
+                market_bundle=market_bundle,
+            )
+        timings["researchSelectionSec"] = round(phase.duration_sec, 3)
+    # fundamentalScanSec keeps its original meaning: scan plus research selection.
+    timings["fundamentalScanSec"] = round(stage.duration_sec, 3)
     if isinstance(selected_research, dict) and selected_research.get("error"):
         payload = {
             "generatedAt": datetime.now(timezone.utc).isoformat(),
@@ -1672,8 +1702,7 @@ def analyze_rebalance_universe(force_refresh: bool = False, news_limit: int | No
             },
             "timingsSec": {
                 **timings,
-                "fundamentalScanSec": round(time.perf_counter() - fundamental_started, 3),
-                "total": round(time.perf_counter() - started, 3),
+                "total": round(trace.elapsed(), 3),
             },
         }
         _write_trade_cache(payload, analysis_limit)
@@ -1685,104 +1714,104 @@ def analyze_rebalance_universe(force_refresh: bool = False, news_limit: int | No
     ]
     candidate_rows = [fundamental_by_symbol[symbol] for symbol in candidate_symbols]
     candidate_symbols = [_s(row.get("symbol")).upper() for row in candidate_rows if _s(row.get("symbol"))]
-    timings["fundamentalScanSec"] = round(time.perf_counter() - fundamental_started, 3)
     timings["researchSelectionLimit"] = selection_limit
     timings["researchSelectedCount"] = len(candidate_symbols)
 
-    news_started = time.perf_counter()
-    bundles = _collect_news_bundles(candidate_symbols)
-    timings["newsCollectSec"] = round(time.perf_counter() - news_started, 3)
+    with span("trade.news_collect", symbols=len(candidate_symbols)) as phase:
+        bundles = _collect_news_bundles(candidate_symbols)
+    timings["newsCollectSec"] = round(phase.duration_sec, 3)
     timings["newsCandidateCount"] = len([bundle for bundle in bundles.values() if _bundle_has_news(bundle)])
 
-    news_analysis: dict[str, Any] = {}
-    ai_started = time.perf_counter()
-    if ai.has_api_access and bundles:
-        analyzed = _batched_ai_news_analysis(bundles)
-        if isinstance(analyzed, dict) and analyzed.get("error"):
-            payload = {
-                "generatedAt": datetime.now(timezone.utc).isoformat(),
-                "available": False,
-                "reason": "codex_event_analysis_failed",
-                "detail": f"{_s(analyzed.get('error'))} | model={_s(analyzed.get('model') or ai.model)} | reasoning={_s(analyzed.get('reasoningEffort') or ai.reasoning_effort)}",
-                "aiModel": ai.model,
-                "aiReasoningEffort": ai.reasoning_effort,
-                "marketStatus": {
-                    "marketCondition": market_ctx,
-                    "fearGreed": fear_greed,
-                    "macro": macro_ctx,
-                    "optionsMarket": options_market,
-                    "marketRegime": market_regime,
-                },
-                "newsAnalysisLimit": analysis_limit,
-                "researchAnalysisLimit": analysis_limit,
-                "universeScannedCount": len(fundamental_rows),
-                "actionableNow": [],
-                "waitPullback": [],
-                "avoid": [],
-                "referenceOnly": [],
-                "all": [],
-                "summary": {
-                    "actionableCount": 0,
-                    "waitPullbackCount": 0,
-                    "avoidCount": 0,
-                    "referenceOnlyCount": 0,
-                },
-                "timingsSec": {
-                    **timings,
-                    "total": round(time.perf_counter() - started, 3),
-                },
-            }
-            _write_trade_cache(payload, analysis_limit)
-            return payload
-        news_analysis = analyzed
-    timings["codexAnalysisSec"] = round(time.perf_counter() - ai_started, 3)
-
-    short_started = time.perf_counter()
-    short_volume_by_symbol = _DATA_COLLECTOR.collect_short_volume_batch(candidate_symbols)
-    timings["shortVolumeSec"] = round(time.perf_counter() - short_started, 3)
-
-    scan_started = time.perf_counter()
-    cached_chart_rows = None if force_refresh else _load_cached_chart_rows(ttl_minutes)
-    chart_cache_hit = cached_chart_rows is not None
-    if cached_chart_rows is not None:
-        cached_by_symbol = {_s(row.get("symbol")).upper(): row for row in cached_chart_rows if _s(row.get("symbol"))}
-        scanned_rows = [cached_by_symbol[symbol] for symbol in candidate_symbols if symbol in cached_by_symbol]
-        missing_symbols = [symbol for symbol in candidate_symbols if symbol not in cached_by_symbol]
-        if missing_symbols:
-            scanned_rows.extend(_scan_symbols(missing_symbols, {}))
-    else:
-        scanned_rows = _scan_symbols(candidate_symbols, {})
+    analyzed: dict[str, Any] = {}
+    with span("trade.codex_news_analysis", bundles=len(bundles)) as phase:
+        if ai.has_api_access and bundles:
+            analyzed = _batched_ai_news_analysis(bundles)
+    timings["codexAnalysisSec"] = round(phase.duration_sec, 3)
+    if isinstance(analyzed, dict) and analyzed.get("error"):
+        payload = {
+            "generatedAt": datetime.now(timezone.utc).isoformat(),
+            "available": False,
+            "reason": "codex_event_analysis_failed",
+            "detail": f"{_s(analyzed.get('error'))} | model={_s(analyzed.get('model') or ai.model)} | reasoning={_s(analyzed.get('reasoningEffort') or ai.reasoning_effort)}",
+            "aiModel": ai.model,
+            "aiReasoningEffort": ai.reasoning_effort,
+            "marketStatus": {
+                "marketCondition": market_ctx,
+                "fearGreed": fear_greed,
+                "macro": macro_ctx,
+                "optionsMarket": options_market,
+                "marketRegime": market_regime,
+            },
+            "newsAnalysisLimit": analysis_limit,
+            "researchAnalysisLimit": analysis_limit,
+            "universeScannedCount": len(fundamental_rows),
+            "actionableNow": [],
+            "waitPullback": [],
+            "avoid": [],
+            "referenceOnly": [],
+            "all": [],
+            "summary": {
+                "actionableCount": 0,
+                "waitPullbackCount": 0,
+                "avoidCount": 0,
+                "referenceOnlyCount": 0,
+            },
+            "timingsSec": {
+                **timings,
+                "total": round(trace.elapsed(), 3),
+            },
+        }
+        _write_trade_cache(payload, analysis_limit)
+        return payload
+    news_analysis: dict[str, Any] = analyzed
+
+    with span("trade.short_volume", symbols=len(candidate_symbols)) as phase:
+        short_volume_by_symbol = _DATA_COLLECTOR.collect_short_volume_batch(candidate_symbols)
+    timings["shortVolumeSec"] = round(phase.duration_sec, 3)
+
+    with span("trade.chart_rows", symbols=len(candidate_symbols)) as phase:
+        cached_chart_rows = None if force_refresh and not reuse_chart_cache else _load_cached_chart_rows(ttl_minutes)
+        chart_cache_hit = cached_chart_rows is not None
+        if cached_chart_rows is not None:
+            cached_by_symbol = {_s(row.get("symbol")).upper(): row for row in cached_chart_rows if _s(row.get("symbol"))}
+            scanned_rows = [cached_by_symbol[symbol] for symbol in candidate_symbols if symbol in cached_by_symbol]
+            missing_symbols = [symbol for symbol in candidate_symbols if symbol not in cached_by_symbol]
+            if missing_symbols:
+                scanned_rows.extend(_scan_symbols(missing_symbols, {}))
+        else:
+            scanned_rows = _scan_symbols(candidate_symbols, {})
+        phase.set(cache_hit=chart_cache_hit)
     timings["chartCacheHit"] = chart_cache_hit
-    timings["chartRowsSec"] = round(time.perf_counter() - scan_started, 3)
+    timings["chartRowsSec"] = round(phase.duration_sec, 3)
 
     chart_rows_by_symbol = {_s(row.get("symbol")).upper(): row for row in scanned_rows if _s(row.get("symbol"))}
 
-    eval_started = time.perf_counter()
-    evaluated: list[dict[str, Any]] = []
-    for symbol in candidate_symbols:
-        fundamental = fundamental_by_symbol.get(symbol.upper())
-        if not isinstance(fundamental, dict):
-            continue
-        chart_row = chart_rows_by_symbol.get(symbol, {})
-        bundle = bundles.get(symbol, {})
-        news = news_analysis.get(symbol) if isinstance(news_analysis.get(symbol), dict) else {}
-        evaluated.append(
-            _build_raw_evidence_row(
-                symbol=symbol,
-                fundamental=fundamental,
-                chart_row=chart_row,
-                bundle=bundle,
-                news=news,
-                short_volume=short_volume_by_symbol.get(symbol),
-                selected_symbols=selected_symbols,
-                executed_weights_pct=executed_weights_pct,
+    with span("trade.evaluate", symbols=len(candidate_symbols)) as phase:
+        evaluated: list[dict[str, Any]] = []
+        for symbol in candidate_symbols:
+            fundamental = fundamental_by_symbol.get(symbol.upper())
+            if not isinstance(fundamental, dict):
+                continue
+            chart_row = chart_rows_by_symbol.get(symbol, {})
+            bundle = bundles.get(symbol, {})
+            news = news_analysis.get(symbol) if isinstance(news_analysis.get(symbol), dict) else {}
+            evaluated.append(
+                _build_raw_evidence_row(
+                    symbol=symbol,
+                    fundamental=fundamental,
+                    chart_row=chart_row,
+                    bundle=bundle,
+                    news=news,
+                    short_volume=short_volume_by_symbol.get(symbol),
+                    selected_symbols=selected_symbols,
+                    executed_weights_pct=executed_weights_pct,
+                )
             )
-        )
-    timings["evaluateSec"] = round(time.perf_counter() - eval_started, 3)
+    timings["evaluateSec"] = round(phase.duration_sec, 3)
 
-    final_started = time.perf_counter()
-    final_synthesis = _apply_final_synthesis(evaluated, market_bundle)
-    timings["finalSynthesisSec"] = round(time.perf_counter() - final_started, 3)
+    with span("trade.final_synthesis", rows=len(evaluated)) as phase:
+        final_synthesis = _apply_final_synthesis(evaluated, market_bundle)
+    timings["finalSynthesisSec"] = round(phase.duration_sec, 3)
     if isinstance(final_synthesis, dict) and final_synthesis.get("error"):
         payload = {
             "generatedAt": datetime.now(timezone.utc).isoformat(),
@@ -1820,15 +1849,15 @@ def analyze_rebalance_universe(force_refresh: bool = False, news_limit: int | No
             },
             "timingsSec": {
                 **timings,
-                "total": round(time.perf_counter() - started, 3),
+                "total": round(trace.elapsed(), 3),
             },
         }
         _write_trade_cache(payload, analysis_limit)
         return payload
 
-    risk_review_started = time.perf_counter()
-    risk_review = _apply_risk_review(evaluated, market_bundle)
-    timings["riskReviewSec"] = round(time.perf_counter() - risk_review_started, 3)
+    with span("trade.risk_review", rows=len(evaluated)) as phase:
+        risk_review = _apply_risk_review(evaluated, market_bundle)
+    timings["riskReviewSec"] = round(phase.duration_sec, 3)
     if isinstance(risk_review, dict) and risk_review.get("error"):
         payload = {
             "generatedAt": datetime.now(timezone.utc).isoformat(),
@@ -1866,18 +1895,18 @@ def analyze_rebalance_universe(force_refresh: bool = False, news_limit: int | No
             },
             "timingsSec": {
                 **timings,
-                "total": round(time.perf_counter() - started, 3),
+                "total": round(trace.elapsed(), 3),
             },
         }
         _write_trade_cache(payload, analysis_limit)
         return payload
-    integrity_started = time.perf_counter()
-    integrity_audit = _apply_actionable_integrity_audit(evaluated, market_bundle)
-    timings["integrityAuditSec"] = round(time.perf_counter() - integrity_started, 3)
+    with span("trade.integrity_audit", rows=len(evaluated)) as phase:
+        integrity_audit = _apply_actionable_integrity_audit(evaluated, market_bundle)
+    timings["integrityAuditSec"] = round(phase.duration_sec, 3)
     timings["integrityAuditAdjustedCount"] = int(integrity_audit.get("adjustedCount") or 0)
-    profile_started = time.perf_counter()
-    action_profile_summary = _apply_action_profiles(evaluated)
-    timings["actionProfileSec"] = round(time.perf_counter() - profile_started, 3)
+    with span("trade.action_profiles", rows=len(evaluated)) as phase:
+        action_profile_summary = _apply_action_profiles(evaluated)
+    timings["actionProfileSec"] = round(phase.duration_sec, 3)
     evaluated.sort(key=_value_rank_key)
     for idx, row in enumerate(evaluated, start=1):
         row["finalRank"] = idx
@@ -1933,7 +1962,7 @@ def analyze_rebalance_universe(force_refresh: bool = False, news_limit: int | No
         },
         "timingsSec": {
             **timings,
-            "total": round(time.perf_counter() - started, 3),
+            "total": round(trace.elapsed(), 3),
         },
     }
     _write_trade_cache(payload, analysis_limit)
@@ -1941,7 +1970,13 @@ def analyze_rebalance_universe(force_refresh: bool = False, news_limit: int | No
 
 
 def analyze_current_charts(force_refresh: bool = False) -> dict[str, Any]:
-    started = time.perf_counter()
+    with span("trade.analyze_current_charts", force_refresh=force_refresh) as trace:
+        payload = _analyze_current_charts(force_refresh, trace=trace)
+        trace.set(available=bool(payload.get("available")), scanned=int(payload.get("universeScannedCount") or 0))
+        return payload
+
+
+def _analyze_current_charts(force_refresh: bool, *, trace: Span) -> dict[str, Any]:
     OUTPUT_ROOT.mkdir(parents=True, exist_ok=True)
     if (
         not force_refresh
@@ -1957,27 +1992,25 @@ def analyze_current_charts(force_refresh: bool = False) -> dict[str, Any]:
     selected_symbols = {_s(symbol).upper() for symbol in (rebalance.get("final_selected_symbols") or []) if _s(symbol)}
     executed_weights_pct = rebalance.get("executed_weights_pct") if isinstance(rebalance.get("executed_weights_pct"), dict) else {}
 
-    context_started = time.perf_counter()
-    market_bundle = _DATA_COLLECTOR.collect_market_context()
-    context_sec = round(time.perf_counter() - context_started, 3)
-
-    scan_started = time.perf_counter()
-    scanned_rows = _scan_full_universe(rebalance_hints)
-    scan_sec = round(time.perf_counter() - scan_started, 3)
-    eval_started = time.perf_counter()
-    evaluated = [
-        row
-        for row in (
-            _evaluate_chart_row(
-                row,
-                executed_weights_pct=executed_weights_pct,
-                selected_symbols=selected_symbols,
+    with span("trade.market_context") as context_phase:
+        market_bundle = _DATA_COLLECTOR.collect_market_context()
+
+    with span("trade.chart_scan") as scan_phase:
+        scanned_rows = _scan_full_universe(rebalance_hints)
+        scan_phase.set(scanned=len(scanned_rows))
+    with span("trade.chart_evaluate", rows=len(scanned_rows)) as eval_phase:
+        evaluated = [
+            row
+            for row in (
+                _evaluate_chart_row(
+                    row,
+                    executed_weights_pct=executed_weights_pct,
+                    selected_symbols=selected_symbols,
+                )
+                for row in scanned_rows
             )
-            for row in scanned_rows
-        )
-        if isinstance(row, dict)
-    ]
-    eval_sec = round(time.perf_counter() - eval_started, 3)
+            if isinstance(row, dict)
+        ]
 
     price_ready: list[dict[str, Any]] = []
     strict_buyable: list[dict[str, Any]] = []
@@ -2021,10 +2054,11 @@ def analyze_current_charts(force_refresh: bool = False) -> dict[str, Any]:
             "topActionableSymbol": _s(strict_buyable[0].get("symbol")) if strict_buyable else "",
         },
         "timingsSec": {
-            "marketContextSec": context_sec,
-            "chartScanSec": scan_sec,
-            "evaluateSec": eval_sec,
-            "total": round(time.perf_counter() - started, 3),
+            **({"traceId": trace.trace_id} if tracing_enabled() else {}),
+            "marketContextSec": round(context_phase.duration_sec, 3),
+            "chartScanSec": round(scan_phase.duration_sec, 3),
+            "evaluateSec": round(eval_phase.duration_sec, 3),
+            "total": round(trace.elapsed(), 3),
         },
     }
     _write_json(CHART_CACHE_PATH, payload)
@@ -2484,5 +2518,6 @@ __all__ = [
     "full_news_analysis_limit",
     "render_chart_view_html",
     "render_trade_view_html",
+    "trade_cache_is_fresh",
     "CACHE_PATH",
 ]
@@ -0,0 +1,214 @@
+from __future__ import annotations
+
+import asyncio
+import time
+from concurrent.futures import Future
+from threading import get_ident
+from typing import Any, Callable
+
+import requests
+from requests.adapters import HTTPAdapter
+
+
+GLOBAL_SEND_INTERVAL_SEC = 1.0 / 30.0
+PRIVATE_CHAT_INTERVAL_SEC = 1.0
+GROUP_CHAT_INTERVAL_SEC = 60.0 / 20.0
+MAX_RETRY_AFTER_ATTEMPTS = 3
+
+
+def _s(value: Any) -> str:
+    return str(value or "").strip()
+
+
+class TelegramRetryAfter(RuntimeError):
+    def __init__(self, method: str, retry_after: float) -> None:
+        super().__init__(f"{method} rate limited: retry after {retry_after:.1f}s")
+        self.retry_after = float(retry_after)
+
+
+class TelegramTransport:
+    """Telegram Bot API transport: async long polling plus per-chat ordered, rate-limited sends.
+
+    HTTP runs on a pooled ``requests.Session`` offloaded with ``asyncio.to_thread`` so a slow
+    ``sendMessage`` never stalls ``getUpdates``. Outbound messages are queued per chat (keeps
+    message order inside one chat) and paced to Telegram's limits: ~1 msg/s per private chat,
+    20 msg/min per group, 30 msg/s overall. ``retry_after`` from 429 responses is honored.
+    ``enqueue`` returns a future that resolves once Telegram accepted (or finally rejected) the send.
+    """
+
+    def __init__(self, base_url: str, *, poll_timeout: int = 30, pool_size: int = 8) -> None:
+        self.base_url = base_url
+        self.poll_timeout = max(1, int(poll_timeout))
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=2, pool_maxsize=max(2, int(pool_size)))
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        self.loop: asyncio.AbstractEventLoop | None = None
+        self._loop_thread_id: int | None = None
+        self._chat_queues: dict[int, asyncio.Queue[tuple[str, dict[str, Any], Future]]] = {}
+        self._chat_next_at: dict[int, float] = {}
+        self._global_next_at = 0.0
+        self._global_lock: asyncio.Lock | None = None
+
+    def _post_sync(self, method: str, payload: dict[str, Any], timeout: float = 60) -> dict[str, Any]:
+        response = self.session.post(f"{self.base_url}/{method}", json=payload, timeout=timeout)
+        try:
+            response.raise_for_status()
+        except requests.HTTPError:
+            try:
+                payload_json = response.json()
+            except Exception:
+                raise
+            description = _s(payload_json.get("description")).lower()
+            if response.status_code == 400 and "message is not modified" in description:
+                return {"ok": True, "result": None}
+            if response.status_code == 429:
+                params = payload_json.get("parameters") if isinstance(payload_json.get("parameters"), dict) else {}
+                raise TelegramRetryAfter(method, float(params.get("retry_after") or 1))
+            raise
+        return response.json()
+
+    def _running_loop(self) -> asyncio.AbstractEventLoop | None:
+        loop = self.loop
+        if loop is None or not loop.is_running() or loop.is_closed():
+            return None
+        return loop
+
+    def call(self, method: str, payload: dict[str, Any], timeout: float = 60) -> dict[str, Any]:
+        """Blocking call for requests whose result is needed (menu setup, etc.)."""
+        attempts = 0
+        while True:
+            try:
+                return self._post_sync(method, payload, timeout=timeout)
+            except TelegramRetryAfter as exc:
+                attempts += 1
+                if attempts > MAX_RETRY_AFTER_ATTEMPTS:
+                    raise
+                time.sleep(exc.retry_after)
+
+    def enqueue(self, chat_id: int, method: str, payload: dict[str, Any]) -> Future:
+        """Queue a send from any thread; before polling starts the send runs inline.
+
+        The returned future holds the API response, or the error once retries are exhausted, so
+        callers that keep bookkeeping about a delivery can attach it with ``add_done_callback``.
+        """
+        future: Future = Future()
+        loop = self._running_loop()
+        if loop is None:
+            try:
+                future.set_result(self.call(method, payload))
+            except Exception as exc:
+                print(f"telegram send error: chat_id={chat_id} method={method} {type(exc).__name__}: {exc}")
+                future.set_exception(exc)
+            return future
+        if self._loop_thread_id == get_ident():
+            self._enqueue_on_loop(int(chat_id), method, payload, future)
+        else:
+            loop.call_soon_threadsafe(self._enqueue_on_loop, int(chat_id), method, payload, future)
+        return future
+
+    def _enqueue_on_loop(self, chat_id: int, method: str, payload: dict[str, Any], future: Future) -> None:
+        queue = self._chat_queues.get(chat_id)
+        if queue is None:
+            queue = asyncio.Queue()
+            self._chat_queues[chat_id] = queue
+            queue.put_nowait((method, payload, future))
+            asyncio.get_running_loop().create_task(self._chat_worker(chat_id, queue))
+            return
+        queue.put_nowait((method, payload, future))
+
+    def _chat_interval(self, chat_id: int) -> float:
+        return GROUP_CHAT_INTERVAL_SEC if chat_id < 0 else PRIVATE_CHAT_INTERVAL_SEC
+
+    async def _wait_send_slot(self, chat_id: int) -> None:
+        now = time.monotonic()
+        chat_wait = self._chat_next_at.get(chat_id, 0.0) - now
+        if chat_wait > 0:
+            await asyncio.sleep(chat_wait)
+        if self._global_lock is None:
+            self._global_lock = asyncio.Lock()
+        async with self._global_lock:
+            now = time.monotonic()
+            global_wait = self._global_next_at - now
+            if global_wait > 0:
+                await asyncio.sleep(global_wait)
+                now = time.monotonic()
+            self._global_next_at = now + GLOBAL_SEND_INTERVAL_SEC
+        self._chat_next_at[chat_id] = time.monotonic() + self._chat_interval(chat_id)
+
+    async def _chat_worker(self, chat_id: int, queue: asyncio.Queue[tuple[str, dict[str, Any], Future]]) -> None:
+        while True:
+            if queue.empty():
+                self._chat_queues.pop(chat_id, None)
+                return
+            method, payload, future = queue.get_nowait()
+            attempts = 0
+            while True:
+                await self._wait_send_slot(chat_id)
+                try:
+                    response = await asyncio.to_thread(self._post_sync, method, payload)
+                except TelegramRetryAfter as exc:
+                    attempts += 1
+                    if attempts > MAX_RETRY_AFTER_ATTEMPTS:
+                        print(f"telegram send dropped: chat_id={chat_id} method={method} {exc}")
+                        future.set_exception(exc)
+                        break
+                    self._chat_next_at[chat_id] = time.monotonic() + exc.retry_after
+                    continue
+                except Exception as exc:
+                    print(f"telegram send error: chat_id={chat_id} method={method} {type(exc).__name__}: {exc}")
+                    future.set_exception(exc)
+                else:
+                    future.set_result(response)
+                break
+
+    async def get_updates(self, offset: int | None) -> list[dict[str, Any]]:
+        payload: dict[str, Any] = {
+            "timeout": self.poll_timeout,
+            "allowed_updates": ["message", "callback_query"],
+        }
+        if offset is not None:
+            payload["offset"] = int(offset)
+        response = await asyncio.to_thread(self._post_sync, "getUpdates", payload, self.poll_timeout + 15)
+        rows = response.get("result")
+        return rows if isinstance(rows, list) else []
+
+    async def _poll_forever(
+        self,
+        get_offset: Callable[[], int | None],
+        on_update: Callable[[dict[str, Any]], None],
+    ) -> None:
+        self.loop = asyncio.get_running_loop()
+        self._loop_thread_id = get_ident()
+        backoff = 1.0
+        while True:
+            try:
+                updates = await self.get_updates(get_offset())
+                backoff = 1.0
+            except TelegramRetryAfter as exc:
+                await asyncio.sleep(exc.retry_after)
+                continue
+            except Exception as exc:
+                print(f"telegram poll error: {type(exc).__name__}: {exc} (retry in {backoff:.0f}s)")
+                await asyncio.sleep(backoff)
+                backoff = min(30.0, backoff * 2)
+                continue
+            for update in updates:
+                try:
+                    await asyncio.to_thread(on_update, update)
+                except Exception as exc:
+                    print(f"telegram bot error: {type(exc).__name__}: {exc}")
+
+    def run_polling(
+        self,
+        get_offset: Callable[[], int | None],
+        on_update: Callable[[dict[str, Any]], None],
+    ) -> None:
+        try:
+            asyncio.run(self._poll_forever(get_offset, on_update))
+        finally:
+            self.loop = None
+            self._loop_thread_id = None
+
+
+__all__ = ["TelegramRetryAfter", "TelegramTransport"]
@@ -0,0 +1,168 @@
+from __future__ import annotations
+
+import os
+import time
+from datetime import datetime, time as dt_time
+from threading import Event, Thread
+from typing import Any, Callable
+from zoneinfo import ZoneInfo
+
+from core.market_calendar import load_market_calendar
+from local_telegram_trade import (
+    analyze_current_charts,
+    analyze_rebalance_universe,
+    full_news_analysis_limit,
+    trade_cache_is_fresh,
+)
+
+
+MARKET_TZ = ZoneInfo("America/New_York")
+DEFAULT_WINDOWS = "08:45-09:35,12:00-12:30"
+CHECK_INTERVAL_SEC = 30
+
+
+def _s(value: Any) -> str:
+    return str(value or "").strip()
+
+
+def _env_bool(key: str, default: bool) -> bool:
+    raw = _s(os.getenv(key, "1" if default else "0")).lower()
+    return raw in {"1", "true", "yes", "on", "y"}
+
+
+def _env_int(key: str, default: int, minimum: int = 1, maximum: int | None = None) -> int:
+    try:
+        value = int(os.getenv(key, str(default)))
+    except Exception:
+        value = int(default)
+    value = max(minimum, value)
+    if maximum is not None:
+        value = min(maximum, value)
+    return value
+
+
+def _parse_clock(text: str) -> dt_time:
+    hour, minute = text.strip().split(":", 1)
+    return dt_time(int(hour), int(minute))
+
+
+def parse_warm_windows(raw: str) -> list[tuple[dt_time, dt_time]]:
+    windows: list[tuple[dt_time, dt_time]] = []
+    for part in _s(raw).split(","):
+        if "-" not in part:
+            continue
+        start_text, end_text = part.split("-", 1)
+        try:
+            start, end = _parse_clock(start_text), _parse_clock(end_text)
+        except Exception:
+            print(f"warm cache window ignored: {part!r}")
+            continue
+        if start < end:
+            windows.append((start, end))
+    return windows
+
+
+def warm_cache_windows() -> list[tuple[dt_time, dt_time]]:
+    return parse_warm_windows(os.getenv("TELEGRAM_WARM_CACHE_WINDOWS", DEFAULT_WINDOWS))
+
+
+def warm_cache_modes() -> list[str]:
+    modes = [mode for mode in _s(os.getenv("TELEGRAM_WARM_CACHE_MODES", "q")).lower().replace(" ", "").split(",") if mode in {"q", "f"}]
+    return modes or ["q"]
+
+
+def in_warm_window(now: datetime | None = None, windows: list[tuple[dt_time, dt_time]] | None = None) -> bool:
+    local_now = (now or datetime.now(MARKET_TZ)).astimezone(MARKET_TZ)
+    if not load_market_calendar().is_trading_day(local_now.date()):
+        return False
+    clock = local_now.time().replace(second=0, microsecond=0)
+    return any(start <= clock < end for start, end in (windows if windows is not None else warm_cache_windows()))
+
+
+def run_warm_analysis(mode: str) -> dict[str, Any]:
+    """Rebuild the trade cache for ``mode`` once it has expired; a fresh cache is returned as is.
+
+    The chart cache is refreshed first (only when it is stale too) and reused by the trade analysis.
+    """
+    started = time.perf_counter()
+    news_limit = full_news_analysis_limit() if mode == "f" else None
+    if trade_cache_is_fresh(news_limit):
+        print(f"warm cache skipped: mode={mode} trade cache still fresh")
+        return analyze_rebalance_universe(news_limit=news_limit)
+    analyze_current_charts()
+    chart_sec = time.perf_counter() - started
+    payload = analyze_rebalance_universe(news_limit=news_limit, reuse_chart_cache=True)
+    print(
+        "warm cache finished: "
+        f"mode={mode} available={bool(payload.get('available'))} "
+        f"chart={chart_sec:.1f}s total={time.perf_counter() - started:.1f}s"
+    )
+    return payload
+
+
+class WarmCacheScheduler:
+    """Submits warm-cache runs while the ET clock is inside a configured market window.
+
+    ``submit(mode)`` hands the run to the bot's job queue so an interactive request for the
+    same analysis attaches to the warm run instead of starting another one.
+    """
+
+    def __init__(self, submit: Callable[[str], str]) -> None:
+        self.submit = submit
+        self.windows = warm_cache_windows()
+        self.modes = warm_cache_modes()
+        self.interval_sec = _env_int("TELEGRAM_WARM_CACHE_INTERVAL_MINUTES", 12, minimum=1, maximum=240) * 60
+        self.last_submitted: dict[str, float] = {}
+        self._stop = Event()
+        self._thread: Thread | None = None
+
+    @property
+    def enabled(self) -> bool:
+        return _env_bool("TELEGRAM_WARM_CACHE_ENABLED", True) and bool(self.windows)
+
+    def tick(self, now: datetime | None = None) -> list[str]:
+        if not in_warm_window(now, self.windows):
+            return []
+        submitted: list[str] = []
+        mono = time.monotonic()
+        for mode in self.modes:
+            last = self.last_submitted.get(mode)
+            if last is not None and mono - last < self.interval_sec:
+                continue
+            try:
+                status = self.submit(mode)
+            except Exception as exc:
+                print(f"warm cache submit error: mode={mode} {type(exc).__name__}: {exc}")
+                continue
+            self.last_submitted[mode] = mono
+            submitted.append(f"{mode}:{status}")
+        return submitted
+
+    def _loop(self) -> None:
+        while not self._stop.is_set():
+            submitted = self.tick()
+            if submitted:
+                print(f"warm cache scheduled: {', '.join(submitted)}")
+            self._stop.wait(CHECK_INTERVAL_SEC)
+
+    def start(self) -> bool:
+        if not self.enabled or self._thread is not None:
+            return False
+        self._thread = Thread(target=self._loop, name="telegram-warm-cache", daemon=True)
+        self._thread.start()
+        windows = ", ".join(f"{start:%H:%M}-{end:%H:%M}" for start, end in self.windows)
+        print(f"warm cache scheduler started: windows={windows} ET modes={','.join(self.modes)} interval={self.interval_sec // 60}m")
+        return True
+
+    def stop(self) -> None:
+        self._stop.set()
+
+
+__all__ = [
+    "WarmCacheScheduler",
+    "in_warm_window",
+    "parse_warm_windows",
+    "run_warm_analysis",
+    "warm_cache_modes",
+    "warm_cache_windows",
+]
@@ -14,14 +14,14 @@ sys.path.insert(0, str(ROOT))
 sys.path.insert(0, str(ROOT / "src"))
 
 from event_profile import load_event_profile, symbol_slug
-from event_runtime.engine import run_runtime_cycle, run_runtime_loop
-from nautilus_v2.bridge import export_symbol_bundle
-from pipelines.autostock_v2_pipeline import run_autostock_v2
-from core.data_collector import DataCollector
+
+# Mode dependencies (pandas, yfinance, ta, the analyzer, the shared DataCollector and its HTTP
+# session, nautilus_trader) are imported inside each mode function, so --help or --telegram-bot
+# only load what they use. scripts/check_startup_time.py guards this.
 
 
 DATA_ROOT = ROOT / "data" / "nautilus_v2"
-_DATA_COLLECTOR = DataCollector(root=ROOT)
+CATALOG_ROOT = ROOT / "data" / "nautilus_v2_catalog"
 
 
 def _configure_console_output() -> None:
@@ -38,6 +38,11 @@ def _s(value: Any) -> str:
     return str(value or "").strip()
 
 
+def _env_bool(key: str, default: bool = False) -> bool:
+    raw = str(os.getenv(key, "1" if default else "0")).strip().lower()
+    return raw in {"1", "true", "yes", "on", "y"}
+
+
 def _profile(profile_name: str | None) -> dict[str, Any]:
     return load_event_profile(profile_name)
 
@@ -47,6 +52,10 @@ def _bundle_dir(profile: dict[str, Any], date_tag: str | None = None) -> Path:
     return DATA_ROOT / _s(profile.get("name") or symbol_slug(profile)) / tag
 
 
+def _catalog_dir(profile: dict[str, Any]) -> Path:
+    return CATALOG_ROOT / _s(profile.get("name") or symbol_slug(profile))
+
+
 def _latest_bundle_dir(profile: dict[str, Any]) -> Path:
     base_dir = DATA_ROOT / _s(profile.get("name") or symbol_slug(profile))
     candidates = [item for item in base_dir.glob("*") if item.is_dir()]
@@ -57,6 +66,8 @@ def _latest_bundle_dir(profile: dict[str, Any]) -> Path:
 
 
 def run_signal_once(profile_name: str | None) -> dict[str, Any]:
+    from pipelines.autostock_v2_pipeline import run_autostock_v2
+
     profile = _profile(profile_name)
     print(f"[{datetime.now()}] signal analysis started...")
     result = run_autostock_v2(profile=profile, watchlist_override=list(profile.get("symbols", [])))
@@ -78,11 +89,37 @@ def run_signal_once(profile_name: str | None) -> dict[str, Any]:
     return result
 
 
-def run_runtime_once(profile_name: str | None, loop: bool, interval_seconds: int) -> dict[str, Any]:
+def run_runtime_profiles(profile_names: list[str], loop: bool, interval_seconds: int | None) -> dict[str, Any]:
+    from event_runtime.host import run_runtime_host
+
+    print(f"[{datetime.now()}] event runtime host started: {', '.join(profile_names)}")
+    result = run_runtime_host(
+        profile_names,
+        loop=loop,
+        interval_seconds=max(5, int(interval_seconds)) if interval_seconds is not None else None,
+    )
+    for name, row in (result.get("profiles") or {}).items():
+        if row.get("error"):
+            print(f"[{name}] error: {row.get('error')}")
+            continue
+        print(f"[{name}] notifications: {row.get('notification_count', 0)} | outbox_jsonl: {row.get('outbox_path')}")
+    return result
+
+
+def run_runtime_once(profile_name: str | None, loop: bool, interval_seconds: int | None) -> dict[str, Any]:
+    from event_runtime.engine import run_runtime_cycle, run_runtime_loop
+    from event_runtime.host import parse_profile_names
+
+    profile_names = parse_profile_names(profile_name)
+    if len(profile_names) > 1:
+        return run_runtime_profiles(profile_names, loop, interval_seconds)
     profile = _profile(profile_name)
     print(f"[{datetime.now()}] event runtime started...")
     result = (
-        run_runtime_loop(profile_name=_s(profile.get("name")), interval_seconds=max(5, int(interval_seconds)))
+        run_runtime_loop(
+            profile_name=_s(profile.get("name")),
+            interval_seconds=max(5, int(interval_seconds)) if interval_seconds is not None else None,
+        )
         if loop
         else run_runtime_cycle(profile_name=_s(profile.get("name")))
     )
@@ -95,39 +132,53 @@ def run_runtime_once(profile_name: str | None, loop: bool, interval_seconds: int
 
 
 def export_nautilus_bundle(profile_name: str | None) -> dict[str, Any]:
+    from event_runtime.collect import shared_data_collector
+    from nautilus_v2.bridge import export_profile_bundle
+    from pipelines.autostock_v2_pipeline import run_autostock_v2
+
     profile = _profile(profile_name)
-    symbol = _s(profile.get("primary_symbol", "TSLA")).upper()
+    symbols = [_s(item).upper() for item in profile.get("symbols", []) if _s(item)] or [_s(profile.get("primary_symbol", "TSLA")).upper()]
+    nautilus = profile.get("nautilus", {}) if isinstance(profile.get("nautilus"), dict) else {}
     print(f"[{datetime.now()}] nautilus bundle export started...")
-    result = run_autostock_v2(profile=profile, watchlist_override=list(profile.get("symbols", [symbol])))
+    result = run_autostock_v2(profile=profile, watchlist_override=list(symbols))
     payload = result.get("payload", {}) if isinstance(result, dict) else {}
-    bars_df = _DATA_COLLECTOR.get_stock_data(
-        symbol,
-        period=str(os.getenv("AI_EVENT_BARS_PERIOD", "15mo") or "15mo"),
-        auto_adjust=False,
-    )
+    period = str(os.getenv("AI_EVENT_BARS_PERIOD", "15mo") or "15mo")
+    collector = shared_data_collector()
+    bars_by_symbol = {symbol: collector.get_stock_data(symbol, period=period, auto_adjust=False) for symbol in symbols}
     out_dir = _bundle_dir(profile)
-    paths = export_symbol_bundle(
+    bundle = export_profile_bundle(
         payload=payload if isinstance(payload, dict) else {},
-        bars_df=bars_df,
+        bars_by_symbol=bars_by_symbol,
         output_dir=out_dir,
-        symbol=symbol,
+        venue=_s(nautilus.get("venue")) or "XNAS",
+        primary_symbol=symbols[0],
     )
     print(f"bundle_dir: {out_dir}")
-    for key, value in paths.items():
-        print(f"{key}: {value}")
+    print(f"manifest: {bundle['manifest']}")
+    paths: dict[str, str] = {}
+    for entry in bundle["instruments"]:
+        for key, name in entry["files"].items():
+            paths[f"{entry['slug']}_{key}"] = str(out_dir / name)
+            print(f"{entry['symbol']} {key}: {out_dir / name}")
     return {
         "profile": _s(profile.get("name")),
         "bundle_dir": str(out_dir),
+        "manifest": bundle["manifest"],
         "paths": paths,
         "signal_report": result.get("report_path"),
     }
 
 
 def run_nautilus_backtest(profile_name: str | None) -> dict[str, Any]:
+    from nautilus_v2.loader import backtest_input_hash, load_cached_backtest
+
     profile = _profile(profile_name)
     print(f"[{datetime.now()}] nautilus backtest started...")
+    bundle_dir = _latest_bundle_dir(profile)
+    output_path = bundle_dir / f"{symbol_slug(profile)}_nautilus_backtest_summary.json"
+    input_hash = backtest_input_hash(bundle_dir, profile)
     try:
-        from nautilus_v2.backtest import import_tsla_bundle_to_catalog, run_tsla_backtest_in_memory
+        from nautilus_v2.backtest import append_bundle_to_catalog, run_bundle_backtest_in_memory
     except ModuleNotFoundError as exc:
         if "nautilus_trader" not in str(exc):
             raise
@@ -146,18 +197,18 @@ def run_nautilus_backtest(profile_name: str | None) -> dict[str, Any]:
         if proc.returncode != 0:
             raise RuntimeError(proc.stderr or proc.stdout or "nautilus backtest failed")
         print(proc.stdout.strip())
-        bundle_dir = _latest_bundle_dir(profile)
-        output_path = bundle_dir / f"{symbol_slug(profile)}_nautilus_backtest_summary.json"
         return json.loads(output_path.read_text(encoding="utf-8"))
 
-    bundle_dir = _latest_bundle_dir(profile)
-    catalog_dir = bundle_dir / "catalog"
-    import_info = import_tsla_bundle_to_catalog(bundle_dir, catalog_dir)
-    summary = run_tsla_backtest_in_memory(bundle_dir)
-    output_path = bundle_dir / f"{symbol_slug(profile)}_nautilus_backtest_summary.json"
+    import_info = append_bundle_to_catalog(bundle_dir, _catalog_dir(profile))
+    cached = load_cached_backtest(output_path, input_hash) if _env_bool("AI_NAUTILUS_BACKTEST_CACHE_ENABLED", True) else None
+    if cached is not None:
+        print(f"backtest cache hit ({input_hash[:12]}): {output_path}")
+        return {**cached, "catalog_import": import_info}
+    summary = run_bundle_backtest_in_memory(bundle_dir, _s(profile.get("name")))
     payload = {
         "profile": _s(profile.get("name")),
         "bundle_dir": str(bundle_dir),
+        "input_hash": input_hash,
         "catalog_import": import_info,
         "backtest_summary": summary,
     }
@@ -208,9 +259,14 @@ def _build_parser() -> argparse.ArgumentParser:
     mode.add_argument("--telegram-export", action="store_true", help="Export local Telegram snapshot data")
     mode.add_argument("--telegram-bot", action="store_true", help="Run local Telegram polling bot")
     mode.add_argument("--all", action="store_true", help="Run runtime -> Nautilus bundle -> backtest -> Telegram export")
-    parser.add_argument("--profile", default="tsla", help="Event profile name or JSON path")
+    parser.add_argument("--profile", default="tsla", help="Event profile name or JSON path (--runtime accepts a comma list)")
     parser.add_argument("--loop", action="store_true", help="Run runtime continuously")
-    parser.add_argument("--interval-sec", type=int, default=60, help="Runtime polling interval in seconds")
+    parser.add_argument(
+        "--interval-sec",
+        type=int,
+        default=None,
+        help="Fixed runtime polling interval in seconds (default: market-calendar phase schedule)",
+    )
     return parser
 
 
@@ -224,7 +280,7 @@ def main(argv: list[str] | None = None) -> None:
         run_signal_once(args.profile)
         return
     if args.runtime:
-        run_runtime_once(args.profile, loop=bool(args.loop), interval_seconds=max(5, int(args.interval_sec)))
+        run_runtime_once(args.profile, loop=bool(args.loop), interval_seconds=args.interval_sec)
         return
     if args.nautilus_bundle:
         export_nautilus_bundle(args.profile)
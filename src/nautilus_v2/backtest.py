@@ -1,5 +1,8 @@
 from __future__ import annotations
 
+import hashlib
+import json
+from datetime import datetime, timezone
 from decimal import Decimal
 from pathlib import Path
 from typing import Any
@@ -14,15 +17,25 @@ from nautilus_trader.model.enums import BookType
 from nautilus_trader.model.enums import OmsType
 from nautilus_trader.model.data import Bar
 from nautilus_trader.model.data import BarType
+from nautilus_trader.model.identifiers import ClientId
 from nautilus_trader.model.identifiers import Venue
 from nautilus_trader.model.objects import Money
 from nautilus_trader.persistence.catalog.parquet import ParquetDataCatalog
 from nautilus_trader.persistence.catalog.singleton import clear_singleton_instances
+from nautilus_trader.persistence.wranglers import BarDataWrangler
 from nautilus_trader.test_kit.providers import TestInstrumentProvider
 from nautilus_trader.examples.strategies.ema_cross import EMACross
 from nautilus_trader.examples.strategies.ema_cross import EMACrossConfig
 
-from nautilus_v2.loader import load_tsla_bars_csv
+from nautilus_v2.custom_data import DEFAULT_CLIENT_ID
+from nautilus_v2.custom_data import EventTape
+from nautilus_v2.custom_data import EventTapeConfig
+from nautilus_v2.custom_data import MacroEvent
+from nautilus_v2.custom_data import NewsEvent
+from nautilus_v2.custom_data import macro_from_envelope
+from nautilus_v2.custom_data import news_from_envelope
+from nautilus_v2.loader import load_bars_frame, load_bundle_manifest, load_envelopes
+from core.tracing import span
 from event_profile import load_event_profile
 
 
@@ -30,36 +43,69 @@ def _s(value: Any) -> str:
     return str(value or "").strip()
 
 
+def symbol_instrument(symbol: str, venue: str = "XNAS"):
+    return TestInstrumentProvider.equity(symbol=_s(symbol).upper(), venue=_s(venue).upper() or "XNAS")
+
+
+def symbol_bar_type(instrument) -> BarType:
+    return BarType.from_str(f"{instrument.id}-1-DAY-LAST-EXTERNAL")
+
+
 def tsla_instrument():
-    return TestInstrumentProvider.equity(symbol="TSLA", venue="XNAS")
+    return symbol_instrument("TSLA", "XNAS")
 
 
 def tsla_bar_type() -> BarType:
-    instrument = tsla_instrument()
-    return BarType.from_str(f"{instrument.id}-1-DAY-LAST-EXTERNAL")
+    return symbol_bar_type(tsla_instrument())
 
 
-def _csv_rows_to_bars(bars_csv: str | Path) -> list[Bar]:
-    frame = load_tsla_bars_csv(bars_csv)
-    bar_type = tsla_bar_type()
-    bars: list[Bar] = []
-    for _, row in frame.iterrows():
-        bars.append(
-            Bar.from_dict(
-                {
-                    "type": "Bar",
-                    "bar_type": str(bar_type),
-                    "open": f"{float(row['open']):.2f}",
-                    "high": f"{float(row['high']):.2f}",
-                    "low": f"{float(row['low']):.2f}",
-                    "close": f"{float(row['close']):.2f}",
-                    "volume": str(int(float(row["volume"]))),
-                    "ts_event": int(row["ts_event"]),
-                    "ts_init": int(row["ts_event"]),
-                }
-            )
-        )
-    return bars
+def _bundle_bars(bundle_dir: str | Path, slug: str = "tsla", instrument=None) -> list[Bar]:
+    """Whole-frame conversion through Nautilus's BarDataWrangler instead of per-row ``Bar.from_dict``."""
+    return bars_from_frame(load_bars_frame(bundle_dir, slug), instrument or tsla_instrument())
+
+
+def bars_from_frame(frame: Any, instrument: Any) -> list[Bar]:
+    """Float OHLCV frame indexed by UTC timestamp -> daily ``Bar`` objects for ``instrument``."""
+    if frame.empty:
+        return []
+    return BarDataWrangler(bar_type=symbol_bar_type(instrument), instrument=instrument).process(frame)
+
+
+def _bundle_instruments(bundle: Path, default_venue: str = "XNAS") -> list[tuple[Any, str]]:
+    """``(instrument, slug)`` for every symbol listed in the bundle manifest."""
+    out: list[tuple[Any, str]] = []
+    for entry in load_bundle_manifest(bundle).get("instruments", []):
+        if not isinstance(entry, dict) or not _s(entry.get("symbol")):
+            continue
+        symbol = _s(entry.get("symbol")).upper()
+        instrument = symbol_instrument(symbol, _s(entry.get("venue")) or default_venue)
+        out.append((instrument, _s(entry.get("slug")) or symbol.lower()))
+    return out
+
+
+def _load_bundle(bundle: Path, default_venue: str = "XNAS") -> tuple[list[Any], dict[str, list[Bar]]]:
+    instruments: list[Any] = []
+    bars_by_instrument: dict[str, list[Bar]] = {}
+    for instrument, slug in _bundle_instruments(bundle, default_venue):
+        instruments.append(instrument)
+        bars_by_instrument[str(instrument.id)] = _bundle_bars(bundle, slug, instrument)
+    return instruments, bars_by_instrument
+
+
+def _bundle_custom_data(bundle: Path, default_venue: str = "XNAS") -> tuple[list[NewsEvent], list[MacroEvent]]:
+    """News/macro envelopes of every bundle symbol as Nautilus custom data, each list in ``ts_init`` order."""
+    news: list[NewsEvent] = []
+    macro: list[MacroEvent] = []
+    for instrument, slug in _bundle_instruments(bundle, default_venue):
+        news.extend(news_from_envelope(row, instrument.id) for row in load_envelopes(bundle / f"{slug}_news_events.jsonl"))
+        macro.extend(macro_from_envelope(row, instrument.id) for row in load_envelopes(bundle / f"{slug}_macro_events.jsonl"))
+    news.sort(key=lambda item: item.ts_init)
+    macro.sort(key=lambda item: item.ts_init)
+    return news, macro
+
+
+def _merged_bars(bars_by_instrument: dict[str, list[Bar]]) -> list[Bar]:
+    return sorted((bar for bars in bars_by_instrument.values() for bar in bars), key=lambda bar: bar.ts_init)
 
 
 def setup_catalog(path: str | Path) -> ParquetDataCatalog:
@@ -71,83 +117,301 @@ def setup_catalog(path: str | Path) -> ParquetDataCatalog:
     return catalog
 
 
-def import_tsla_bundle_to_catalog(bundle_dir: str | Path, catalog_dir: str | Path) -> dict[str, Any]:
+def import_bundle_to_catalog(bundle_dir: str | Path, catalog_dir: str | Path) -> dict[str, Any]:
+    """Write every bundle instrument, then all of their bars, to the catalog in one batched pass each."""
     bundle = Path(bundle_dir).resolve()
     catalog = setup_catalog(catalog_dir)
-    instrument = tsla_instrument()
-    bars = _csv_rows_to_bars(bundle / "tsla_bars.csv")
+    instruments, bars_by_instrument = _load_bundle(bundle)
+    news, macro = _bundle_custom_data(bundle)
 
-    catalog.write_data([instrument])
-    catalog.write_data(bars)
+    bars = _merged_bars(bars_by_instrument)
+    with span("nautilus.catalog_write", mode="import", bars=len(bars), news=len(news), macro=len(macro)):
+        if instruments:
+            catalog.write_data(instruments)
+        if bars:
+            catalog.write_data(bars)
+        for rows in (news, macro):
+            if rows:
+                catalog.write_data(rows)
 
     return {
         "catalog_path": str(Path(catalog.path)),
         "bar_count": len(bars),
-        "news_count": 0,
-        "macro_count": 0,
-        "instrument_id": str(instrument.id),
-        "bar_type": str(tsla_bar_type()),
+        "bar_count_by_instrument": {key: len(value) for key, value in bars_by_instrument.items()},
+        "news_count": len(news),
+        "macro_count": len(macro),
+        "instrument_ids": [str(instrument.id) for instrument in instruments],
+        "bar_types": [str(symbol_bar_type(instrument)) for instrument in instruments],
     }
 
 
-def run_tsla_backtest_in_memory(bundle_dir: str | Path) -> dict[str, Any]:
+def import_tsla_bundle_to_catalog(bundle_dir: str | Path, catalog_dir: str | Path) -> dict[str, Any]:
+    info = import_bundle_to_catalog(bundle_dir, catalog_dir)
+    info["instrument_id"] = info["instrument_ids"][0] if info["instrument_ids"] else str(tsla_instrument().id)
+    info["bar_type"] = info["bar_types"][0] if info["bar_types"] else str(tsla_bar_type())
+    return info
+
+
+CATALOG_MANIFEST = "import_manifest.json"
+CATALOG_MANIFEST_SCHEMA = "autostock.nautilus_v2.catalog_import.v1"
+CATALOG_MANIFEST_HISTORY = 60
+
+
+def _read_catalog_manifest(catalog_dir: Path) -> dict[str, Any]:
+    try:
+        payload = json.loads((catalog_dir / CATALOG_MANIFEST).read_text(encoding="utf-8"))
+    except Exception:
+        return {}
+    return payload if isinstance(payload, dict) and payload.get("schema") == CATALOG_MANIFEST_SCHEMA else {}
+
+
+def _catalog_high_water(catalog: ParquetDataCatalog, bar_type: BarType) -> int:
+    """Latest bar ``ts_event`` already in the catalog; only used when the manifest is missing."""
+    try:
+        bars = catalog.bars(bar_types=[str(bar_type)])
+    except Exception:
+        return 0
+    return max((bar.ts_event for bar in bars), default=0)
+
+
+def _after_high_water(rows: list[Any], high_water_ns: int) -> list[Any]:
+    """Rows newer than ``high_water_ns``, one per ``ts_event`` (the last one wins), in time order."""
+    by_ts: dict[int, Any] = {}
+    for row in rows:
+        if row.ts_event > high_water_ns:
+            by_ts[row.ts_event] = row
+    return [by_ts[key] for key in sorted(by_ts)]
+
+
+def _event_key(row: Any) -> tuple[str, int, str]:
+    """``(instrument, ts_event, payload hash)`` identity of a news/macro row."""
+    payload_hash = hashlib.blake2b(_s(row.payload_json).encode("utf-8"), digest_size=16).hexdigest()
+    return str(row.instrument_id), int(row.ts_event), payload_hash
+
+
+def _catalog_event_keys(catalog: ParquetDataCatalog, data_cls: type) -> set[tuple[str, int, str]]:
+    """Keys of every ``data_cls`` row already in the catalog, read back so the manifest cannot drift."""
+    try:
+        rows = catalog.query(data_cls=data_cls)
+    except Exception as exc:
+        print(f"[warn] catalog {data_cls.__name__} read failed: {type(exc).__name__}: {exc}")
+        return set()
+    return {_event_key(row) for row in rows}
+
+
+def _unseen_events(rows: list[Any], seen: set[tuple[str, int, str]]) -> list[Any]:
+    """Rows whose key is not in ``seen`` (late arrivals included), in time order; ``seen`` is updated."""
+    out: list[Any] = []
+    for row in rows:
+        key = _event_key(row)
+        if key in seen:
+            continue
+        seen.add(key)
+        out.append(row)
+    return sorted(out, key=lambda row: row.ts_init)
+
+
+def append_bundle_to_catalog(bundle_dir: str | Path, catalog_dir: str | Path) -> dict[str, Any]:
+    """Append a bundle to a persistent catalog, writing only the rows it does not already hold.
+
+    Bars go past each instrument's high-water mark, kept with a short import history in
+    ``import_manifest.json``. News/macro rows are deduplicated by ``(ts_event, payload hash)``
+    against what the catalog already stores, so late RSS items still land and a missing manifest
+    does not duplicate them.
+    """
     bundle = Path(bundle_dir).resolve()
-    profile = load_event_profile("tsla")
-    nautilus = profile.get("nautilus", {}) if isinstance(profile.get("nautilus"), dict) else {}
-    instrument = tsla_instrument()
-    bar_type = tsla_bar_type()
-    bars = _csv_rows_to_bars(bundle / "tsla_bars.csv")
+    catalog = setup_catalog(catalog_dir)
+    catalog_path = Path(catalog.path)
+    manifest = _read_catalog_manifest(catalog_path)
+    known: dict[str, dict[str, Any]] = manifest.get("instruments", {}) if isinstance(manifest.get("instruments"), dict) else {}
+
+    instruments, bars_by_instrument = _load_bundle(bundle)
+    news, macro = _bundle_custom_data(bundle)
+    new_news = _unseen_events(news, _catalog_event_keys(catalog, NewsEvent) if news else set())
+    new_macro = _unseen_events(macro, _catalog_event_keys(catalog, MacroEvent) if macro else set())
+    new_instruments = [instrument for instrument in instruments if str(instrument.id) not in known]
+    new_bars: list[Bar] = []
+    added_by_instrument: dict[str, int] = {}
+    for instrument in instruments:
+        key = str(instrument.id)
+        bar_type = symbol_bar_type(instrument)
+        state = dict(known.get(key) or {})
+        if not state:
+            state = {"bar_type": str(bar_type), "bar_high_water_ns": _catalog_high_water(catalog, bar_type), "bar_count": 0}
+        bars = _after_high_water(bars_by_instrument.get(key, []), int(state.get("bar_high_water_ns", 0)))
+        if bars:
+            state["bar_high_water_ns"] = bars[-1].ts_event
+            state["bar_count"] = int(state.get("bar_count", 0)) + len(bars)
+        state.pop("news_high_water_ns", None)
+        state.pop("macro_high_water_ns", None)
+        known[key] = state
+        added_by_instrument[key] = len(bars)
+        new_bars.extend(bars)
+
+    with span("nautilus.catalog_write", mode="append", bars=len(new_bars), news=len(new_news), macro=len(new_macro)):
+        if new_instruments:
+            catalog.write_data(new_instruments)
+        for rows in (new_bars, new_news, new_macro):
+            if rows:
+                catalog.write_data(sorted(rows, key=lambda row: row.ts_init))
+
+    history = manifest.get("imports", []) if isinstance(manifest.get("imports"), list) else []
+    history.append(
+        {
+            "bundle_dir": str(bundle),
+            "imported_at": datetime.now(timezone.utc).isoformat(),
+            "new_instruments": len(new_instruments),
+            "new_bars": len(new_bars),
+            "new_news": len(new_news),
+            "new_macro": len(new_macro),
+        }
+    )
+    manifest = {
+        "schema": CATALOG_MANIFEST_SCHEMA,
+        "instruments": known,
+        "imports": history[-CATALOG_MANIFEST_HISTORY:],
+    }
+    tmp_path = catalog_path / (CATALOG_MANIFEST + ".tmp")
+    tmp_path.write_text(json.dumps(manifest, ensure_ascii=False, indent=2) + "\n", encoding="utf-8")
+    tmp_path.replace(catalog_path / CATALOG_MANIFEST)
+
+    return {
+        "catalog_path": str(catalog_path),
+        "mode": "append",
+        "bar_count": sum(int(row.get("bar_count", 0)) for row in known.values()),
+        "new_bar_count": len(new_bars),
+        "new_bar_count_by_instrument": added_by_instrument,
+        "news_count": len(new_news),
+        "macro_count": len(new_macro),
+        "instrument_ids": [str(instrument.id) for instrument in instruments],
+        "bar_types": [str(symbol_bar_type(instrument)) for instrument in instruments],
+    }
+
 
+def strategy_params(nautilus: dict[str, Any]) -> dict[str, Any]:
+    """EMACross parameters from a profile ``nautilus`` block (or a sweep config)."""
+    return {
+        "trade_size": str(nautilus.get("trade_size", "10")),
+        "fast_ema_period": int(nautilus.get("fast_ema_period", 10)),
+        "slow_ema_period": int(nautilus.get("slow_ema_period", 20)),
+        "subscribe_quote_ticks": bool(nautilus.get("subscribe_quote_ticks", False)),
+        "subscribe_trade_ticks": bool(nautilus.get("subscribe_trade_ticks", True)),
+        "request_bars": bool(nautilus.get("request_bars", True)),
+    }
+
+
+def new_engine(instruments: list[Any], bars_by_instrument: dict[str, list[Bar]]) -> BacktestEngine:
+    """Engine with one cash venue per distinct instrument venue, every instrument and all bars loaded."""
     engine = BacktestEngine(
         config=BacktestEngineConfig(
             logging=LoggingConfig(log_level="INFO", bypass_logging=True),
             risk_engine=RiskEngineConfig(bypass=True),
         )
     )
-    engine.add_venue(
-        venue=Venue("XNAS"),
-        oms_type=OmsType.NETTING,
-        account_type=AccountType.CASH,
-        base_currency=USD,
-        starting_balances=[Money(100_000, USD)],
-        book_type=BookType.L1_MBP,
-        bar_execution=True,
-    )
-    engine.add_instrument(instrument)
-    engine.add_data(bars)
-
-    strategy = EMACross(
-        EMACrossConfig(
-            instrument_id=instrument.id,
-            bar_type=bar_type,
-            trade_size=Decimal(str(nautilus.get("trade_size", "10"))),
-            fast_ema_period=int(nautilus.get("fast_ema_period", 10)),
-            slow_ema_period=int(nautilus.get("slow_ema_period", 20)),
-            subscribe_quote_ticks=bool(nautilus.get("subscribe_quote_ticks", False)),
-            subscribe_trade_ticks=bool(nautilus.get("subscribe_trade_ticks", True)),
-            request_bars=bool(nautilus.get("request_bars", True)),
+    for venue in sorted({str(instrument.id.venue) for instrument in instruments}):
+        engine.add_venue(
+            venue=Venue(venue),
+            oms_type=OmsType.NETTING,
+            account_type=AccountType.CASH,
+            base_currency=USD,
+            starting_balances=[Money(100_000, USD)],
+            book_type=BookType.L1_MBP,
+            bar_execution=True,
         )
-    )
-    engine.add_strategy(strategy)
-    engine.run()
-    result = engine.get_result()
+    for instrument in instruments:
+        engine.add_instrument(instrument)
+    engine.add_data(_merged_bars(bars_by_instrument))
+    return engine
+
+
+def result_summary(result: Any) -> dict[str, Any]:
+    if result is None:
+        return {}
+    summary: dict[str, Any] = {"result_type": type(result).__name__}
+    for attr in ("run_id", "run_config_id", "instance_id"):
+        if hasattr(result, attr):
+            summary[attr] = _s(getattr(result, attr))
+    if hasattr(result, "stats_pnls"):
+        summary["stats_pnls"] = getattr(result, "stats_pnls")
+    if hasattr(result, "stats_returns"):
+        summary["stats_returns"] = getattr(result, "stats_returns")
+    summary["repr"] = repr(result)
+    return summary
+
+
+def run_engine(
+    instruments: list[Any],
+    bars_by_instrument: dict[str, list[Bar]],
+    params: dict[str, Any],
+    custom_data: list[Any] | None = None,
+    client_id: str = DEFAULT_CLIENT_ID,
+) -> dict[str, Any]:
+    """One engine holding every instrument, with one EMACross per instrument.
+
+    ``custom_data`` (news/macro events) is streamed under ``client_id`` in time order with the
+    bars; an ``EventTape`` actor subscribes to it.
+    """
+    engine = new_engine(instruments, bars_by_instrument)
+    tape: EventTape | None = None
+    if custom_data:
+        engine.add_data(custom_data, client_id=ClientId(client_id))
+        tape = EventTape(EventTapeConfig(client_id=client_id))
+        engine.add_actor(tape)
+
+    for index, instrument in enumerate(instruments, start=1):
+        engine.add_strategy(
+            EMACross(
+                EMACrossConfig(
+                    instrument_id=instrument.id,
+                    bar_type=symbol_bar_type(instrument),
+                    trade_size=Decimal(params["trade_size"]),
+                    fast_ema_period=params["fast_ema_period"],
+                    slow_ema_period=params["slow_ema_period"],
+                    subscribe_quote_ticks=params["subscribe_quote_ticks"],
+                    subscribe_trade_ticks=params["subscribe_trade_ticks"],
+                    request_bars=params["request_bars"],
+                    order_id_tag=f"{index:03d}",
+                )
+            )
+        )
+    with span("nautilus.engine_run", strategy="official_ema_cross", instruments=len(instruments)):
+        engine.run()
     summary: dict[str, Any] = {
         "engine": "BacktestEngine",
         "strategy": "official_ema_cross",
-        "bar_count": len(bars),
-        "news_count": 0,
-        "macro_count": 0,
-        "fast_ema_period": int(nautilus.get("fast_ema_period", 10)),
-        "slow_ema_period": int(nautilus.get("slow_ema_period", 20)),
+        "instrument_ids": [str(instrument.id) for instrument in instruments],
+        "bar_count": sum(len(bars) for bars in bars_by_instrument.values()),
+        "bar_count_by_instrument": {key: len(value) for key, value in bars_by_instrument.items()},
+        "news_count": sum(1 for item in custom_data or [] if isinstance(item, NewsEvent)),
+        "macro_count": sum(1 for item in custom_data or [] if isinstance(item, MacroEvent)),
+        "fast_ema_period": params["fast_ema_period"],
+        "slow_ema_period": params["slow_ema_period"],
     }
-    if result is not None:
-        summary["result_type"] = type(result).__name__
-        for attr in ("run_id", "run_config_id", "instance_id"):
-            if hasattr(result, attr):
-                summary[attr] = _s(getattr(result, attr))
-        if hasattr(result, "stats_pnls"):
-            summary["stats_pnls"] = getattr(result, "stats_pnls")
-        if hasattr(result, "stats_returns"):
-            summary["stats_returns"] = getattr(result, "stats_returns")
-        summary["repr"] = repr(result)
+    summary.update(result_summary(engine.get_result()))
+    if tape is not None:
+        summary["event_tape"] = tape.stats()
+    engine.dispose()
     return summary
+
+
+def run_bundle_backtest_in_memory(bundle_dir: str | Path, profile_name: str | None = "tsla") -> dict[str, Any]:
+    bundle = Path(bundle_dir).resolve()
+    profile = load_event_profile(profile_name)
+    nautilus = profile.get("nautilus", {}) if isinstance(profile.get("nautilus"), dict) else {}
+    venue = _s(nautilus.get("venue")) or "XNAS"
+    with span("nautilus.load_bundle", bundle=bundle.name):
+        instruments, bars_by_instrument = _load_bundle(bundle, venue)
+        if not instruments:
+            raise FileNotFoundError(f"No bars found in Nautilus bundle: {bundle}")
+        news, macro = _bundle_custom_data(bundle, venue)
+    return run_engine(
+        instruments,
+        bars_by_instrument,
+        strategy_params(nautilus),
+        custom_data=[*news, *macro],
+        client_id=_s(nautilus.get("custom_data_client_id")) or DEFAULT_CLIENT_ID,
+    )
+
+
+def run_tsla_backtest_in_memory(bundle_dir: str | Path) -> dict[str, Any]:
+    return run_bundle_backtest_in_memory(bundle_dir, "tsla")
@@ -5,6 +5,8 @@ from pathlib import Path
 from typing import Any
 
 import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
 
 from nautilus_v2.models import NautilusEnvelope, SignalSnapshot, to_timestamp_ns
 
@@ -137,25 +139,35 @@ def build_signal_snapshot(payload: dict[str, Any], symbol: str = "TSLA") -> Sign
     )
 
 
-def build_bars_frame(df: pd.DataFrame) -> pd.DataFrame:
+BAR_PRICE_PRECISION = 2
+BAR_COLUMNS = ["ts_event", "open", "high", "low", "close", "volume"]
+
+
+def build_bars_frame(df: pd.DataFrame, price_precision: int = BAR_PRICE_PRECISION) -> pd.DataFrame:
+    """Typed bars: int64 ns ``ts_event``, int64 prices scaled by ``10**price_precision``, int64 volume."""
     if df is None or df.empty:
-        return pd.DataFrame(columns=["ts_event", "open", "high", "low", "close", "volume"])
-    frame = df.copy()
+        return pd.DataFrame({column: pd.Series(dtype="int64") for column in BAR_COLUMNS})
+    frame = df.dropna(subset=["Open", "High", "Low", "Close"]).copy()
     if frame.index.tz is None:
         frame.index = frame.index.tz_localize("UTC")
     else:
         frame.index = frame.index.tz_convert("UTC")
-    out = pd.DataFrame(
-        {
-            "ts_event": frame.index.astype("int64"),
-            "open": frame["Open"].astype(float),
-            "high": frame["High"].astype(float),
-            "low": frame["Low"].astype(float),
-            "close": frame["Close"].astype(float),
-            "volume": frame["Volume"].astype(float),
-        }
-    )
-    return out.reset_index(drop=True)
+    scale = 10**int(price_precision)
+    out = pd.DataFrame({"ts_event": pd.DatetimeIndex(frame.index).as_unit("ns").asi8})
+    for column, source in (("open", "Open"), ("high", "High"), ("low", "Low"), ("close", "Close")):
+        out[column] = (frame[source].astype(float).to_numpy() * scale).round().astype("int64")
+    out["volume"] = frame["Volume"].astype(float).fillna(0.0).round().astype("int64").to_numpy()
+    return out
+
+
+def write_bars(bars: pd.DataFrame, out_dir: Path, slug: str, price_precision: int = BAR_PRICE_PRECISION) -> Path:
+    """``<slug>_bars.parquet`` with the price scale in the schema metadata."""
+    parquet_path = out_dir / f"{slug}_bars.parquet"
+    table = pa.Table.from_pandas(bars, preserve_index=False)
+    metadata = dict(table.schema.metadata or {})
+    metadata[b"autostock.price_precision"] = str(int(price_precision)).encode("ascii")
+    pq.write_table(table.replace_schema_metadata(metadata), parquet_path)
+    return parquet_path
 
 
 def export_tsla_bundle(
@@ -176,7 +188,6 @@ def export_tsla_bundle(
     news_path = out_dir / f"{_s(symbol).lower()}_news_events.jsonl"
     macro_path = out_dir / f"{_s(symbol).lower()}_macro_events.jsonl"
     signal_path = out_dir / f"{_s(symbol).lower()}_signal_snapshot.json"
-    bars_path = out_dir / f"{_s(symbol).lower()}_bars.csv"
 
     news_path.write_text(
         "\n".join(json.dumps(row.to_dict(), ensure_ascii=False) for row in news_events) + ("\n" if news_events else ""),
@@ -190,13 +201,13 @@ def export_tsla_bundle(
         json.dumps(signal_snapshot.to_dict() if signal_snapshot else {}, ensure_ascii=False, indent=2) + "\n",
         encoding="utf-8",
     )
-    bars.to_csv(bars_path, index=False)
+    bars_path = write_bars(bars, out_dir, _s(symbol).lower())
 
     return {
         "news_events": str(news_path),
         "macro_events": str(macro_path),
         "signal_snapshot": str(signal_path),
-        "bars_csv": str(bars_path),
+        "bars_parquet": str(bars_path),
     }
 
 
@@ -208,3 +219,42 @@ def export_symbol_bundle(
     symbol: str,
 ) -> dict[str, str]:
     return export_tsla_bundle(payload=payload, bars_df=bars_df, output_dir=output_dir, symbol=symbol)
+
+
+BUNDLE_MANIFEST = "bundle_manifest.json"
+BUNDLE_SCHEMA = "autostock.nautilus_v2.bundle.v1"
+
+
+def export_profile_bundle(
+    *,
+    payload: dict[str, Any],
+    bars_by_symbol: dict[str, pd.DataFrame],
+    output_dir: str | Path,
+    venue: str = "XNAS",
+    primary_symbol: str | None = None,
+) -> dict[str, Any]:
+    """Per-symbol files for every profile symbol plus a manifest the catalog importer reads."""
+    out_dir = Path(output_dir)
+    out_dir.mkdir(parents=True, exist_ok=True)
+    entries: list[dict[str, Any]] = []
+    for symbol, bars_df in bars_by_symbol.items():
+        clean = _s(symbol).upper()
+        paths = export_tsla_bundle(payload=payload, bars_df=bars_df, output_dir=out_dir, symbol=clean)
+        entries.append(
+            {
+                "symbol": clean,
+                "slug": clean.lower(),
+                "venue": _s(venue).upper() or "XNAS",
+                "price_precision": BAR_PRICE_PRECISION,
+                "files": {key: Path(value).name for key, value in paths.items()},
+            }
+        )
+    manifest = {
+        "schema": BUNDLE_SCHEMA,
+        "generated_at": _safe_iso(_s(payload.get("generated_at")), _now_iso()),
+        "primary_symbol": _s(primary_symbol or (entries[0]["symbol"] if entries else "")).upper(),
+        "instruments": entries,
+    }
+    manifest_path = out_dir / BUNDLE_MANIFEST
+    manifest_path.write_text(json.dumps(manifest, ensure_ascii=False, indent=2) + "\n", encoding="utf-8")
+    return {"manifest": str(manifest_path), "instruments": entries}
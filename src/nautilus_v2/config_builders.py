@@ -29,7 +29,7 @@ def build_symbol_data_paths(base_dir: str | Path, symbol: str) -> dict[str, str]
         "news_events": str(root / f"{slug}_news_events.jsonl"),
         "macro_events": str(root / f"{slug}_macro_events.jsonl"),
         "signal_snapshot": str(root / f"{slug}_signal_snapshot.json"),
-        "bars_csv": str(root / f"{slug}_bars.csv"),
+        "bars_parquet": str(root / f"{slug}_bars.parquet"),
     }
 
 
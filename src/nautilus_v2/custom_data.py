@@ -0,0 +1,124 @@
+from __future__ import annotations
+
+import json
+from typing import Any
+
+from nautilus_trader.common.actor import Actor
+from nautilus_trader.config import ActorConfig
+from nautilus_trader.core.data import Data
+from nautilus_trader.model.custom import customdataclass
+from nautilus_trader.model.data import DataType
+from nautilus_trader.model.identifiers import ClientId
+from nautilus_trader.model.identifiers import InstrumentId
+
+
+DEFAULT_CLIENT_ID = "CUSTOM"
+
+
+def _s(value: Any) -> str:
+    return str(value or "").strip()
+
+
+def _f(value: Any, default: float = 0.0) -> float:
+    try:
+        return float(value)
+    except Exception:
+        return default
+
+
+@customdataclass
+class NewsEvent(Data):
+    """One ``autostock.nautilus_v2.news.v1`` envelope; the full payload rides along as JSON."""
+
+    instrument_id: InstrumentId = InstrumentId.from_str("TSLA.XNAS")
+    source: str = ""
+    category: str = ""
+    sentiment: str = ""
+    headline: str = ""
+    payload_json: str = "{}"
+
+
+@customdataclass
+class MacroEvent(Data):
+    """One ``autostock.nautilus_v2.macro.v1`` envelope (macro overlay + market context)."""
+
+    instrument_id: InstrumentId = InstrumentId.from_str("TSLA.XNAS")
+    macro_mode: str = ""
+    position_scale: float = 0.0
+    allow_new_longs: bool = False
+    fear_greed_score: int = 50
+    market_status: str = ""
+    payload_json: str = "{}"
+
+
+@customdataclass
+class SignalEvent(Data):
+    """One walk-forward ``classify_action`` decision for an instrument, stamped just after its bar."""
+
+    instrument_id: InstrumentId = InstrumentId.from_str("TSLA.XNAS")
+    action: str = "AVOID"
+    confidence: float = 0.0
+    rationale: str = ""
+    event_signal: str = "neutral"
+    event_strength: str = "none"
+    gate_state: str = ""
+
+
+def news_from_envelope(row: dict[str, Any], instrument_id: InstrumentId) -> NewsEvent:
+    payload = row.get("payload") if isinstance(row.get("payload"), dict) else {}
+    ts_event = int(row.get("ts_event_ns") or 0)
+    return NewsEvent(
+        ts_event=ts_event,
+        ts_init=ts_event,
+        instrument_id=instrument_id,
+        source=_s(payload.get("source")),
+        category=_s(payload.get("category")),
+        sentiment=_s(payload.get("sentiment")),
+        headline=_s(payload.get("headline")),
+        payload_json=json.dumps(payload, ensure_ascii=False, default=str),
+    )
+
+
+def macro_from_envelope(row: dict[str, Any], instrument_id: InstrumentId) -> MacroEvent:
+    payload = row.get("payload") if isinstance(row.get("payload"), dict) else {}
+    ts_event = int(row.get("ts_event_ns") or 0)
+    return MacroEvent(
+        ts_event=ts_event,
+        ts_init=ts_event,
+        instrument_id=instrument_id,
+        macro_mode=_s(payload.get("macro_mode")),
+        position_scale=_f(payload.get("position_scale")),
+        allow_new_longs=bool(payload.get("allow_new_longs", False)),
+        fear_greed_score=int(_f(payload.get("fear_greed_score"), 50.0)),
+        market_status=_s(payload.get("market_status")),
+        payload_json=json.dumps(payload, ensure_ascii=False, default=str),
+    )
+
+
+class EventTapeConfig(ActorConfig, frozen=True):
+    client_id: str = DEFAULT_CLIENT_ID
+
+
+class EventTape(Actor):
+    """Subscribes to the news/macro custom data streamed next to the bars and keeps the tape stats."""
+
+    def __init__(self, config: EventTapeConfig | None = None) -> None:
+        super().__init__(config or EventTapeConfig())
+        self._client_id = ClientId(config.client_id if config else DEFAULT_CLIENT_ID)
+        self.news_seen = 0
+        self.macro_seen = 0
+        self.last_macro_mode = ""
+
+    def on_start(self) -> None:
+        self.subscribe_data(DataType(NewsEvent), client_id=self._client_id)
+        self.subscribe_data(DataType(MacroEvent), client_id=self._client_id)
+
+    def on_data(self, data: Data) -> None:
+        if isinstance(data, NewsEvent):
+            self.news_seen += 1
+        elif isinstance(data, MacroEvent):
+            self.macro_seen += 1
+            self.last_macro_mode = data.macro_mode
+
+    def stats(self) -> dict[str, Any]:
+        return {"news_seen": self.news_seen, "macro_seen": self.macro_seen, "last_macro_mode": self.last_macro_mode}
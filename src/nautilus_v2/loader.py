@@ -1,6 +1,8 @@
 from __future__ import annotations
 
+import hashlib
 import json
+from importlib import metadata
 from pathlib import Path
 from typing import Any
 
@@ -18,6 +20,22 @@ def load_signal_snapshot(path: str | Path) -> dict[str, Any]:
     return payload if isinstance(payload, dict) else {}
 
 
+def load_envelopes(path: str | Path) -> list[dict[str, Any]]:
+    """Rows of a ``*_news_events.jsonl`` / ``*_macro_events.jsonl`` file; unreadable lines are skipped."""
+    file_path = Path(path)
+    if not file_path.exists():
+        return []
+    rows: list[dict[str, Any]] = []
+    for line in file_path.read_text(encoding="utf-8").splitlines():
+        try:
+            row = json.loads(line)
+        except Exception:
+            continue
+        if isinstance(row, dict) and row.get("ts_event_ns"):
+            rows.append(row)
+    return rows
+
+
 def load_tsla_bars_csv(path: str | Path) -> pd.DataFrame:
     file_path = Path(path)
     if not file_path.exists():
@@ -26,3 +44,129 @@ def load_tsla_bars_csv(path: str | Path) -> pd.DataFrame:
     if "ts_event" in df.columns:
         df["ts_event"] = pd.to_numeric(df["ts_event"], errors="coerce").astype("Int64")
     return df
+
+
+def load_bars_frame(bundle_dir: str | Path, slug: str) -> pd.DataFrame:
+    """Float OHLCV indexed by UTC timestamp, from ``<slug>_bars.parquet`` or the legacy CSV."""
+    bundle = Path(bundle_dir)
+    parquet_path = bundle / f"{slug}_bars.parquet"
+    if parquet_path.exists():
+        import pyarrow.parquet as pq
+
+        table = pq.read_table(parquet_path)
+        precision = int((table.schema.metadata or {}).get(b"autostock.price_precision", b"2"))
+        frame = table.to_pandas()
+        for column in ("open", "high", "low", "close"):
+            frame[column] = frame[column].to_numpy() / 10**precision
+    else:
+        frame = load_tsla_bars_csv(bundle / f"{slug}_bars.csv").dropna(subset=["ts_event"])
+    frame["volume"] = frame["volume"].astype("float64")
+    frame.index = pd.to_datetime(frame["ts_event"].astype("int64"), unit="ns", utc=True)
+    return frame[["open", "high", "low", "close", "volume"]]
+
+
+def load_bundle_manifest(bundle_dir: str | Path) -> dict[str, Any]:
+    """Bundle manifest; single-symbol bundles from before manifests are described from their bar files."""
+    bundle = Path(bundle_dir)
+    manifest = load_signal_snapshot(bundle / "bundle_manifest.json")
+    if isinstance(manifest.get("instruments"), list) and manifest["instruments"]:
+        return manifest
+    slugs = sorted({path.name.rsplit("_bars.", 1)[0] for path in bundle.glob("*_bars.*") if path.suffix in {".parquet", ".csv"}})
+    return {
+        "primary_symbol": slugs[0].upper() if slugs else "",
+        "instruments": [{"symbol": slug.upper(), "slug": slug} for slug in slugs],
+    }
+
+
+def bundle_content_digest(bundle_dir: str | Path) -> str:
+    """Hash of the bundle's instrument list and bar files.
+
+    News/macro envelopes are left out: the macro envelope is re-stamped on every export and the
+    EMACross result does not depend on either.
+    """
+    bundle = Path(bundle_dir)
+    digest = hashlib.blake2b(digest_size=16)
+    for entry in sorted(load_bundle_manifest(bundle).get("instruments", []), key=lambda row: str(row.get("symbol") or "")):
+        slug = str(entry.get("slug") or str(entry.get("symbol") or "").lower())
+        digest.update(f"{entry.get('symbol')}|{entry.get('venue') or ''}".encode("utf-8"))
+        for suffix in ("_bars.parquet", "_bars.csv"):
+            path = bundle / f"{slug}{suffix}"
+            if path.exists():
+                digest.update(suffix.encode("utf-8"))
+                digest.update(path.read_bytes())
+    return digest.hexdigest()
+
+
+def bundle_events_digest(bundle_dir: str | Path) -> str:
+    """Hash of the bundle's news/macro envelopes without their timestamps.
+
+    The macro envelope (and news without ``published_at``) is stamped with the export time, so only
+    schema, symbol and payload are hashed; a re-export of the same events keeps the same digest.
+    """
+    bundle = Path(bundle_dir)
+    digest = hashlib.blake2b(digest_size=16)
+    for entry in sorted(load_bundle_manifest(bundle).get("instruments", []), key=lambda row: str(row.get("symbol") or "")):
+        slug = str(entry.get("slug") or str(entry.get("symbol") or "").lower())
+        for suffix in ("_news_events.jsonl", "_macro_events.jsonl"):
+            lines = sorted(
+                json.dumps(
+                    {"schema": row.get("schema"), "symbol": row.get("symbol"), "payload": row.get("payload")},
+                    sort_keys=True,
+                    default=str,
+                )
+                for row in load_envelopes(bundle / f"{slug}{suffix}")
+            )
+            digest.update(f"{slug}{suffix}|{len(lines)}".encode("utf-8"))
+            for line in lines:
+                digest.update(line.encode("utf-8"))
+    return digest.hexdigest()
+
+
+def nautilus_version() -> str:
+    """Installed ``nautilus_trader`` version, else the pin in ``nautilus_v2/requirements.txt``."""
+    try:
+        return metadata.version("nautilus_trader")
+    except metadata.PackageNotFoundError:
+        pass
+    requirements = Path(__file__).resolve().parents[2] / "nautilus_v2" / "requirements.txt"
+    try:
+        for line in requirements.read_text(encoding="utf-8").splitlines():
+            name, sep, version = line.strip().partition("==")
+            if sep and name.strip().lower().replace("-", "_") == "nautilus_trader":
+                return version.strip()
+    except Exception:
+        pass
+    return "unknown"
+
+
+def backtest_input_hash(bundle_dir: str | Path, profile: dict[str, Any]) -> str:
+    """Content hash of everything a bundle backtest depends on: bars, news/macro events, instruments,
+    strategy config and Nautilus version."""
+    nautilus = profile.get("nautilus", {}) if isinstance(profile.get("nautilus"), dict) else {}
+    material = {
+        "data": bundle_content_digest(bundle_dir),
+        "events": bundle_events_digest(bundle_dir),
+        "strategy": "official_ema_cross",
+        "config": {
+            key: nautilus.get(key)
+            for key in (
+                "venue",
+                "trade_size",
+                "fast_ema_period",
+                "slow_ema_period",
+                "subscribe_quote_ticks",
+                "subscribe_trade_ticks",
+                "request_bars",
+                "custom_data_client_id",
+            )
+        },
+        "nautilus_trader": nautilus_version(),
+    }
+    raw = json.dumps(material, sort_keys=True, default=str)
+    return hashlib.blake2b(raw.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def load_cached_backtest(summary_path: str | Path, input_hash: str) -> dict[str, Any] | None:
+    """Saved backtest payload when it was produced from the same inputs."""
+    payload = load_signal_snapshot(summary_path)
+    return payload if payload and payload.get("input_hash") == input_hash else None
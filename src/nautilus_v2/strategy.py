@@ -0,0 +1,69 @@
+from __future__ import annotations
+
+from decimal import Decimal
+
+from nautilus_trader.config import StrategyConfig
+from nautilus_trader.core.data import Data
+from nautilus_trader.model.data import Bar
+from nautilus_trader.model.data import BarType
+from nautilus_trader.model.data import DataType
+from nautilus_trader.model.enums import OrderSide
+from nautilus_trader.model.identifiers import ClientId
+from nautilus_trader.model.identifiers import InstrumentId
+from nautilus_trader.trading.strategy import Strategy
+
+from nautilus_v2.custom_data import DEFAULT_CLIENT_ID
+from nautilus_v2.custom_data import SignalEvent
+
+
+class SignalFollowerConfig(StrategyConfig, frozen=True):
+    instrument_id: InstrumentId
+    bar_type: BarType
+    trade_size: Decimal
+    client_id: str = DEFAULT_CLIENT_ID
+    min_buy_confidence: float = 0.75
+    exit_actions: tuple[str, ...] = ("SELL", "AVOID")
+
+
+class SignalFollower(Strategy):
+    """Long-only: enter on a confident BUY signal, flatten on an exit action, hold through WATCH."""
+
+    def __init__(self, config: SignalFollowerConfig) -> None:
+        super().__init__(config)
+        self.instrument = None
+        self.signals_seen = 0
+        self.entries = 0
+        self.exits = 0
+
+    def on_start(self) -> None:
+        self.instrument = self.cache.instrument(self.config.instrument_id)
+        if self.instrument is None:
+            self.log.error(f"Could not find instrument for {self.config.instrument_id}")
+            self.stop()
+            return
+        self.subscribe_bars(self.config.bar_type)
+        self.subscribe_data(DataType(SignalEvent), client_id=ClientId(self.config.client_id))
+
+    def on_bar(self, bar: Bar) -> None:
+        pass
+
+    def on_data(self, data: Data) -> None:
+        if not isinstance(data, SignalEvent) or data.instrument_id != self.config.instrument_id:
+            return
+        self.signals_seen += 1
+        is_flat = self.portfolio.is_flat(self.config.instrument_id)
+        if data.action == "BUY" and data.confidence >= self.config.min_buy_confidence and is_flat:
+            order = self.order_factory.market(
+                instrument_id=self.config.instrument_id,
+                order_side=OrderSide.BUY,
+                quantity=self.instrument.make_qty(self.config.trade_size),
+            )
+            self.submit_order(order)
+            self.entries += 1
+        elif data.action in self.config.exit_actions and not is_flat:
+            self.close_all_positions(self.config.instrument_id)
+            self.exits += 1
+
+    def on_stop(self) -> None:
+        self.cancel_all_orders(self.config.instrument_id)
+        self.close_all_positions(self.config.instrument_id)
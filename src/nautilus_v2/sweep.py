@@ -0,0 +1,274 @@
+from __future__ import annotations
+
+import hashlib
+import itertools
+import json
+import os
+import random
+import shutil
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+from typing import Any
+
+import pandas as pd
+
+from core.tracing import span
+from event_profile import load_event_profile
+from nautilus_v2.backtest import import_bundle_to_catalog, run_engine, setup_catalog, strategy_params, symbol_bar_type
+from nautilus_v2.loader import bundle_content_digest
+
+
+SWEEP_CACHE_NAME = "sweep_results.jsonl"
+SWEEP_TABLE_NAME = "sweep_results.csv"
+SWEEP_CATALOG_MARKER = "sweep_source.json"
+
+_WORKER_DATA: tuple[list[Any], dict[str, list[Any]]] | None = None
+
+
+def _s(value: Any) -> str:
+    return str(value or "").strip()
+
+
+def _env_int(key: str, default: int, minimum: int = 1, maximum: int | None = None) -> int:
+    try:
+        value = int(os.getenv(key, str(default)))
+    except Exception:
+        value = int(default)
+    value = max(minimum, value)
+    if maximum is not None:
+        value = min(maximum, value)
+    return value
+
+
+def _scalar(raw: str) -> Any:
+    text = raw.strip()
+    if text.lower() in {"true", "false"}:
+        return text.lower() == "true"
+    for cast in (int, float):
+        try:
+            return cast(text)
+        except ValueError:
+            continue
+    return text
+
+
+def parse_param_space(raw: str) -> dict[str, list[Any]]:
+    """``fast_ema_period=5,10,20;slow_ema_period=20,50`` -> ``{name: [values]}``.
+
+    ``start:stop:step`` expands to an inclusive integer range.
+    """
+    space: dict[str, list[Any]] = {}
+    for part in _s(raw).split(";"):
+        name, sep, values = part.partition("=")
+        name = name.strip()
+        if not sep or not name:
+            continue
+        out: list[Any] = []
+        for item in values.split(","):
+            if item.count(":") == 2:
+                start, stop, step = (int(piece) for piece in item.split(":"))
+                out.extend(range(start, stop + 1, max(1, step)))
+            elif item.strip():
+                out.append(_scalar(item))
+        if out:
+            space[name] = out
+    return space
+
+
+def grid_configs(space: dict[str, list[Any]]) -> list[dict[str, Any]]:
+    names = sorted(space)
+    return [dict(zip(names, values)) for values in itertools.product(*(space[name] for name in names))]
+
+
+def sample_configs(space: dict[str, list[Any]], samples: int, seed: int | None = None) -> list[dict[str, Any]]:
+    """``samples`` distinct configs drawn from the grid (the whole grid when it is smaller)."""
+    grid = grid_configs(space)
+    if samples >= len(grid):
+        return grid
+    return random.Random(seed).sample(grid, samples)
+
+
+def bundle_data_digest(bundle_dir: str | Path) -> str:
+    """Hash of the bundle's bar files and instrument list, so cached rows die with the data."""
+    return bundle_content_digest(bundle_dir)
+
+
+def config_hash(params: dict[str, Any], data_digest: str) -> str:
+    raw = json.dumps({"params": params, "data": data_digest}, sort_keys=True, default=str)
+    return hashlib.blake2b(raw.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def _plain(value: Any) -> Any:
+    if isinstance(value, dict):
+        return {str(key): _plain(item) for key, item in value.items()}
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return _s(value)
+
+
+def _init_worker(catalog_path: str) -> None:
+    """Read instruments and bars from the read-only catalog once per worker process."""
+    global _WORKER_DATA
+    catalog = setup_catalog(catalog_path)
+    instruments = list(catalog.instruments())
+    bars_by_instrument: dict[str, list[Any]] = {}
+    for instrument in instruments:
+        bars_by_instrument[str(instrument.id)] = list(catalog.bars(bar_types=[str(symbol_bar_type(instrument))]))
+    _WORKER_DATA = (instruments, bars_by_instrument)
+
+
+def _run_config(key: str, params: dict[str, Any]) -> dict[str, Any]:
+    assert _WORKER_DATA is not None
+    with span("nautilus.sweep_config", config_hash=key) as current:
+        summary = run_engine(_WORKER_DATA[0], _WORKER_DATA[1], params)
+    return {
+        "config_hash": key,
+        "params": params,
+        "stats_pnls": _plain(summary.get("stats_pnls") or {}),
+        "stats_returns": _plain(summary.get("stats_returns") or {}),
+        "bar_count": summary.get("bar_count", 0),
+        "elapsed_sec": round(current.duration_sec, 3),
+    }
+
+
+def _ensure_catalog(bundle: Path, catalog_root: Path, data_digest: str) -> tuple[Path, bool]:
+    """Catalog for this exact bundle data under ``catalog_root``; ``(path, imported)``.
+
+    Each data digest gets its own ``sweep-<digest>`` directory, so a bundle re-exported with
+    updated bars never writes overlapping bar files into an older catalog. A directory without a
+    matching marker (an interrupted import) is cleared first, and catalogs of older digests that
+    carry the marker are removed once the new one is complete.
+    """
+    catalog_path = catalog_root / f"sweep-{data_digest[:16]}"
+    marker = catalog_path / SWEEP_CATALOG_MARKER
+    try:
+        if json.loads(marker.read_text(encoding="utf-8")).get("data_digest") == data_digest:
+            return catalog_path, False
+    except Exception:
+        pass
+    if catalog_path.exists():
+        shutil.rmtree(catalog_path)
+    import_bundle_to_catalog(bundle, catalog_path)
+    marker.write_text(json.dumps({"bundle_dir": str(bundle), "data_digest": data_digest}) + "\n", encoding="utf-8")
+    for stale in catalog_root.glob("sweep-*"):
+        if stale != catalog_path and (stale / SWEEP_CATALOG_MARKER).exists():
+            shutil.rmtree(stale, ignore_errors=True)
+    return catalog_path, True
+
+
+def _load_cache(path: Path) -> dict[str, dict[str, Any]]:
+    rows: dict[str, dict[str, Any]] = {}
+    if not path.exists():
+        return rows
+    for line in path.read_text(encoding="utf-8").splitlines():
+        try:
+            row = json.loads(line)
+        except Exception:
+            continue
+        if isinstance(row, dict) and _s(row.get("config_hash")):
+            rows[row["config_hash"]] = row
+    return rows
+
+
+def results_table(rows: list[dict[str, Any]]) -> pd.DataFrame:
+    """One line per config: parameters, then ``pnls.<currency>.<stat>`` and ``returns.<stat>`` columns."""
+    records: list[dict[str, Any]] = []
+    for row in rows:
+        record: dict[str, Any] = {"config_hash": row.get("config_hash"), **(row.get("params") or {})}
+        for currency, stats in (row.get("stats_pnls") or {}).items():
+            for name, value in (stats or {}).items() if isinstance(stats, dict) else []:
+                record[f"pnls.{currency}.{name}"] = value
+        for name, value in (row.get("stats_returns") or {}).items():
+            record[f"returns.{name}"] = value
+        record["cached"] = bool(row.get("cached", False))
+        record["error"] = _s(row.get("error"))
+        records.append(record)
+    table = pd.DataFrame.from_records(records)
+    sharpe = [column for column in table.columns if column.startswith("returns.Sharpe Ratio")]
+    if sharpe:
+        table = table.sort_values(sharpe[0], ascending=False, na_position="last")
+    return table.reset_index(drop=True)
+
+
+def run_parameter_sweep(
+    bundle_dir: str | Path,
+    configs: list[dict[str, Any]],
+    *,
+    profile_name: str | None = None,
+    catalog_dir: str | Path | None = None,
+    max_workers: int | None = None,
+) -> dict[str, Any]:
+    """Run each config in its own BacktestEngine across a process pool.
+
+    Bars are written to a catalog once, and each worker reads them once at start-up. Finished
+    configs are cached in ``sweep_results.jsonl`` under the config + bundle data hash, so a rerun
+    only executes new or changed configurations. The catalog is only built when something has to
+    run and no catalog of the same bundle data exists yet. Failed configs are returned in
+    ``errors`` rather than printed.
+    """
+    bundle = Path(bundle_dir).resolve()
+    profile = load_event_profile(profile_name)
+    nautilus = profile.get("nautilus", {}) if isinstance(profile.get("nautilus"), dict) else {}
+    catalog_root = Path(catalog_dir) if catalog_dir else bundle / "catalog"
+    catalog_path: Path | None = None
+
+    data_digest = bundle_data_digest(bundle)
+    cache_path = bundle / SWEEP_CACHE_NAME
+    cache = _load_cache(cache_path)
+
+    pending: dict[str, dict[str, Any]] = {}
+    rows: list[dict[str, Any]] = []
+    skipped = 0
+    for override in configs:
+        params = strategy_params({**nautilus, **override})
+        if params["fast_ema_period"] >= params["slow_ema_period"]:
+            skipped += 1
+            continue
+        key = config_hash(params, data_digest)
+        if key in cache:
+            rows.append({**cache[key], "cached": True})
+        elif key not in pending:
+            pending[key] = params
+
+    workers = min(len(pending), max_workers or _env_int("AI_NAUTILUS_SWEEP_WORKERS", os.cpu_count() or 1, maximum=256))
+    errors: list[dict[str, Any]] = []
+    catalog_imported = False
+    if pending:
+        with span("nautilus.sweep_catalog", bundle=bundle.name) as current:
+            catalog_path, catalog_imported = _ensure_catalog(bundle, catalog_root, data_digest)
+            current.set(imported=catalog_imported)
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(str(catalog_path.resolve()),)) as executor:
+            futures = {executor.submit(_run_config, key, params): key for key, params in pending.items()}
+            with cache_path.open("a", encoding="utf-8") as cache_file:
+                for future in as_completed(futures):
+                    key = futures[future]
+                    try:
+                        row = future.result()
+                    except Exception as exc:
+                        error = {"config_hash": key, "params": pending[key], "error": f"{type(exc).__name__}: {exc}"}
+                        errors.append(error)
+                        rows.append(error)
+                        continue
+                    cache_file.write(json.dumps(row, ensure_ascii=False) + "\n")
+                    cache_file.flush()
+                    rows.append(row)
+
+    table = results_table(rows)
+    table_path = bundle / SWEEP_TABLE_NAME
+    table.to_csv(table_path, index=False)
+    return {
+        "bundle_dir": str(bundle),
+        "catalog_path": str(catalog_path) if catalog_path is not None else "",
+        "catalog_imported": catalog_imported,
+        "data_digest": data_digest,
+        "config_count": len(rows),
+        "executed": len(pending),
+        "cached": sum(1 for row in rows if row.get("cached")),
+        "skipped": skipped,
+        "workers": workers,
+        "errors": errors,
+        "table_path": str(table_path),
+        "table": table,
+    }
+
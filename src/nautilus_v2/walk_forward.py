@@ -0,0 +1,333 @@
+from __future__ import annotations
+
+import json
+from bisect import bisect_left, bisect_right
+from datetime import date
+from decimal import Decimal
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+import pandas as pd
+from ta.momentum import RSIIndicator
+from ta.trend import ADXIndicator
+from ta.volatility import BollingerBands
+
+from core.earnings_pit import EarningsEventStore
+from core.event_watchlist import assess_events, chart_volume_gate, classify_action, normalize_event
+from core.sec_pit import SecPointInTimeStore
+from core.tracing import span
+from nautilus_trader.model.identifiers import ClientId
+from nautilus_v2.backtest import bars_from_frame, new_engine, result_summary, symbol_bar_type, symbol_instrument
+from nautilus_v2.custom_data import DEFAULT_CLIENT_ID, SignalEvent
+from nautilus_v2.strategy import SignalFollower, SignalFollowerConfig
+
+
+STUB_MACRO = {"mode": "neutral", "position_scale": 0.7, "allow_new_longs": True, "selective_longs_only": False}
+SIGNAL_COLUMNS = [
+    "ts_event",
+    "symbol",
+    "action",
+    "confidence",
+    "rationale",
+    "event_signal",
+    "event_strength",
+    "gate_state",
+    "volume_ratio",
+    "pit_has_data",
+    "pit_filing_age_days",
+    "pit_rev_yoy_pct",
+    "earnings_days_since",
+    "earnings_surprise_pct",
+]
+
+
+def _s(value: Any) -> str:
+    return str(value or "").strip()
+
+
+def _utc(value: Any) -> pd.Timestamp | None:
+    try:
+        ts = pd.Timestamp(value)
+    except Exception:
+        return None
+    if pd.isna(ts):
+        return None
+    return ts.tz_localize("UTC") if ts.tzinfo is None else ts.tz_convert("UTC")
+
+
+def daily_indicator_frame(df: pd.DataFrame) -> pd.DataFrame:
+    """Every ``chart_volume_gate`` input for every day in one vectorised pass.
+
+    Same windows as ``calculate_indicators``; rows before the 200-day warm-up are dropped.
+    """
+    frame = df[["Open", "High", "Low", "Close", "Volume"]].dropna(subset=["Open", "High", "Low", "Close"])
+    close = pd.to_numeric(frame["Close"], errors="coerce").ffill()
+    high = pd.to_numeric(frame["High"], errors="coerce").ffill()
+    low = pd.to_numeric(frame["Low"], errors="coerce").ffill()
+    volume = pd.to_numeric(frame["Volume"], errors="coerce").fillna(0)
+    bb = BollingerBands(close, window=20, window_dev=2)
+    bb_range = (bb.bollinger_hband() - bb.bollinger_lband()).clip(lower=0)
+    volume_avg = volume.rolling(window=20, min_periods=1).mean()
+    out = pd.DataFrame(
+        {
+            "price": close,
+            "ma20": close.rolling(20).mean(),
+            "ma50": close.rolling(50).mean(),
+            "ma200": close.rolling(200).mean(),
+            "adx": ADXIndicator(high, low, close, window=14).adx(),
+            "rsi": RSIIndicator(close, window=14).rsi().fillna(50.0),
+            "bb_position": ((close - bb.bollinger_lband()) / bb_range.replace(0, np.nan) * 100).fillna(50.0),
+            "volume_ratio": (volume / volume_avg.replace(0, np.nan)).fillna(1.0),
+            "return_21d": close.pct_change(21).fillna(0.0) * 100,
+            "return_63d": close.pct_change(63).fillna(0.0) * 100,
+        },
+        index=frame.index,
+    )
+    return out.dropna(subset=["ma200"])
+
+
+def load_event_stream(path: str | Path | None) -> list[dict[str, Any]]:
+    """Recorded events (``.json`` feed or ``.jsonl``); rows may carry a recorded ``signal``/``strength``."""
+    if not path or not Path(path).exists():
+        return []
+    text = Path(path).read_text(encoding="utf-8")
+    if Path(path).suffix.lower() == ".jsonl":
+        rows = []
+        for line in text.splitlines():
+            try:
+                rows.append(json.loads(line))
+            except Exception:
+                continue
+    else:
+        try:
+            payload = json.loads(text)
+        except Exception:
+            return []
+        rows = payload.get("events", []) if isinstance(payload, dict) else payload
+    return [row for row in rows if isinstance(row, dict)] if isinstance(rows, list) else []
+
+
+class _SymbolEvents:
+    """One symbol's event stream sorted by publish time, answering "what was known in (t - lookback, t]"."""
+
+    def __init__(self, rows: list[dict[str, Any]], lookback: pd.Timedelta) -> None:
+        events: list[tuple[pd.Timestamp, dict[str, Any], dict[str, str] | None]] = []
+        for row in rows:
+            normalized = normalize_event(row)
+            published = _utc(row.get("published_at"))
+            if normalized is None or published is None:
+                continue
+            signal, strength = _s(row.get("signal")).lower(), _s(row.get("strength")).lower()
+            recorded = {"signal": signal, "strength": strength} if signal and strength else None
+            events.append((published, normalized, recorded))
+        events.sort(key=lambda item: item[0])
+        self.times = [item[0] for item in events]
+        self.events = events
+        self.lookback = lookback
+        self._cache: dict[tuple[int, int], tuple[str, str]] = {}
+
+    def decision(self, symbol: str, asof: pd.Timestamp) -> tuple[str, str]:
+        lo = bisect_right(self.times, asof - self.lookback)
+        hi = bisect_right(self.times, asof)
+        if lo >= hi:
+            return "neutral", "none"
+        key = (lo, hi)
+        if key not in self._cache:
+            window = self.events[lo:hi]
+            recorded = [item[2] for item in window if item[2] is not None]
+            if recorded:
+                self._cache[key] = (recorded[-1]["signal"], recorded[-1]["strength"])
+            else:
+                assessed = assess_events([item[1] for item in window], symbol=symbol)
+                self._cache[key] = (_s(assessed.get("signal")) or "neutral", _s(assessed.get("strength")) or "none")
+        return self._cache[key]
+
+
+def _pit_rows(
+    symbol: str,
+    closes: list[pd.Timestamp],
+    sec_store: SecPointInTimeStore,
+    earnings_store: EarningsEventStore,
+) -> list[dict[str, Any]]:
+    """PIT features per close, evaluated once per filing / earnings boundary and aged per day.
+
+    The filing age is carried forward from the day the cached row was built, so it keeps counting
+    from the newest filing among the facts ``features_asof`` actually selected rather than from the
+    newest filing of any fact (e.g. a late amendment of an older period).
+    """
+    filings = sec_store.filing_dates(symbol)
+    earnings = earnings_store.event_times(symbol)
+    sec_cache: dict[int, tuple[date, dict[str, Any]]] = {}
+    earnings_cache: dict[int, dict[str, Any]] = {}
+    out: list[dict[str, Any]] = []
+    for close in closes:
+        day = close.date()
+        sec_key = bisect_right(filings, day)
+        if sec_key not in sec_cache:
+            sec_cache[sec_key] = (day, sec_store.features_asof(symbol, day))
+        built_on, cached = sec_cache[sec_key]
+        sec = dict(cached)
+        if sec.get("pit_filing_age_days") is not None:
+            sec["pit_filing_age_days"] = int(sec["pit_filing_age_days"]) + (day - built_on).days
+        earnings_key = bisect_right(earnings, close)
+        if earnings_key not in earnings_cache:
+            earnings_cache[earnings_key] = earnings_store.latest_event_asof(symbol, close)
+        earn = dict(earnings_cache[earnings_key])
+        if earnings_key and earn.get("earnings_has_data"):
+            earn["earnings_days_since"] = max(0, (close.date() - earnings[earnings_key - 1].date()).days)
+        out.append({**sec, **earn})
+    return out
+
+
+def build_walk_forward_signals(
+    frames: dict[str, pd.DataFrame],
+    *,
+    sec_store: SecPointInTimeStore,
+    earnings_store: EarningsEventStore,
+    event_stream: list[dict[str, Any]] | None = None,
+    start: date | None = None,
+    end: date | None = None,
+    lookback_days: int = 3,
+    macro: dict[str, Any] | None = None,
+) -> pd.DataFrame:
+    """Replay each trading day in ``[start, end]`` as if it were "now".
+
+    Per symbol and day: chart gate from that day's indicators, SEC/earnings features as of the
+    16:00 New York close, the event decision from events published in the preceding
+    ``lookback_days`` (a recorded ``signal``/``strength`` wins over rule-based assessment), then
+    ``classify_action``. Without an event stream every day is neutral, i.e. chart-only.
+    """
+    macro = macro or STUB_MACRO
+    lookback = pd.Timedelta(days=max(1, int(lookback_days)))
+    by_symbol: dict[str, list[dict[str, Any]]] = {}
+    for row in event_stream or []:
+        by_symbol.setdefault(_s(row.get("symbol")).upper(), []).append(row)
+
+    records: list[dict[str, Any]] = []
+    for symbol, df in frames.items():
+        symbol = _s(symbol).upper()
+        if df is None or df.empty:
+            continue
+        indicators = daily_indicator_frame(df)
+        sessions = [pd.Timestamp(ts).date() for ts in indicators.index]
+        lo = bisect_left(sessions, start) if start else 0
+        hi = bisect_right(sessions, end) if end else len(sessions)
+        indicators = indicators.iloc[lo:hi]
+        closes = [pd.Timestamp(f"{day} 16:00", tz="America/New_York").tz_convert("UTC") for day in sessions[lo:hi]]
+        with span("nautilus.pit_rows", symbol=symbol, days=len(closes)):
+            pit_rows = _pit_rows(symbol, closes, sec_store, earnings_store)
+        events = _SymbolEvents(by_symbol.get(symbol, []), lookback)
+        for bar_ts, close, values, pit in zip(indicators.index, closes, indicators.to_dict("records"), pit_rows):
+            gate = chart_volume_gate(values)
+            event_signal, event_strength = events.decision(symbol, close)
+            action = classify_action(event_signal, event_strength, gate, macro)
+            records.append(
+                {
+                    "ts_event": _utc(bar_ts),
+                    "symbol": symbol,
+                    "action": action["action"],
+                    "confidence": action["confidence"],
+                    "rationale": action["rationale"],
+                    "event_signal": event_signal,
+                    "event_strength": event_strength,
+                    "gate_state": gate["state"],
+                    "volume_ratio": gate["volume_ratio"],
+                    "pit_has_data": bool(pit.get("pit_has_data", False)),
+                    "pit_filing_age_days": pit.get("pit_filing_age_days"),
+                    "pit_rev_yoy_pct": pit.get("pit_rev_yoy_pct"),
+                    "earnings_days_since": pit.get("earnings_days_since"),
+                    "earnings_surprise_pct": pit.get("earnings_surprise_pct"),
+                }
+            )
+    return pd.DataFrame.from_records(records, columns=SIGNAL_COLUMNS)
+
+
+def _bar_frame(df: pd.DataFrame) -> pd.DataFrame:
+    frame = df[["Open", "High", "Low", "Close", "Volume"]].dropna(subset=["Open", "High", "Low", "Close"])
+    frame = frame.rename(columns=str.lower).astype("float64")
+    index = pd.DatetimeIndex(frame.index)
+    frame.index = index.tz_localize("UTC") if index.tz is None else index.tz_convert("UTC")
+    return frame
+
+
+def run_walk_forward_backtest(
+    frames: dict[str, pd.DataFrame],
+    signals: pd.DataFrame,
+    *,
+    nautilus: dict[str, Any] | None = None,
+) -> dict[str, Any]:
+    """Stream the walk-forward signals with the bars into one engine running ``SignalFollower`` per symbol.
+
+    Each signal is stamped 1ns after its bar, so an order can only fill on a later bar.
+    """
+    nautilus = nautilus or {}
+    venue = _s(nautilus.get("venue")) or "XNAS"
+    client_id = _s(nautilus.get("custom_data_client_id")) or DEFAULT_CLIENT_ID
+    instruments = [symbol_instrument(symbol, venue) for symbol in frames]
+    bars_by_instrument = {
+        str(instrument.id): bars_from_frame(_bar_frame(frames[symbol]), instrument)
+        for symbol, instrument in zip(frames, instruments)
+    }
+    bar_ts = {key: {bar.ts_event: bar.ts_init for bar in bars} for key, bars in bars_by_instrument.items()}
+    ids = {_s(symbol).upper(): instrument.id for symbol, instrument in zip(frames, instruments)}
+
+    events: list[SignalEvent] = []
+    for row in signals.itertuples(index=False):
+        instrument_id = ids.get(row.symbol)
+        if instrument_id is None:
+            continue
+        ts_event = int(pd.Timestamp(row.ts_event).value)
+        ts_init = bar_ts[str(instrument_id)].get(ts_event, ts_event) + 1
+        events.append(
+            SignalEvent(
+                ts_event=ts_init,
+                ts_init=ts_init,
+                instrument_id=instrument_id,
+                action=row.action,
+                confidence=float(row.confidence),
+                rationale=row.rationale,
+                event_signal=row.event_signal,
+                event_strength=row.event_strength,
+                gate_state=row.gate_state,
+            )
+        )
+    events.sort(key=lambda item: item.ts_init)
+
+    engine = new_engine(instruments, bars_by_instrument)
+    engine.add_data(events, client_id=ClientId(client_id))
+    strategies = []
+    for index, instrument in enumerate(instruments, start=1):
+        strategy = SignalFollower(
+            SignalFollowerConfig(
+                instrument_id=instrument.id,
+                bar_type=symbol_bar_type(instrument),
+                trade_size=Decimal(str(nautilus.get("trade_size", "10"))),
+                client_id=client_id,
+                min_buy_confidence=float(nautilus.get("min_buy_confidence", 0.75)),
+                order_id_tag=f"{index:03d}",
+            )
+        )
+        engine.add_strategy(strategy)
+        strategies.append(strategy)
+    with span("nautilus.engine_run", strategy="signal_follower", instruments=len(instruments), signals=len(events)):
+        engine.run()
+    summary: dict[str, Any] = {
+        "engine": "BacktestEngine",
+        "strategy": "signal_follower",
+        "instrument_ids": [str(instrument.id) for instrument in instruments],
+        "bar_count": sum(len(bars) for bars in bars_by_instrument.values()),
+        "signal_count": len(events),
+        "action_counts": {key: int(value) for key, value in signals["action"].value_counts().items()} if not signals.empty else {},
+        "strategies": {
+            str(strategy.config.instrument_id): {
+                "signals_seen": strategy.signals_seen,
+                "entries": strategy.entries,
+                "exits": strategy.exits,
+            }
+            for strategy in strategies
+        },
+    }
+    summary.update(result_summary(engine.get_result()))
+    engine.dispose()
+    return summary
@@ -2,24 +2,38 @@ from __future__ import annotations
 
 import json
 import os
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date, datetime, timezone
 from pathlib import Path
+from threading import BoundedSemaphore
 from typing import Any
 
 import pandas as pd
 
 from ai.analyzer import ai
-from core.data_collector import DataCollector
 from core.earnings_pit import EarningsEventStore
 from core.event_watchlist import chart_volume_gate, classify_action, macro_overlay
 from core.indicators import calculate_indicators, calculate_intraday_snapshot
+from core.realtime_feed import ensure_realtime_feed, get_stream_snapshots
 from core.sec_pit import SecPointInTimeStore
-from event_runtime.collect import collect_profile_calendar_events, collect_profile_events, fresh_symbol_events
+from core.tracing import bind, span
+from event_runtime.collect import (
+    collect_profile_calendar_events,
+    collect_profile_events,
+    fresh_symbol_events,
+    shared_data_collector,
+)
+from event_runtime.context import RuntimeContext
+from pipelines.model_decisions import ModelDecisionIndex, ModelDecisionMemo, decision_fingerprint
 
 
 ROOT = Path(__file__).resolve().parents[2]
-_DATA_COLLECTOR = DataCollector(root=ROOT)
+_DATA_COLLECTOR = shared_data_collector()
 OUTPUT_DIR = ROOT / "data" / "autostock_v2"
+_MODEL_DECISION_INDEX = ModelDecisionIndex(
+    OUTPUT_DIR / "model_decision_index.json",
+    legacy_globs=[(ROOT / "data" / "event_runtime", "*/latest_payload.json"), (OUTPUT_DIR, "autostock_v2_*.json")],
+)
 MARKET_INDICATOR = (os.getenv("AI_MARKET_INDICATOR", "QQQ").strip().upper() or "QQQ")
 DEFAULT_WATCHLIST = [
     "TSLA",
@@ -44,40 +58,32 @@ def _s(value: Any) -> str:
     return str(value or "").strip()
 
 
+def _env_int(key: str, default: int, minimum: int = 1, maximum: int | None = None) -> int:
+    try:
+        value = int(os.getenv(key, str(default)))
+    except Exception:
+        value = int(default)
+    value = max(minimum, value)
+    if maximum is not None:
+        value = min(maximum, value)
+    return value
+
+
+# Shared by every run in the process so concurrent profiles cannot multiply Codex load.
+_MODEL_SLOTS = BoundedSemaphore(_env_int("AI_V2_MODEL_CONCURRENCY", 3, maximum=8))
+
+
 def _load_cached_model_event(symbol: str) -> dict[str, Any] | None:
-    symbol_upper = _s(symbol).upper()
-    candidates: list[Path] = []
-    candidates.extend((ROOT / "data" / "event_runtime").glob("*/latest_payload.json"))
-    candidates.extend(OUTPUT_DIR.glob("autostock_v2_*.json"))
-    candidates = [path for path in candidates if path.is_file()]
-    candidates.sort(key=lambda path: path.stat().st_mtime, reverse=True)
-    for path in candidates:
-        try:
-            payload = json.loads(path.read_text(encoding="utf-8"))
-        except Exception:
-            continue
-        recommendations = payload.get("recommendations") if isinstance(payload, dict) else None
-        if not isinstance(recommendations, list):
-            continue
-        for row in recommendations:
-            if not isinstance(row, dict):
-                continue
-            if _s(row.get("symbol")).upper() != symbol_upper:
-                continue
-            signal = _s(row.get("event_signal")).lower()
-            strength = _s(row.get("event_strength")).lower()
-            if signal not in {"bullish", "bearish", "neutral"}:
-                continue
-            if strength not in {"strong", "moderate", "weak", "none"}:
-                continue
-            return {
-                "signal": signal,
-                "strength": strength,
-                "rationale": [str(item) for item in (row.get("reason_lines") or [])[:5]],
-                "mode": "cached-model",
-                "cached_from": str(path),
-            }
-    return None
+    row = _MODEL_DECISION_INDEX.get(symbol)
+    if not row:
+        return None
+    return {
+        "signal": row["signal"],
+        "strength": row["strength"],
+        "rationale": [str(item) for item in (row.get("rationale") or [])[:5]],
+        "mode": "cached-model",
+        "cached_from": _s(row.get("source")),
+    }
 
 
 def _parse_symbols(raw: str) -> list[str]:
@@ -168,134 +174,218 @@ def _build_markdown(payload: dict[str, Any]) -> str:
     return "\n".join(lines)
 
 
+def _evaluate_symbol(
+    symbol: str,
+    *,
+    event_feed: list[dict[str, Any]],
+    extra_calendar_events: list[dict[str, Any]],
+    generated_at: datetime,
+    stream_snapshots: dict[str, dict[str, Any]],
+    sec_store: SecPointInTimeStore,
+    earnings_store: EarningsEventStore,
+    macro: dict[str, Any],
+    model_slots: BoundedSemaphore,
+    model_decisions: ModelDecisionMemo | None = None,
+) -> tuple[dict[str, Any], list[dict[str, Any]]]:
+    """Recommendation row plus the symbol's next known events."""
+    asof_date = generated_at.date()
+    asof_ts = pd.Timestamp(generated_at)
+    df = _DATA_COLLECTOR.get_stock_data(symbol)
+    indicators = calculate_indicators(df) if df is not None else None
+    intraday_df = _DATA_COLLECTOR.get_intraday_stock_data(symbol, period="5d", interval="5m")
+    intraday = calculate_intraday_snapshot(intraday_df, interval_label="5m") if intraday_df is not None else None
+    info = _DATA_COLLECTOR.get_stock_info(symbol)
+    raw_symbol_events = fresh_symbol_events(event_feed, symbol)
+    next_known_events = list(_DATA_COLLECTOR.build_next_known_events(symbol, info, generated_at))
+    next_known_events.extend([row for row in extra_calendar_events if _s(row.get("symbol")).upper() == symbol])
+    if indicators is None:
+        return (
+            {
+                "symbol": symbol,
+                "action": "AVOID",
+                "confidence": 0.2,
+                "event_signal": "none",
+                "event_strength": "none",
+                "price": _f(info.get("price"), 0.0),
+                "chart_gate": {"state": "missing_data", "volume_ratio": None},
+                "rationale": "missing_chart_data",
+                "reason_lines": ["insufficient price history"],
+                "events": [],
+                "raw_events": raw_symbol_events,
+            },
+            next_known_events,
+        )
+
+    indicator_payload = dict(indicators)
+    if isinstance(intraday, dict):
+        indicator_payload.update(intraday)
+    stream_snapshot = stream_snapshots.get(symbol)
+    if stream_snapshot and _f(stream_snapshot.get("sessionVolume")) > 0 and _f(indicator_payload.get("volume_avg")) > 0:
+        indicator_payload["volume"] = int(_f(stream_snapshot.get("sessionVolume")))
+        indicator_payload["volume_ratio"] = round(_f(stream_snapshot.get("sessionVolume")) / _f(indicator_payload.get("volume_avg")), 2)
+    chart_gate = chart_volume_gate(indicator_payload)
+    earnings_ctx = earnings_store.latest_event_asof(symbol, asof_ts)
+    sec_ctx = sec_store.features_asof(symbol, asof_date)
+    reason_lines: list[str] = []
+    if bool(earnings_ctx.get("earnings_has_data")):
+        reason_lines.append(f"earnings data available ({earnings_ctx.get('earnings_event_date', '-')})")
+    if bool(sec_ctx.get("pit_has_data")) and sec_ctx.get("pit_filing_age_days") is not None:
+        reason_lines.append(f"latest SEC filing age {sec_ctx.get('pit_filing_age_days')}d")
+
+    fingerprint = decision_fingerprint(
+        events=raw_symbol_events,
+        chart_gate=chart_gate,
+        intraday=intraday,
+        next_known_events=next_known_events[:5],
+    )
+    model_event = model_decisions.get(symbol, fingerprint) if model_decisions is not None else None
+    if model_event is not None:
+        model_event["mode"] = f"{_s(model_event.get('mode')) or 'model'}+reused"
+    else:
+        with model_slots:
+            model_event = ai.analyze_event_bundle(
+                symbol=symbol,
+                events=raw_symbol_events,
+                chart_gate=chart_gate,
+                intraday=intraday or {},
+                next_known_events=next_known_events[:5],
+            )
+        if model_decisions is not None:
+            model_decisions.put(symbol, fingerprint, model_event)
+    if "error" in model_event:
+        cached_model_event = _load_cached_model_event(symbol)
+        if not cached_model_event:
+            raise RuntimeError(f"Event analysis failed for {symbol}: {model_event.get('error')}")
+        model_event = cached_model_event
+        cached_from = _s(cached_model_event.get("cached_from"))
+        reason_lines = [str(item) for item in (cached_model_event.get("rationale") or [])[:5]]
+        if cached_from:
+            reason_lines = [
+                f"실시간 모델 해석을 사용할 수 없어 이전 모델 판단을 재사용했습니다. source={Path(cached_from).name}",
+                *reason_lines,
+            ][:5]
+    event_signal = _s(model_event.get("signal")) or "neutral"
+    event_strength = _s(model_event.get("strength")) or "none"
+    if event_signal not in {"bullish", "bearish", "neutral"}:
+        raise RuntimeError(f"Invalid event signal for {symbol}: {event_signal}")
+    if event_strength not in {"strong", "moderate", "weak", "none"}:
+        raise RuntimeError(f"Invalid event strength for {symbol}: {event_strength}")
+    model_rationale = model_event.get("rationale")
+    if isinstance(model_rationale, list) and model_rationale:
+        reason_lines = [str(item) for item in model_rationale[:5]]
+
+    action = classify_action(
+        event_signal,
+        event_strength,
+        chart_gate,
+        macro,
+    )
+    return (
+        {
+            "symbol": symbol,
+            "name": _s(info.get("name")) or symbol,
+            "price": round(_f(indicators.get("price"), _f(info.get("price"), 0.0)), 2),
+            "action": action["action"],
+            "confidence": action["confidence"],
+            "rationale": action["rationale"],
+            "event_signal": event_signal,
+            "event_strength": event_strength,
+            "chart_gate": chart_gate,
+            "intraday": intraday or {},
+            "macro_mode": macro.get("mode"),
+            "days_to_earnings": info.get("days_to_earnings"),
+            "sector": info.get("sector"),
+            "events": raw_symbol_events[:5],
+            "event_analysis_mode": _s(model_event.get("mode")) if isinstance(model_event, dict) else "",
+            "raw_events": raw_symbol_events,
+            "earnings_context": earnings_ctx,
+            "sec_context": sec_ctx,
+            "reason_lines": reason_lines[:5],
+        },
+        next_known_events,
+    )
+
+
+def load_market_inputs() -> dict[str, Any]:
+    """Market condition and fear/greed; computed once per cycle and shared by every profile."""
+    return {
+        "market_ctx": _DATA_COLLECTOR.get_market_condition(),
+        "fear_greed": _DATA_COLLECTOR.get_fear_greed_index(),
+    }
+
+
+def _traced_evaluate_symbol(symbol: str, **kwargs: Any) -> tuple[dict[str, Any], list[dict[str, Any]]]:
+    with span("pipeline.evaluate_symbol", symbol=symbol) as current:
+        recommendation, symbol_events = _evaluate_symbol(symbol, **kwargs)
+        current.set(action=_s(recommendation.get("action")), confidence=recommendation.get("confidence"))
+        return recommendation, symbol_events
+
+
 def run_autostock_v2(
     *,
     profile: dict[str, Any] | None = None,
     watchlist_override: list[str] | None = None,
     event_feed_path: str | None = None,
     rss_urls: list[str] | None = None,
+    context: RuntimeContext | None = None,
+    market_inputs: dict[str, Any] | None = None,
 ) -> dict[str, Any]:
     OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
     generated_at = datetime.now(timezone.utc)
     watchlist = watchlist_override or _watchlist()
     rss_urls = rss_urls if rss_urls is not None else _rss_urls()
     configured_event_file = event_feed_path or _event_feed_path()
-    event_feed = collect_profile_events(
-        profile=profile,
-        watchlist=watchlist,
-        event_feed_path=configured_event_file,
-        rss_urls=rss_urls,
-    )
-    extra_calendar_events = collect_profile_calendar_events(profile=profile, watchlist=watchlist)
-    market_ctx = _DATA_COLLECTOR.get_market_condition()
-    fear_greed = _DATA_COLLECTOR.get_fear_greed_index()
+    with span("pipeline.collect_events", symbols=len(watchlist)) as current:
+        event_feed = collect_profile_events(
+            profile=profile,
+            watchlist=watchlist,
+            event_feed_path=configured_event_file,
+            rss_urls=rss_urls,
+        )
+        extra_calendar_events = collect_profile_calendar_events(profile=profile, watchlist=watchlist)
+        current.set(events=len(event_feed), calendar_events=len(extra_calendar_events))
+    market_inputs = market_inputs or load_market_inputs()
+    market_ctx = market_inputs.get("market_ctx") or {}
+    fear_greed = market_inputs.get("fear_greed") or {}
     market_events = [event for event in event_feed if _s(event.get("scope")).lower() == "market"]
     macro = macro_overlay(market_ctx, fear_greed, market_events)
 
-    sec_store = SecPointInTimeStore(watchlist)
-    earnings_store = EarningsEventStore(watchlist)
-    asof_date = generated_at.date()
-    asof_ts = pd.Timestamp(generated_at)
-
+    if context is not None:
+        sec_store, earnings_store = context.pit_stores(watchlist, event_feed)
+    else:
+        sec_store = SecPointInTimeStore(watchlist)
+        earnings_store = EarningsEventStore(watchlist)
+
+    ensure_realtime_feed(watchlist)
+    stream_snapshots = get_stream_snapshots(watchlist)
+
+    workers = min(len(watchlist), _env_int("AI_V2_SYMBOL_WORKERS", 8, maximum=16)) or 1
+    with span("pipeline.evaluate_symbols", symbols=len(watchlist), workers=workers), ThreadPoolExecutor(
+        max_workers=workers, thread_name_prefix="autostock-v2"
+    ) as executor:
+        futures = [
+            executor.submit(
+                bind(_traced_evaluate_symbol),
+                symbol,
+                event_feed=event_feed,
+                extra_calendar_events=extra_calendar_events,
+                generated_at=generated_at,
+                stream_snapshots=stream_snapshots,
+                sec_store=sec_store,
+                earnings_store=earnings_store,
+                macro=macro,
+                model_slots=_MODEL_SLOTS,
+                model_decisions=context.model_decisions if context is not None else None,
+            )
+            for symbol in watchlist
+        ]
+    # Results (and the first failure) are taken in watchlist order, as in the serial loop.
     recommendations: list[dict[str, Any]] = []
     next_known_events: list[dict[str, Any]] = []
-    for symbol in watchlist:
-        df = _DATA_COLLECTOR.get_stock_data(symbol)
-        indicators = calculate_indicators(df) if df is not None else None
-        intraday_df = _DATA_COLLECTOR.get_intraday_stock_data(symbol, period="5d", interval="5m")
-        intraday = calculate_intraday_snapshot(intraday_df, interval_label="5m") if intraday_df is not None else None
-        info = _DATA_COLLECTOR.get_stock_info(symbol)
-        raw_symbol_events = fresh_symbol_events(event_feed, symbol)
-        next_known_events.extend(_DATA_COLLECTOR.build_next_known_events(symbol, info, generated_at))
-        next_known_events.extend([row for row in extra_calendar_events if _s(row.get("symbol")).upper() == symbol])
-        if indicators is None:
-            recommendations.append(
-                {
-                    "symbol": symbol,
-                    "action": "AVOID",
-                    "confidence": 0.2,
-                    "event_signal": "none",
-                    "event_strength": "none",
-                    "price": _f(info.get("price"), 0.0),
-                    "chart_gate": {"state": "missing_data", "volume_ratio": None},
-                    "rationale": "missing_chart_data",
-                    "reason_lines": ["insufficient price history"],
-                    "events": [],
-                    "raw_events": raw_symbol_events,
-                }
-            )
-            continue
-
-        indicator_payload = dict(indicators)
-        if isinstance(intraday, dict):
-            indicator_payload.update(intraday)
-        chart_gate = chart_volume_gate(indicator_payload)
-        earnings_ctx = earnings_store.latest_event_asof(symbol, asof_ts)
-        sec_ctx = sec_store.features_asof(symbol, asof_date)
-        reason_lines: list[str] = []
-        if bool(earnings_ctx.get("earnings_has_data")):
-            reason_lines.append(f"earnings data available ({earnings_ctx.get('earnings_event_date', '-')})")
-        if bool(sec_ctx.get("pit_has_data")) and sec_ctx.get("pit_filing_age_days") is not None:
-            reason_lines.append(f"latest SEC filing age {sec_ctx.get('pit_filing_age_days')}d")
-
-        model_event = ai.analyze_event_bundle(
-            symbol=symbol,
-            events=raw_symbol_events,
-            chart_gate=chart_gate,
-            intraday=intraday or {},
-            next_known_events=[row for row in next_known_events if _s(row.get("symbol")).upper() == symbol][:5],
-        )
-        if "error" in model_event:
-            cached_model_event = _load_cached_model_event(symbol)
-            if not cached_model_event:
-                raise RuntimeError(f"Event analysis failed for {symbol}: {model_event.get('error')}")
-            model_event = cached_model_event
-            cached_from = _s(cached_model_event.get("cached_from"))
-            reason_lines = [str(item) for item in (cached_model_event.get("rationale") or [])[:5]]
-            if cached_from:
-                reason_lines = [
-                    f"실시간 모델 해석을 사용할 수 없어 이전 모델 판단을 재사용했습니다. source={Path(cached_from).name}",
-                    *reason_lines,
-                ][:5]
-        event_signal = _s(model_event.get("signal")) or "neutral"
-        event_strength = _s(model_event.get("strength")) or "none"
-        if event_signal not in {"bullish", "bearish", "neutral"}:
-            raise RuntimeError(f"Invalid event signal for {symbol}: {event_signal}")
-        if event_strength not in {"strong", "moderate", "weak", "none"}:
-            raise RuntimeError(f"Invalid event strength for {symbol}: {event_strength}")
-        model_rationale = model_event.get("rationale")
-        if isinstance(model_rationale, list) and model_rationale:
-            reason_lines = [str(item) for item in model_rationale[:5]]
-
-        action = classify_action(
-            event_signal,
-            event_strength,
-            chart_gate,
-            macro,
-        )
-        recommendations.append(
-            {
-                "symbol": symbol,
-                "name": _s(info.get("name")) or symbol,
-                "price": round(_f(indicators.get("price"), _f(info.get("price"), 0.0)), 2),
-                "action": action["action"],
-                "confidence": action["confidence"],
-                "rationale": action["rationale"],
-                "event_signal": event_signal,
-                "event_strength": event_strength,
-                "chart_gate": chart_gate,
-                "intraday": intraday or {},
-                "macro_mode": macro.get("mode"),
-                "days_to_earnings": info.get("days_to_earnings"),
-                "sector": info.get("sector"),
-                "events": raw_symbol_events[:5],
-                "event_analysis_mode": _s(model_event.get("mode")) if isinstance(model_event, dict) else "",
-                "raw_events": raw_symbol_events,
-                "earnings_context": earnings_ctx,
-                "sec_context": sec_ctx,
-                "reason_lines": reason_lines[:5],
-            }
-        )
+    for future in futures:
+        recommendation, symbol_events = future.result()
+        recommendations.append(recommendation)
+        next_known_events.extend(symbol_events)
 
     recommendations.sort(
         key=lambda row: (
@@ -326,6 +416,7 @@ def run_autostock_v2(
     md_path = OUTPUT_DIR / f"autostock_v2_{date_tag}.md"
     json_path.write_text(json.dumps(payload, ensure_ascii=False, indent=2), encoding="utf-8")
     md_path.write_text(_build_markdown(payload), encoding="utf-8")
+    _MODEL_DECISION_INDEX.record_payload(payload, str(json_path))
     return {
         "report_path": str(json_path),
         "md_path": str(md_path),
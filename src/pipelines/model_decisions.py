@@ -0,0 +1,244 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import time
+from pathlib import Path
+from threading import Lock
+from typing import Any
+
+
+INDEX_SCHEMA_VERSION = "model-decision-index-v1"
+_SIGNALS = {"bullish", "bearish", "neutral"}
+_STRENGTHS = {"strong", "moderate", "weak", "none"}
+_CHART_GATE_KEYS = ("state", "bullish_structure", "bearish_structure", "trend_strength", "bullish_volume", "bearish_volume", "overheat")
+
+
+def _s(value: Any) -> str:
+    return str(value or "").strip()
+
+
+def _f(value: Any, default: float = 0.0) -> float:
+    try:
+        return float(value)
+    except Exception:
+        return default
+
+
+def _env_bool(key: str, default: bool = False) -> bool:
+    raw = str(os.getenv(key, "1" if default else "0")).strip().lower()
+    return raw in {"1", "true", "yes", "on", "y"}
+
+
+def _env_int(key: str, default: int, minimum: int = 1, maximum: int | None = None) -> int:
+    try:
+        value = int(os.getenv(key, str(default)))
+    except Exception:
+        value = int(default)
+    value = max(minimum, value)
+    if maximum is not None:
+        value = min(maximum, value)
+    return value
+
+
+def _volume_bucket(ratio: float) -> str:
+    if ratio <= 0:
+        return "none"
+    if ratio < 1.0:
+        return "low"
+    if ratio < 1.5:
+        return "normal"
+    if ratio < 2.5:
+        return "high"
+    return "surge"
+
+
+def decision_fingerprint(
+    *,
+    events: list[dict[str, Any]],
+    chart_gate: dict[str, Any],
+    intraday: dict[str, Any] | None,
+    next_known_events: list[dict[str, Any]],
+) -> str:
+    """Stable hash of the model inputs, with intraday numbers reduced to coarse buckets.
+
+    Bar-to-bar noise (last close, exact volume ratio) must not change the fingerprint; a new
+    event, a chart gate transition, a VWAP cross or a move into another return/volume bucket does.
+    """
+    intraday = intraday or {}
+    material = {
+        "events": sorted(
+            "|".join(_s(event.get(key)) for key in ("source", "published_at", "headline", "sentiment", "category"))
+            for event in events[:8]
+            if isinstance(event, dict)
+        ),
+        "chart_gate": {key: chart_gate.get(key) for key in _CHART_GATE_KEYS},
+        "intraday": {
+            "above_vwap": bool(intraday.get("intraday_above_vwap", False)) if intraday else None,
+            "return_bucket": int(_f(intraday.get("intraday_return_from_open_pct")) // 1.0) if intraday else None,
+            "volume_bucket": _volume_bucket(_f(intraday.get("intraday_volume_ratio_5m"))),
+        },
+        "next_known": sorted(
+            f"{_s(row.get('type'))}|{_s(row.get('expected_date'))}"
+            for row in next_known_events[:5]
+            if isinstance(row, dict)
+        ),
+    }
+    raw = json.dumps(material, ensure_ascii=False, sort_keys=True, default=str)
+    return hashlib.blake2b(raw.encode("utf-8"), digest_size=16).hexdigest()
+
+
+class ModelDecisionMemo:
+    """Successful event-model decisions keyed by ``(symbol, fingerprint)``.
+
+    A decision is reused while it is younger than ``AI_V2_MODEL_REUSE_MAX_MINUTES``, so an
+    unchanged symbol still gets a fresh model read periodically. Profiles that share a symbol
+    and see the same inputs share one decision.
+    """
+
+    def __init__(self, max_age_minutes: int | None = None, enabled: bool | None = None) -> None:
+        self.enabled = _env_bool("AI_V2_MODEL_REUSE_ENABLED", True) if enabled is None else enabled
+        self.max_age_seconds = 60 * (max_age_minutes or _env_int("AI_V2_MODEL_REUSE_MAX_MINUTES", 60))
+        self._lock = Lock()
+        self._rows: dict[tuple[str, str], tuple[float, dict[str, Any]]] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, symbol: str, fingerprint: str) -> dict[str, Any] | None:
+        if not self.enabled:
+            return None
+        with self._lock:
+            row = self._rows.get((_s(symbol).upper(), fingerprint))
+            if row is None or time.monotonic() - row[0] > self.max_age_seconds:
+                self.misses += 1
+                return None
+            self.hits += 1
+            return dict(row[1])
+
+    def put(self, symbol: str, fingerprint: str, decision: dict[str, Any]) -> None:
+        if not self.enabled or "error" in decision:
+            return
+        now = time.monotonic()
+        with self._lock:
+            expired = [key for key, (stored_at, _) in self._rows.items() if now - stored_at > self.max_age_seconds]
+            for key in expired:
+                del self._rows[key]
+            self._rows[(_s(symbol).upper(), fingerprint)] = (now, dict(decision))
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return {"hits": self.hits, "misses": self.misses, "entries": len(self._rows)}
+
+
+def _decision_from_row(row: dict[str, Any], source: str, recorded_at: str) -> dict[str, Any] | None:
+    signal = _s(row.get("event_signal")).lower()
+    strength = _s(row.get("event_strength")).lower()
+    if signal not in _SIGNALS or strength not in _STRENGTHS:
+        return None
+    return {
+        "signal": signal,
+        "strength": strength,
+        "rationale": [str(item) for item in (row.get("reason_lines") or [])[:5]],
+        "source": source,
+        "recordedAt": recorded_at,
+    }
+
+
+class ModelDecisionIndex:
+    """Latest valid event-model decision per symbol, kept in one small JSON file.
+
+    Updated whenever a v2 payload is written, so the Codex-failure fallback is a keyed read
+    instead of globbing and parsing every saved payload. Rows that were themselves served from
+    this fallback are not recorded, so the index always points at a real model decision.
+    """
+
+    def __init__(self, path: Path, legacy_globs: list[tuple[Path, str]] | None = None) -> None:
+        self.path = path
+        self.legacy_globs = legacy_globs or []
+        self._lock = Lock()
+        self._rows: dict[str, dict[str, Any]] | None = None
+        self._mtime_ns = 0
+
+    def _read(self) -> dict[str, dict[str, Any]] | None:
+        try:
+            payload = json.loads(self.path.read_text(encoding="utf-8"))
+            mtime_ns = self.path.stat().st_mtime_ns
+        except Exception:
+            return None
+        if not isinstance(payload, dict) or payload.get("schemaVersion") != INDEX_SCHEMA_VERSION:
+            return None
+        rows = payload.get("symbols")
+        self._mtime_ns = mtime_ns
+        return {str(key): value for key, value in rows.items() if isinstance(value, dict)} if isinstance(rows, dict) else {}
+
+    def _write(self, rows: dict[str, dict[str, Any]]) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_suffix(".tmp")
+        tmp_path.write_text(
+            json.dumps({"schemaVersion": INDEX_SCHEMA_VERSION, "symbols": rows}, ensure_ascii=False, separators=(",", ":")),
+            encoding="utf-8",
+        )
+        tmp_path.replace(self.path)
+        self._mtime_ns = self.path.stat().st_mtime_ns
+
+    def _rebuild_from_payloads(self) -> dict[str, dict[str, Any]]:
+        """One-time scan of saved payloads (oldest first) when no index exists yet."""
+        candidates: list[Path] = []
+        for base, pattern in self.legacy_globs:
+            candidates.extend(path for path in base.glob(pattern) if path.is_file())
+        candidates.sort(key=lambda path: path.stat().st_mtime)
+        rows: dict[str, dict[str, Any]] = {}
+        for path in candidates:
+            try:
+                payload = json.loads(path.read_text(encoding="utf-8"))
+            except Exception:
+                continue
+            self._merge(rows, payload, str(path))
+        return rows
+
+    @staticmethod
+    def _merge(rows: dict[str, dict[str, Any]], payload: Any, source: str) -> int:
+        recommendations = payload.get("recommendations") if isinstance(payload, dict) else None
+        recorded_at = _s(payload.get("generated_at")) if isinstance(payload, dict) else ""
+        changed = 0
+        for row in recommendations if isinstance(recommendations, list) else []:
+            if not isinstance(row, dict) or _s(row.get("event_analysis_mode")) == "cached-model":
+                continue
+            symbol = _s(row.get("symbol")).upper()
+            decision = _decision_from_row(row, source, recorded_at)
+            if symbol and decision is not None:
+                rows[symbol] = decision
+                changed += 1
+        return changed
+
+    def _load(self) -> dict[str, dict[str, Any]]:
+        if self._rows is not None:
+            try:
+                if self.path.stat().st_mtime_ns == self._mtime_ns:
+                    return self._rows
+            except FileNotFoundError:
+                pass
+        rows = self._read()
+        if rows is None:
+            rows = self._rebuild_from_payloads()
+            self._write(rows)
+        self._rows = rows
+        return rows
+
+    def get(self, symbol: str) -> dict[str, Any] | None:
+        with self._lock:
+            row = self._load().get(_s(symbol).upper())
+            return dict(row) if row else None
+
+    def record_payload(self, payload: dict[str, Any], source: str) -> int:
+        with self._lock:
+            rows = dict(self._load())
+            changed = self._merge(rows, payload, source)
+            if changed:
+                self._write(rows)
+                self._rows = rows
+            return changed
+
+
+__all__ = ["ModelDecisionIndex", "ModelDecisionMemo", "decision_fingerprint"]
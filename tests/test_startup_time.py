@@ -0,0 +1,30 @@
+from __future__ import annotations
+
+import importlib.util
+from pathlib import Path
+
+SCRIPT = Path(__file__).resolve().parents[1] / "scripts" / "check_startup_time.py"
+
+
+def _load_check():
+    spec = importlib.util.spec_from_file_location("check_startup_time", SCRIPT)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def test_parse_importtime_depth_and_cumulative():
+    stderr = "\n".join(
+        [
+            "import time: self [us] | cumulative | imported package",
+            "import time:       120 |        120 |   json.decoder",
+            "import time:       300 |        420 | json",
+        ]
+    )
+    rows = _load_check().parse_importtime(stderr)
+    assert rows == [("json.decoder", 1, 120), ("json", 0, 420)]
+
+
+def test_main_help_startup_stays_light():
+    best, failures = _load_check().check_startup()
+    assert not failures, f"{failures}; slowest: {best['slowest']}"